@@ -126,6 +126,7 @@ def register():
     # no longer available in this scope.
     addon_updater_ops.register({"version": (1, 9, 0)})
 
+    hatchery.load.register()
     utils.register()
     pack_info_search_paths.register()
     available_asset_packs.register()
@@ -165,6 +166,7 @@ def unregister():
     available_asset_packs.unregister()
     pack_info_search_paths.unregister()
     utils.unregister()
+    hatchery.load.unregister()
 
     # Remove all nested modules from module cache, more reliable than importlib.reload(..)
     # Idea by BD3D / Jacques Lucke
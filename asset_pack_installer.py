@@ -22,13 +22,18 @@ import sys
 import addon_utils
 import bpy
 import typing
+import contextlib
 import os
+import errno
 import pathlib
 import shutil
+import struct
 import enum
 import logging
+import threading
 import zipfile
 import glob
+import tempfile
 from . import polib
 from . import asset_registry
 from . import __package__ as base_package
@@ -41,6 +46,8 @@ logger = logging.getLogger(f"polygoniq.{__name__}")
 
 # ~/polygoniq_asset_packs
 DEFAULT_PACK_INSTALL_PATH = os.path.expanduser(os.path.join("~", "polygoniq_asset_packs"))
+# Updates are installed into a hidden temporary directory with this prefix inside the install path
+UPDATE_STAGING_PREFIX = ".engon_update_"
 
 
 class InstallerOperation(enum.StrEnum):
@@ -51,6 +58,7 @@ class InstallerOperation(enum.StrEnum):
 
 class InstallerStatus(enum.StrEnum):
     READY = "Ready"
+    EXTRACTING = "Extracting"
     NOT_FOUND = "Not Found"
     ABORTED = "Aborted"
     FINISHED = "Finished"
@@ -60,6 +68,7 @@ class InstallerStatus(enum.StrEnum):
 
 INSTALLER_OPERATION_DESCRIPTIONS: dict[InstallerStatus, str] = {
     InstallerStatus.READY: "Ready to start _ACTION_.",
+    InstallerStatus.EXTRACTING: "_ACTION_ is in progress, extracting the Asset Pack.",
     InstallerStatus.NOT_FOUND: "No Asset Pack was found.",
     InstallerStatus.ABORTED: "_ACTION_ was unsuccessful.",
     InstallerStatus.FINISHED: "_ACTION_ was successful.",
@@ -68,7 +77,313 @@ INSTALLER_OPERATION_DESCRIPTIONS: dict[InstallerStatus, str] = {
 }
 
 
+class ExtractionProgress(typing.NamedTuple):
+    bytes_done: int
+    bytes_total: int
+    files_done: int
+    files_total: int
+
+
+class ExtractionCancelledError(Exception):
+    pass
+
+
+class PaqExtractor:
+    """Extracts a .paq archive from 'sources' into 'destination' in background threads
+
+    Members of single-part archives are extracted by 'worker_count' threads in parallel, each
+    of them reading the archive through its own file handle. Multi-part archives are read
+    sequentially through one 'SplitFileReader'. Large stored (uncompressed) members of
+    single-part archives are copied between the file descriptors by the OS, without passing
+    the data through Python.
+
+    The extraction can be cancelled, output of cancelled or failed extraction is removed.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    # Stored members at least this large are copied by the OS, see '_copy_file_range'
+    ZERO_COPY_MIN_SIZE = 1024 * 1024
+    ZERO_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+    # Local file header of a zip member, see the zip file format specification
+    LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+    LOCAL_FILE_HEADER_MAGIC = b"PK\003\004"
+    WINDOWS_ILLEGAL_NAME_TRANS_TABLE = str.maketrans(':<>|"?*', "_______")
+
+    def __init__(self, sources: list[str], destination: str, worker_count: int | None = None):
+        self.sources = sources
+        self.destination = destination
+        self.worker_count = (
+            worker_count if worker_count is not None else min(4, os.cpu_count() or 1)
+        )
+        self.error: str | None = None
+        self._cancel_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Guards the progress and the members shared by the workers
+        self._lock = threading.Lock()
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._files_done = 0
+        self._files_total = 0
+        self._pending_members: list[zipfile.ZipInfo] = []
+        self._worker_error: BaseException | None = None
+        # Paths created by the extraction that are removed if it doesn't finish
+        self._created_paths: set[str] = set()
+
+    @property
+    def progress(self) -> ExtractionProgress:
+        with self._lock:
+            return ExtractionProgress(
+                self._bytes_done, self._bytes_total, self._files_done, self._files_total
+            )
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set() and self.error is None
+
+    def start(self) -> None:
+        assert self._thread is None, "Extraction can be started only once"
+        self._thread = threading.Thread(target=self._run, name="engon_paq_extraction", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        logger.info(f"Extracting {self.sources} to '{self.destination}'")
+        try:
+            self._extract()
+            logger.info(f"Extracted {self.sources} to '{self.destination}'")
+            return
+        except ExtractionCancelledError:
+            logger.info(f"Extraction of {self.sources} was cancelled")
+        except zipfile.BadZipFile:
+            logger.exception(f"Failed to extract {self.sources}")
+            self.error = ".paq file is corrupted."
+        except Exception as e:
+            logger.exception(f"Failed to extract {self.sources}")
+            self.error = str(e)
+
+        self._remove_created_paths()
+
+    @contextlib.contextmanager
+    def _open_archive(self) -> typing.Iterator[zipfile.ZipFile]:
+        if len(self.sources) == 1:
+            with zipfile.ZipFile(self.sources[0], "r") as archive:
+                yield archive
+            return
+        # Only use the reader for multi-part paq files
+        # Using it on single-part files adds a lot of unnecessary overhead
+        with polib.split_file_reader.SplitFileReader(self.sources, use_mmap=True) as reader:
+            with zipfile.ZipFile(reader, "r") as archive:
+                yield archive
+
+    def _extract(self) -> None:
+        with self._open_archive() as archive:
+            members = archive.infolist()
+
+        files = []
+        for member in members:
+            target_path = self._get_target_path(member)
+            if target_path is None:
+                continue
+            self._record_created_path(target_path)
+            if member.is_dir():
+                os.makedirs(target_path, exist_ok=True)
+            else:
+                files.append(member)
+
+        # Extracting the largest files first balances the work between the workers
+        files.sort(key=lambda member: member.file_size, reverse=True)
+        with self._lock:
+            self._pending_members = list(reversed(files))
+            self._bytes_total = sum(member.file_size for member in files)
+            self._files_total = len(files)
+
+        if len(self.sources) == 1 and self.worker_count > 1 and len(files) > 1:
+            workers = [
+                threading.Thread(
+                    target=self._worker_loop, name=f"engon_paq_extraction_worker_{i}", daemon=True
+                )
+                for i in range(min(self.worker_count, len(files)))
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if self._worker_error is not None:
+                raise self._worker_error
+        else:
+            self._worker_loop()
+            if self._worker_error is not None:
+                raise self._worker_error
+
+        self._check_cancelled()
+
+    def _worker_loop(self) -> None:
+        try:
+            with self._open_archive() as archive:
+                source_file = open(self.sources[0], "rb") if len(self.sources) == 1 else None
+                try:
+                    while True:
+                        with self._lock:
+                            if len(self._pending_members) == 0:
+                                return
+                            member = self._pending_members.pop()
+                        self._extract_member(archive, member, source_file)
+                finally:
+                    if source_file is not None:
+                        source_file.close()
+        except BaseException as e:
+            with self._lock:
+                if self._worker_error is None:
+                    self._worker_error = e
+            # Stop the other workers, the error is reported instead of cancellation
+            self._cancel_event.set()
+
+    def _extract_member(
+        self,
+        archive: zipfile.ZipFile,
+        member: zipfile.ZipInfo,
+        source_file: typing.BinaryIO | None,
+    ) -> None:
+        self._check_cancelled()
+        target_path = self._get_target_path(member)
+        assert target_path is not None
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+        if (
+            source_file is not None
+            and member.compress_type == zipfile.ZIP_STORED
+            and member.file_size >= self.ZERO_COPY_MIN_SIZE
+            # Encrypted members have to be decrypted by zipfile
+            and not member.flag_bits & 0x1
+        ):
+            self._copy_stored_member(member, source_file, target_path)
+        else:
+            with archive.open(member) as source, open(target_path, "wb") as target:
+                while chunk := source.read(self.CHUNK_SIZE):
+                    self._check_cancelled()
+                    target.write(chunk)
+                    self._add_progress(len(chunk), 0)
+
+        self._add_progress(0, 1)
+
+    def _copy_stored_member(
+        self, member: zipfile.ZipInfo, source_file: typing.BinaryIO, target_path: str
+    ) -> None:
+        # Data of the member follow its local file header, which can differ in length of the
+        # extra field from the central directory.
+        source_file.seek(member.header_offset)
+        header = self.LOCAL_FILE_HEADER.unpack(source_file.read(self.LOCAL_FILE_HEADER.size))
+        if header[0] != self.LOCAL_FILE_HEADER_MAGIC:
+            raise zipfile.BadZipFile(f"Bad magic number for file header of '{member.filename}'")
+        offset = member.header_offset + self.LOCAL_FILE_HEADER.size + header[10] + header[11]
+
+        remaining = member.file_size
+        with open(target_path, "wb") as target:
+            while remaining > 0:
+                self._check_cancelled()
+                copied = self._copy_file_range(
+                    source_file.fileno(),
+                    target.fileno(),
+                    offset,
+                    min(remaining, self.ZERO_COPY_CHUNK_SIZE),
+                )
+                if copied == 0:
+                    raise zipfile.BadZipFile(f"Member '{member.filename}' is truncated")
+                offset += copied
+                remaining -= copied
+                self._add_progress(copied, 0)
+
+    def _copy_file_range(self, source_fd: int, target_fd: int, offset: int, count: int) -> int:
+        """Copies up to 'count' bytes from 'offset' of 'source_fd' to the position of 'target_fd'
+
+        Uses 'os.copy_file_range' or 'os.sendfile' if the platform supports them between regular
+        files, otherwise copies the data through a buffer. Returns number of copied bytes.
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                return os.copy_file_range(source_fd, target_fd, count, offset)
+            except OSError as e:
+                # Not supported by the kernel or between the file systems
+                if e.errno not in {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}:
+                    raise
+        if sys.platform.startswith("linux"):
+            try:
+                return os.sendfile(target_fd, source_fd, offset, count)
+            except OSError as e:
+                if e.errno not in {errno.ENOSYS, errno.EINVAL}:
+                    raise
+
+        os.lseek(source_fd, offset, os.SEEK_SET)
+        data = os.read(source_fd, min(count, self.CHUNK_SIZE))
+        view = memoryview(data)
+        while len(view) > 0:
+            view = view[os.write(target_fd, view) :]
+        return len(data)
+
+    def _get_target_path(self, member: zipfile.ZipInfo) -> str | None:
+        """Returns path where 'member' is extracted, sanitized the same way as in 'zipfile'
+
+        Returns None if nothing is extracted for the member.
+        """
+        arcname = member.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        # Interpret absolute paths as relative, remove drive letters and parent directories
+        arcname = os.path.splitdrive(arcname)[1]
+        invalid_parts = ("", os.path.curdir, os.path.pardir)
+        parts = [part for part in arcname.split(os.path.sep) if part not in invalid_parts]
+        if os.path.sep == "\\":
+            parts = [
+                part.translate(self.WINDOWS_ILLEGAL_NAME_TRANS_TABLE).rstrip(".") for part in parts
+            ]
+            parts = [part for part in parts if part != ""]
+        if len(parts) == 0:
+            return None
+        return os.path.join(self.destination, *parts)
+
+    def _record_created_path(self, target_path: str) -> None:
+        # Only the top-most path that doesn't exist yet is recorded, removing it removes all
+        # the extracted content under it.
+        relative_path = os.path.relpath(target_path, self.destination)
+        top_path = os.path.join(self.destination, relative_path.split(os.path.sep, 1)[0])
+        if top_path not in self._created_paths and not os.path.exists(top_path):
+            self._created_paths.add(top_path)
+
+    def _remove_created_paths(self) -> None:
+        for path in self._created_paths:
+            logger.info(f"Removing partially extracted '{path}'")
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                elif os.path.exists(path):
+                    os.remove(path)
+            except OSError:
+                logger.exception(f"Failed to remove partially extracted '{path}'")
+
+    def _add_progress(self, bytes_done: int, files_done: int) -> None:
+        with self._lock:
+            self._bytes_done += bytes_done
+            self._files_done += files_done
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise ExtractionCancelledError()
+
+
 class AssetPackInstaller:
+    # Interval in seconds in which the progress of extraction is checked
+    EXTRACTION_POLL_INTERVAL = 0.1
+
     def __init__(self):
         self._operation: InstallerOperation = InstallerOperation.INSTALL
         self._status: InstallerStatus = InstallerStatus.NOT_READY
@@ -122,6 +437,12 @@ class AssetPackInstaller:
         # Flag to determine whether the pack should be registered as a Blender Asset Library
         self._register_blender_asset_library: bool = True
 
+        # Extraction of .paq files running in background and callback called when it ends
+        self._extractor: PaqExtractor | None = None
+        self._on_extraction_finished: typing.Callable[[str | None], None] | None = None
+        # Bound method is stored so 'bpy.app.timers.is_registered' recognizes it
+        self._extraction_timer = self._check_extraction
+
     @property
     def status(self) -> InstallerStatus:
         return self._status
@@ -242,6 +563,16 @@ class AssetPackInstaller:
     def is_ready(self) -> bool:
         return self._status == InstallerStatus.READY
 
+    @property
+    def is_extracting(self) -> bool:
+        return self._extractor is not None
+
+    @property
+    def extraction_progress(self) -> ExtractionProgress | None:
+        if self._extractor is None:
+            return None
+        return self._extractor.progress
+
     @property
     def can_installer_proceed(self) -> bool:
         return self._status == InstallerStatus.READY or self._status == InstallerStatus.NOT_READY
@@ -352,6 +683,9 @@ class AssetPackInstaller:
         self._warning_messages.clear()
 
     def exit_installer_operation(self) -> None:
+        # Closing the dialog doesn't stop the extraction, its result is reported when it ends
+        if self.is_extracting:
+            return
         self._warning_messages.clear()
         self._error_messages.clear()
         self.status = InstallerStatus.EXIT
@@ -525,6 +859,13 @@ class AssetPackInstaller:
         file_path: str,
         update_file_path: str | None = None,
     ) -> None:
+        if self.is_extracting:
+            # The dialog shows progress of the running extraction instead
+            logger.warning(
+                f"Cannot load '{file_path}', another Asset Pack {self._operation} is in progress"
+            )
+            return
+
         self._clear_installer()
         self._operation = operation
 
@@ -632,41 +973,90 @@ class AssetPackInstaller:
     def check_asset_pack_already_installed(self) -> bool:
         return asset_registry.instance.get_pack_by_full_name(self.full_name) is not None
 
-    def execute_update(self) -> tuple[str, str] | None:
-        """Successful update returns a tuple of the old and new .pack-info path of the updated Asset Pack."""
+    def execute_update(self, on_finished: typing.Callable[[tuple[str, str] | None], None]) -> None:
+        """Executes the update and calls 'on_finished' with its result.
 
-        old_pack_info_path = self.execute_uninstallation()
-        new_pack_info_path = self.execute_installation()
+        Successful update results in a tuple of the old and new .pack-info path of the updated
+        Asset Pack, failed update in None. See 'execute_installation' for when 'on_finished'
+        is called.
 
-        if old_pack_info_path is not None and new_pack_info_path is not None:
-            return (old_pack_info_path, new_pack_info_path)
-        return None
+        The new version is installed into a temporary directory next to the old one, the old
+        version is replaced only once that succeeds. Failed or cancelled update keeps it intact.
+        """
 
-    def execute_installation(self) -> str | None:
-        """Successful installation returns the .pack-info path of the installed Asset Pack."""
+        if self._status != InstallerStatus.READY or not self._check_uninstallation_allowed():
+            self.abort_operation()
+            on_finished(None)
+            return
 
-        def install_from_paq_file(
-            path_or_reader: str | polib.split_file_reader.SplitFileReader,
-        ) -> None:
-            with zipfile.ZipFile(path_or_reader, "r") as archive:
-                logger.info(f"Extracting to '{self._install_path}'")
-                archive.extractall(path=self._install_path)
-                self.status = InstallerStatus.FINISHED
+        # The new root folder might have a different name, it must not overwrite another folder
+        destination = os.path.join(self._install_path, self.pack_root_directory)
+        if os.path.exists(destination) and not os.path.samefile(destination, self.uninstall_path):
+            self.record_error_message("Install Path already contains this Asset Pack.")
+            self.abort_operation()
+            on_finished(None)
+            return
+
+        old_pack_info_path = self.uninstall_pack_info_path
+        try:
+            staging_path = tempfile.mkdtemp(prefix=UPDATE_STAGING_PREFIX, dir=self._install_path)
+        except OSError as e:
+            self.record_error_message(str(e))
+            self.abort_operation()
+            on_finished(None)
+            return
+
+        def on_installation_finished(staged_pack_info_path: str | None) -> None:
+            try:
+                replaced = staged_pack_info_path is not None and self._replace_uninstall_path(
+                    os.path.dirname(staged_pack_info_path)
+                )
+            finally:
+                shutil.rmtree(staging_path, ignore_errors=True)
+
+            if replaced:
+                on_finished(
+                    (
+                        old_pack_info_path,
+                        os.path.join(
+                            self._install_path, self.pack_root_directory, self.pack_info_basename
+                        ),
+                    )
+                )
+            else:
+                on_finished(None)
+
+        self._install(staging_path, on_installation_finished)
+
+    def execute_installation(self, on_finished: typing.Callable[[str | None], None]) -> None:
+        """Executes the installation and calls 'on_finished' with its result.
+
+        Successful installation results in the .pack-info path of the installed Asset Pack,
+        failed installation in None. .paq files are extracted in background, in that case
+        'on_finished' is called from a timer once the extraction ends, otherwise it is called
+        before this method returns.
+        """
 
         if self._status != InstallerStatus.READY:
             self.abort_operation()
-            return None
+            on_finished(None)
+            return
 
+        self._install(self._install_path, on_finished)
+
+    def _install(self, install_path: str, on_finished: typing.Callable[[str | None], None]) -> None:
+        pack_info_path = os.path.join(
+            install_path, self.pack_root_directory, self.pack_info_basename
+        )
         try:
             if self._try_reregistering:
                 logger.info(f"Re-register enabled. No installation needed.")
                 self.status = InstallerStatus.FINISHED
-                return os.path.join(
-                    self._install_path, self.pack_root_directory, self.pack_info_basename
-                )
+                on_finished(pack_info_path)
+                return
 
-            logger.info(f"Executing installation to '{self._install_path}'")
-            destination = os.path.join(self.install_path, self.pack_root_directory)
+            logger.info(f"Executing installation to '{install_path}'")
+            destination = os.path.join(install_path, self.pack_root_directory)
             if os.path.exists(destination):
                 if self.try_reinstalling:
                     logger.info(f"Re-install enabled. Deleting '{destination}'")
@@ -674,29 +1064,21 @@ class AssetPackInstaller:
                 else:
                     self.record_error_message("Install Path already contains this Asset Pack.")
                     self.abort_operation()
-                    return None
+                    on_finished(None)
+                    return
 
             paq_sources = self.get_paq_file_sources(self.pack_filepath)
-            if len(paq_sources) == 1:
-                install_from_paq_file(paq_sources[0])
-            elif len(paq_sources) > 1:
-                # Only use the reader for multi-part paq files
-                # Using it on single-part files adds a lot of unnecessary overhead
-                with polib.split_file_reader.SplitFileReader(paq_sources) as reader:
-                    install_from_paq_file(reader)
+            if len(paq_sources) > 0:
+                self._start_extraction(paq_sources, install_path, on_finished)
+                return
             elif os.path.isdir(self.pack_filepath):
-                logger.info(f"Copying to '{self._install_path}'")
+                logger.info(f"Copying to '{install_path}'")
                 shutil.copytree(self.pack_filepath, destination)
                 self.status = InstallerStatus.FINISHED
             else:
                 self.record_error_message("Path does not point to a Folder or a PAQ file")
                 self.abort_operation()
 
-            if self._status == InstallerStatus.FINISHED:
-                return os.path.join(
-                    self._install_path, self.pack_root_directory, self.pack_info_basename
-                )
-
         except (
             zipfile.BadZipFile,
             shutil.Error,
@@ -708,14 +1090,92 @@ class AssetPackInstaller:
             self.record_error_message(str(e))
             self.abort_operation()
 
+        on_finished(pack_info_path if self._status == InstallerStatus.FINISHED else None)
+
+    def cancel_extraction(self) -> None:
+        """Requests the running extraction to stop, the installation is aborted once it stops."""
+        if self._extractor is not None:
+            logger.info("Cancelling extraction")
+            self._extractor.cancel()
+
+    def shutdown(self) -> None:
+        """Stops the running extraction without reporting its result, used on unregister."""
+        if bpy.app.timers.is_registered(self._extraction_timer):
+            bpy.app.timers.unregister(self._extraction_timer)
+        if self._extractor is not None:
+            self._extractor.cancel()
+            # Wait for the partially extracted files to be removed
+            self._extractor.join()
+            self._extractor = None
+            self._on_extraction_finished = None
+            bpy.context.window_manager.progress_end()
+
+    def _start_extraction(
+        self,
+        paq_sources: list[str],
+        install_path: str,
+        on_finished: typing.Callable[[str | None], None],
+    ) -> None:
+        self._extractor = PaqExtractor(paq_sources, install_path)
+        self._on_extraction_finished = on_finished
+        self.status = InstallerStatus.EXTRACTING
+        self._extractor.start()
+        bpy.context.window_manager.progress_begin(0, 100)
+        # Persistent, the extraction has to be finished even if another .blend is loaded meanwhile
+        bpy.app.timers.register(
+            self._extraction_timer, first_interval=self.EXTRACTION_POLL_INTERVAL, persistent=True
+        )
+
+    def _check_extraction(self) -> float | None:
+        extractor = self._extractor
+        assert extractor is not None
+        window_manager = bpy.context.window_manager
+        if extractor.is_running:
+            progress = extractor.progress
+            if progress.bytes_total > 0:
+                window_manager.progress_update(100 * progress.bytes_done / progress.bytes_total)
+            polib.ui_bpy.tag_areas_redraw(bpy.context, {'PREFERENCES'})
+            return self.EXTRACTION_POLL_INTERVAL
+
+        on_finished = self._on_extraction_finished
+        assert on_finished is not None
+        self._extractor = None
+        self._on_extraction_finished = None
+        window_manager.progress_end()
+
+        if extractor.error is not None:
+            self.record_error_message(extractor.error)
+            self.abort_operation()
+        elif extractor.is_cancelled:
+            self.record_error_message("Extraction was cancelled.")
+            self.abort_operation()
+        else:
+            self.status = InstallerStatus.FINISHED
+
+        if self._status == InstallerStatus.FINISHED:
+            on_finished(
+                os.path.join(
+                    extractor.destination, self.pack_root_directory, self.pack_info_basename
+                )
+            )
+        else:
+            on_finished(None)
+        polib.ui_bpy.tag_areas_redraw(bpy.context, {'PREFERENCES'})
         return None
 
     def execute_uninstallation(self) -> str | None:
         """Successful uninstallation returns the .pack-info path of the uninstalled Asset Pack."""
 
-        if self._status != InstallerStatus.READY:
+        if self._status != InstallerStatus.READY or not self._check_uninstallation_allowed():
             self.abort_operation()
             return None
+
+        if not self._delete_uninstall_path():
+            return None
+        self.status = InstallerStatus.FINISHED
+        return self.uninstall_pack_info_path
+
+    def _check_uninstallation_allowed(self) -> bool:
         # Checks for not allowing deletion of internal Asset Packs
         if "G:/Shared drives/Builds" in polib.utils_bpy.normalize_path(
             self.uninstall_path
@@ -723,27 +1183,37 @@ class AssetPackInstaller:
             os.path.realpath(self.uninstall_path)
         ):
             self.record_error_message("Cannot uninstall internal polygoniq Asset Pack!")
-            self.abort_operation()
-            return None
+            return False
+        if not os.path.isdir(self.uninstall_path):
+            self.record_error_message("Path does not point to a Folder.")
+            return False
+        return True
 
+    def _delete_uninstall_path(self) -> bool:
         logger.info(f"Deleting '{self.uninstall_path}'")
         try:
-            if not os.path.isdir(self.uninstall_path):
-                self.record_error_message("Path does not point to a Folder.")
-                self.abort_operation()
-                return None
             shutil.rmtree(self.uninstall_path)
-            if self._operation == InstallerOperation.UPDATE:
-                self.status = InstallerStatus.READY
-            else:
-                self.status = InstallerStatus.FINISHED
-            return self.uninstall_pack_info_path
-
+            return True
         except (shutil.Error, PermissionError, OSError) as e:
             self.record_error_message(str(e))
             self.abort_operation()
+            return False
 
-        return None
+    def _replace_uninstall_path(self, staged_pack_root: str) -> bool:
+        """Replaces the uninstalled Asset Pack by the one installed into 'staged_pack_root'."""
+
+        destination = os.path.join(self._install_path, self.pack_root_directory)
+        if not self._delete_uninstall_path():
+            return False
+
+        logger.info(f"Moving '{staged_pack_root}' to '{destination}'")
+        try:
+            os.rename(staged_pack_root, destination)
+        except OSError as e:
+            self.record_error_message(str(e))
+            self.abort_operation()
+            return False
+        return True
 
     def _get_direct_child_pack_info_files(self, parent_dir: str) -> list[str]:
         if not os.path.exists(parent_dir):
@@ -808,6 +1278,18 @@ class AssetPackInstallerDialogMixin:
         description = instance.status_description
         layout.box().label(text=description, icon='INFO')
 
+        progress = instance.extraction_progress
+        if progress is not None:
+            box = layout.box()
+            row = box.row()
+            row.label(
+                text=f"Extracted {progress.files_done} / {progress.files_total} files, "
+                f"{polib.utils_bpy.convert_size(progress.bytes_done)} / "
+                f"{polib.utils_bpy.convert_size(progress.bytes_total)}",
+                icon='IMPORT',
+            )
+            row.operator("engon.cancel_asset_pack_extraction", text="", icon='CANCEL')
+
         for warning_message in instance.warning_messages:
             box = layout.box()
             box.alert = True
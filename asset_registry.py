@@ -29,12 +29,34 @@ import zipfile
 import logging
 import functools
 import enum
+import time
+import tomllib
 from . import mapr
 from . import polib
 
 logger = logging.getLogger(f"polygoniq.{__name__}")
 
 
+def _get_engon_version() -> str:
+    manifest_path = os.path.join(os.path.dirname(__file__), "blender_manifest.toml")
+    try:
+        with open(manifest_path, "rb") as f:
+            return tomllib.load(f)["version"]
+    except Exception:
+        logger.exception(f"Failed to read engon version from '{manifest_path}'")
+        # Caches are still invalidated when the index files change, only changes of the loading
+        # code between engon versions wouldn't be detected
+        return "unknown"
+
+
+# Parsed MAPR indices of registered asset packs are cached, so engon starts faster on subsequent
+# runs. The cache is keyed by engon version, so it is never shared between engon versions.
+INDEX_CACHE = mapr.index_cache.IndexCache(
+    os.path.join(polib.utils_bpy.get_user_data_resource_path("engon"), "index_cache"),
+    _get_engon_version(),
+)
+
+
 @dataclasses.dataclass
 class RegisterOptions:
     blender_asset_library: bool = True
@@ -302,35 +324,59 @@ class AssetPack:
 
         return main_category_id
 
+    def _load_providers(self) -> list[mapr.local_json_provider.LocalJSONProvider]:
+        """Loads MAPR providers of all valid index paths of this asset pack
+
+        This doesn't touch any Blender data or the registry state, so it is safe to call it from
+        other than main thread.
+        """
+        providers: list[mapr.local_json_provider.LocalJSONProvider] = []
+        for index_path in self._get_index_file_paths():
+            if not os.path.isfile(index_path):
+                logger.error(f"Index path is not a valid file {index_path}, skipping...")
+                continue
+
+            providers.append(
+                mapr.local_json_provider.LocalJSONProvider(
+                    index_path, self.install_path, self.file_id_prefix, index_cache=INDEX_CACHE
+                )
+            )
+
+        return providers
+
+    def _get_index_file_paths(self) -> list[str]:
+        index_file_paths: list[str] = []
+        for index_path in self.index_paths:
+            if not os.path.isabs(index_path):
+                index_path = os.path.realpath(
+                    os.path.abspath(os.path.join(self.install_path, index_path))
+                )
+            index_file_paths.append(index_path)
+        return index_file_paths
+
     def _register_in_mapr(
         self,
         master_asset_provider: mapr.asset_provider.AssetProviderMultiplexer,
         master_file_provider: mapr.file_provider.FileProviderMultiplexer,
+        providers: list[mapr.local_json_provider.LocalJSONProvider] | None = None,
     ) -> None:
+        """Registers providers of this asset pack into the master providers
+
+        'providers' can be loaded beforehand by '_load_providers', they are loaded here otherwise.
+        """
         assert len(self.asset_providers) == 0
         assert len(self.file_providers) == 0
 
+        if providers is None:
+            providers = self._load_providers()
+
         asset_multiplexer = mapr.asset_provider.AssetProviderMultiplexer()
         file_multiplexer = mapr.file_provider.FileProviderMultiplexer()
-        success = False
-        for index_path in self.index_paths:
-            if not os.path.isabs(index_path):
-                index_path = os.path.realpath(
-                    os.path.abspath(os.path.join(self.install_path, index_path))
-                )
-
-            if not os.path.isfile(index_path):
-                logger.error(f"Index path is not a valid file {index_path}, skipping...")
-                continue
-
-            provider = mapr.local_json_provider.LocalJSONProvider(
-                index_path, self.install_path, self.file_id_prefix
-            )
+        for provider in providers:
             asset_multiplexer.add_asset_provider(provider)
             file_multiplexer.add_file_provider(provider)
-            success = True
 
-        if success:
+        if len(providers) > 0:
             master_asset_provider.add_asset_provider(asset_multiplexer)
             master_file_provider.add_file_provider(file_multiplexer)
             self.asset_providers.append(asset_multiplexer)
@@ -490,10 +536,16 @@ class AssetRegistry:
     def get_packs_paths(self) -> set[str]:
         return {p.install_path for p in self._packs_by_full_name.values()}
 
-    def _register_pack(self, asset_pack: AssetPack, register_options: RegisterOptions) -> None:
+    def _register_pack(
+        self,
+        asset_pack: AssetPack,
+        register_options: RegisterOptions,
+        providers: list[mapr.local_json_provider.LocalJSONProvider] | None = None,
+    ) -> None:
         """Registers an addon into the registry
 
         If addon information with the same 'full_name' is already present, an exception is raised.
+        'providers' are the MAPR providers of the asset pack if they were loaded beforehand.
         """
 
         logger.debug(f"Registering '{asset_pack.full_name}' with options: {register_options}")
@@ -509,7 +561,9 @@ class AssetRegistry:
         assert asset_pack.pack_info_path not in self._packs_by_pack_info_path
         self._packs_by_pack_info_path[asset_pack.pack_info_path] = asset_pack
 
-        asset_pack._register_in_mapr(self.master_asset_provider, self.master_file_provider)
+        asset_pack._register_in_mapr(
+            self.master_asset_provider, self.master_file_provider, providers
+        )
         if register_options.blender_asset_library:
             asset_pack._register_blender_asset_library()
 
@@ -580,7 +634,8 @@ class AssetRegistry:
     def refresh_packs_from_pack_info_paths(
         self, pack_info_paths: dict[str, RegisterOptions]
     ) -> None:
-        input_pack_info_files: set[str] = set()
+        # Each pack-info is parsed only once, packs that are newly registered use the parsed pack
+        input_asset_packs: dict[str, AssetPack] = {}
         for pack_info_path in set(pack_info_paths.keys()):
             try:
                 asset_pack = AssetPack.load_from_json(pack_info_path)
@@ -590,12 +645,13 @@ class AssetRegistry:
                         f"supported and won't be registered! Reason: '{asset_pack.unsupported_reason}'"
                     )
                     continue
-                input_pack_info_files.add(pack_info_path)
+                input_asset_packs[pack_info_path] = asset_pack
             except:
                 logger.warning(
                     f"Failed parsing asset pack from '{pack_info_path}', skipping registration of this pack!"
                 )
 
+        input_pack_info_files = set(input_asset_packs.keys())
         logger.info(
             f"Refreshing registered asset packs from pack-info files: {input_pack_info_files}"
         )
@@ -613,15 +669,28 @@ class AssetRegistry:
 
         pack_info_files_to_add = input_pack_info_files - existing_pack_info_paths
         logger.debug(f"Will newly register {pack_info_files_to_add}")
-        for pack_info_file in pack_info_files_to_add:
+        loaded_packs = self._load_packs_providers(
+            {
+                pack_info_file: input_asset_packs[pack_info_file]
+                for pack_info_file in pack_info_files_to_add
+            }
+        )
+        # Registration mutates MAPR and Blender data, this happens on the main thread only
+        for pack_info_file, asset_pack, providers, load_duration in loaded_packs:
             assert pack_info_file not in self._packs_by_pack_info_path
+            start_time = time.perf_counter()
             try:
-                asset_pack = AssetPack.load_from_json(pack_info_file)
-                self._register_pack(asset_pack, pack_info_paths[pack_info_file])
+                self._register_pack(asset_pack, pack_info_paths[pack_info_file], providers)
             except:
                 logger.exception(
-                    f"Tried to newly register '{pack_info_file}' but parsing or registration failed!"
+                    f"Tried to newly register '{pack_info_file}' but registration failed!"
                 )
+                continue
+            logger.info(
+                f"Registered asset pack '{asset_pack.full_name}' in "
+                f"{load_duration + time.perf_counter() - start_time:.3f}s "
+                f"(loading indices took {load_duration:.3f}s)"
+            )
 
         different_register_options_packs: set[AssetPack] = set()
         for pack_path in kept_pack_info_paths:
@@ -654,8 +723,45 @@ class AssetRegistry:
                 )
                 asset_pack._unregister_blender_asset_library()
 
+        INDEX_CACHE.prune(
+            index_file_path
+            for asset_pack in self.get_registered_packs()
+            for index_file_path in asset_pack._get_index_file_paths()
+        )
         self._registry_refreshed()
 
+    def _load_packs_providers(
+        self, asset_packs: dict[str, AssetPack]
+    ) -> list[tuple[str, AssetPack, list[mapr.local_json_provider.LocalJSONProvider], float]]:
+        """Loads MAPR providers of 'asset_packs' before any of them is registered
+
+        'asset_packs' maps pack-info paths to parsed asset packs. Returns tuples of (pack-info
+        path, asset pack, its providers, duration of loading in seconds) sorted by the pack-info
+        path, so packs are always registered in the same order. Asset packs that failed to load
+        are logged and skipped.
+
+        Indices are loaded one after another, decoding them holds the GIL, so loading them in
+        threads doesn't make it faster. Indices unchanged since the last load are read from
+        INDEX_CACHE.
+        """
+        ret: list[
+            tuple[str, AssetPack, list[mapr.local_json_provider.LocalJSONProvider], float]
+        ] = []
+        for pack_info_file in sorted(asset_packs):
+            asset_pack = asset_packs[pack_info_file]
+            start_time = time.perf_counter()
+            try:
+                asset_pack.check_pack_validity()
+                providers = asset_pack._load_providers()
+            except:
+                logger.exception(
+                    f"Tried to newly register '{pack_info_file}' but loading its indices failed!"
+                )
+                continue
+            ret.append((pack_info_file, asset_pack, providers, time.perf_counter() - start_time))
+
+        return ret
+
     def _registry_refreshed(self) -> None:
         """Calls all 'on_refresh' callbacks to the registry.
 
@@ -50,5 +50,8 @@ def unregister():
     filters.unregister()
     state.unregister()
 
+    previews.preview_prefetcher.shutdown()
+    del previews.preview_prefetcher
+    previews.preview_manager.stop_eviction()
     # Delete the preview_manager to close the preview collection and allow previews to free
     del previews.preview_manager
@@ -37,6 +37,7 @@ from . import utils
 from . import dev
 from . import tiled_map
 from .. import preferences
+from .. import features
 from .. import asset_registry
 from .. import available_asset_packs
 from .. import __package__ as base_package
@@ -119,9 +120,45 @@ class MAPR_BrowserPreferencesPopoverPanel(bpy.types.Panel):
         for provider in asset_registry.instance.master_asset_provider._asset_providers:
             sub_col.label(text=str(provider))
 
+        master_asset_provider = asset_registry.instance.master_asset_provider
+        if isinstance(master_asset_provider, mapr.asset_provider.CachedAssetProviderMultiplexer):
+            stats = master_asset_provider.query_cache.stats
+            col.separator()
+            col.label(text="Query Cache:")
+            sub_col = col.column(align=True)
+            sub_col.label(
+                text=f"Entries: {stats.entries}, Size: {stats.size_bytes / 1024 / 1024:.2f} / "
+                f"{stats.max_size_bytes / 1024 / 1024:.2f} MiB"
+            )
+            sub_col.label(
+                text=f"Hits: {stats.hits}, Misses: {stats.misses}, Evictions: {stats.evictions}"
+            )
+
         col.separator()
         col.label(text="Preview Manager:")
-        col.label(text=str(previews.preview_manager))
+        preview_stats = previews.preview_manager.stats
+        sub_col = col.column(align=True)
+        sub_col.label(text=f"Loaded: {preview_stats.loaded} / {preview_stats.max_loaded}")
+        sub_col.label(
+            text=f"Evictions: {preview_stats.evictions}, Reloads: {preview_stats.reloads}"
+        )
+
+        col.separator()
+        col.label(text="Property Feature Index:")
+        index_stats = features.feature_utils.property_feature_index.stats
+        sub_col = col.column(align=True)
+        sub_col.label(
+            text=f"Datablocks: {index_stats.datablocks}, Hierarchies: {index_stats.hierarchies}"
+        )
+        sub_col.label(text=f"Rebuilds: {index_stats.rebuilds}")
+        sub_col.label(
+            text=f"Feature Hits: {index_stats.feature_hits}, "
+            f"Misses: {index_stats.feature_misses}"
+        )
+        sub_col.label(
+            text=f"Hierarchy Hits: {index_stats.hierarchy_hits}, "
+            f"Misses: {index_stats.hierarchy_misses}"
+        )
 
         col.separator()
         col.label(text="Polygoniq Global:")
@@ -139,6 +176,7 @@ class MAPR_BrowserPreferencesPopoverPanel(bpy.types.Panel):
         prefs = preferences.prefs_utils.get_preferences(context).browser_preferences
         col = layout.column()
         col.prop(prefs, "search_history_count")
+        col.prop(prefs, "max_loaded_previews")
         col.prop(prefs, "category_navigation_style")
         col.separator()
         col.operator(MAPR_BrowserReloadPreviews.bl_idname, icon='FILE_REFRESH')
@@ -181,6 +219,7 @@ class MAPR_BrowserReloadPreviews(bpy.types.Operator):
             logger.info(f"Removing the failed thumbnails path '{FAILED_THUMBNAILS_PATH}'")
             shutil.rmtree(FAILED_THUMBNAILS_PATH, ignore_errors=True)
 
+        previews.thumbnail_cache.clear()
         previews.preview_manager.clear()
         polib.ui_bpy.tag_areas_redraw(context, {'PREFERENCES'})
         return {'FINISHED'}
@@ -735,7 +774,9 @@ def draw_asset_previews(
     prefs: preferences.browser_preferences.BrowserPreferences,
 ) -> None:
     pm = previews.preview_manager
-    all_assets = filters.asset_repository.current_assets
+    # Eviction of previews over the budget is scheduled by the manager, when the budget changes
+    if pm.max_loaded != prefs.max_loaded_previews:
+        pm.max_loaded = prefs.max_loaded_previews
     current_assets = filters.asset_repository.lazy_current_assets
     browser_state = state.get_browser_state(context)
     selected_assets = list(browser_state.selected_assets)
@@ -802,7 +843,7 @@ def draw_asset_previews(
         row.label(text="", icon='EVENT_CTRL')
         row.label(text="To select an asset.", icon='MOUSE_LMB')
 
-    if len(all_assets) == 0:
+    if filters.asset_repository.current_asset_count == 0:
         col = browser_layout.column()
         col.separator()
         row = col.row()
@@ -829,6 +870,11 @@ def draw_asset_previews(
         # columns = 0 calculates the number of columns automatically
         columns=0,
     )
+    # Previews of displayed assets are loaded on demand, if they weren't prefetched yet, previews
+    # of the next pages are loaded in background before the user gets to them.
+    previews.prefetch_previews(
+        filters.asset_repository.lazy_upcoming_assets(previews.PREFETCH_PAGES)
+    )
     for asset in current_assets:
         entry = grid_flow.box().column(align=True)
         entry.template_icon(pm.get_icon_id(asset.id_), scale=preview_scale)
@@ -913,7 +959,7 @@ def prefs_header_draw(self, context: bpy.types.Context) -> None:
     row.separator_spacer()
     sub = row.row()
     sub.enabled = False
-    current_assets_count = len(filters.asset_repository.current_assets)
+    current_assets_count = filters.asset_repository.current_asset_count
     sub.label(text=f"Browsing {current_assets_count} asset" + "s" * (current_assets_count != 1))
 
     row.separator_spacer()
@@ -52,11 +52,22 @@ IS_RECONSTRUCT = False
 USE_THREADED_QUERY = True
 
 
+class QueryRequest(typing.NamedTuple):
+    generation: int
+    query: mapr.query.Query
+    on_complete: list[typing.Callable[[mapr.asset_provider.DataView], None]]
+    refine: bool
+    provider_generation: int
+    cancellation_token: mapr.query.CancellationToken
+
+
 class DataRepository:
     """Data repository encapsulates querying access providers for the browser.
 
-    Queries are executed in a separate thread if `USE_THREADED_QUERY` is True,
-    query being performed is indicated by `is_loading` member variable.
+    Queries are executed in a separate long-lived worker thread if `USE_THREADED_QUERY` is True,
+    query being performed is indicated by `is_loading` member variable. Only the latest query
+    request waits for the worker, a new request replaces the waiting one and cancels the running
+    one. Each request has a generation number and views of outdated requests are dropped.
 
     The repository is responsible for lazily displaying assets (slicing and storing current view),
     currently this is OK, but it should be moved forward to a separate class when we truly "lazy load"
@@ -69,6 +80,19 @@ class DataRepository:
         self.asset_provider = asset_provider
         self.is_loading = False
         self.last_view: mapr.asset_provider.DataView | None = None
+        # Incremented on each provider update, views from previous provider can't be refined
+        self._provider_generation = 0
+        self._last_view_provider_generation = 0
+
+        # Incremented on each query request, only view of the latest request is used
+        self._generation = 0
+        self._requested_category_id: mapr.category.CategoryID | None = None
+        # Guards the requests and the result of the worker
+        self._worker_condition = threading.Condition()
+        self._pending_request: QueryRequest | None = None
+        self._running_request: QueryRequest | None = None
+        self._worker: threading.Thread | None = None
+        self._stop_worker = False
 
         # Number of lazily displayed assets, check lazy_ properties and methods.
         self._lazy_displayed_count = lazy_display_increment
@@ -78,34 +102,138 @@ class DataRepository:
         self,
         query: mapr.query.Query,
         on_complete: typing.Callable[[mapr.asset_provider.DataView], None] | None = None,
+        refine: bool = False,
     ) -> None:
-        def _query():
-            logger.debug(f"Performing query against category {query.category_id}")
-            # We are fine here in a separate thread if we don't access any Blender data, the only
-            # thing how we touch blender is loading previews and tagging redraw
-            self.last_view = self.asset_provider.query(query)
+        """Queries the asset provider, calls 'on_complete' with the resulting view
+
+        If 'refine' is True and the 'query' only narrows the query of the last view, only assets
+        from the last view are filtered.
+
+        If this request supersedes previous requests whose views weren't published yet, their
+        'on_complete' callbacks are called with the view of this request instead.
+        """
+        on_complete_callbacks = [] if on_complete is None else [on_complete]
+        with self._worker_condition:
+            self._generation += 1
+            for superseded_request in (self._running_request, self._pending_request):
+                if superseded_request is not None:
+                    superseded_request.cancellation_token.cancel()
+                    on_complete_callbacks = superseded_request.on_complete + on_complete_callbacks
+            # Superseded requests are taken over by this one
+            self._running_request = None
+            self._pending_request = None
+
+            request = QueryRequest(
+                self._generation,
+                query,
+                on_complete_callbacks,
+                refine,
+                self._provider_generation,
+                mapr.query.CancellationToken(),
+            )
+            self._requested_category_id = query.category_id
+            self.is_loading = True
+            if USE_THREADED_QUERY:
+                self._pending_request = request
+                self._ensure_worker()
+                self._worker_condition.notify()
+
+        polib.ui_bpy.tag_areas_redraw(bpy.context, {'PREFERENCES'})
+        state.get_browser_state(bpy.context).reset_active_asset()
+        if not USE_THREADED_QUERY:
+            self._process_request(request)
+
+    def stop_worker(self) -> None:
+        """Cancels running query and stops the worker thread, pending query is dropped"""
+        with self._worker_condition:
+            self._stop_worker = True
+            if self._running_request is not None:
+                self._running_request.cancellation_token.cancel()
+            self._pending_request = None
+            self._worker_condition.notify()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        self._stop_worker = False
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="engon_browser_query_worker", daemon=True
+        )
+        self._worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._worker_condition:
+                while self._pending_request is None and not self._stop_worker:
+                    self._worker_condition.wait()
+                if self._stop_worker:
+                    return
+
+                request = self._pending_request
+                assert request is not None
+                self._pending_request = None
+                self._running_request = request
+
+            try:
+                self._process_request(request)
+            except Exception:
+                logger.exception(f"Query against category {request.query.category_id} failed")
+            finally:
+                with self._worker_condition:
+                    if self._running_request is request:
+                        self._running_request = None
+                        if request.generation == self._generation:
+                            self.is_loading = False
+
+    def _process_request(self, request: QueryRequest) -> None:
+        logger.debug(f"Performing query against category {request.query.category_id}")
+        previous_view = None
+        if request.refine and self._last_view_provider_generation == request.provider_generation:
+            previous_view = self.last_view
+
+        # We are fine here in a separate thread if we don't access any Blender data, the only
+        # thing how we touch blender is loading previews and tagging redraw
+        try:
+            view = self.asset_provider.query(
+                request.query, previous_view, request.cancellation_token
+            )
+        except mapr.query.QueryCancelledError:
+            logger.debug(f"Query against category {request.query.category_id} was cancelled")
+            return
+
+        # Select the first displayed assets before publishing the view, so they can be drawn
+        # right away, sorting of all assets is done after.
+        view.get_first(self._lazy_display_increment)
+
+        with self._worker_condition:
+            if request.generation != self._generation:
+                logger.debug(f"Dropping outdated view of query generation {request.generation}")
+                return
+
+            self.last_view = view
+            self._last_view_provider_generation = request.provider_generation
             self.is_loading = False
-            polib.ui_bpy.tag_areas_redraw(bpy.context, {'PREFERENCES'})
+            # The request is answered, a query arriving while its callbacks run doesn't take
+            # them over and call them again
+            if self._running_request is request:
+                self._running_request = None
             # Reset the count of displayed assets, so we display only first N again after each query.
             self.lazy_reset_displayed()
 
-            if on_complete is not None:
-                on_complete(self.last_view)
-
-        self.is_loading = True
         polib.ui_bpy.tag_areas_redraw(bpy.context, {'PREFERENCES'})
-        state.get_browser_state(bpy.context).reset_active_asset()
-        if USE_THREADED_QUERY:
-            thread = threading.Thread(target=_query)
-            thread.start()
-        else:
-            _query()
+        for on_complete in request.on_complete:
+            on_complete(view)
+
+        if request.generation == self._generation:
+            view.complete()
 
     def update_provider(self, asset_provider: mapr.asset_provider.AssetProvider) -> None:
-        """Updates the provider used for the repository, clears caches and reconstructs filters
+        """Updates the provider used for the repository and reconstructs filters
 
         If there is a DataView saved from previous queries, it is queried again with the new
-        provider.
+        provider. Cached queries are not cleared here, the provider invalidates the ones affected
+        by its changes.
         We don't query if there wasn't any DataView saved, as we don't want to query assets
         if we know that the browser wasn't opened yet - this wastes resources and start-up time.
         """
@@ -115,7 +243,7 @@ class DataRepository:
             filters_.reenable()
 
         self.asset_provider = asset_provider
-        self.clear_cache()
+        self._provider_generation += 1
 
         filters_ = get_filters(bpy.context)
         if self.last_view is not None:
@@ -138,20 +266,40 @@ class DataRepository:
 
     @property
     def lazy_all_displayed(self) -> bool:
-        return self._lazy_displayed_count >= len(self.current_assets)
+        return self._lazy_displayed_count >= self.current_asset_count
 
     @property
     def lazy_current_assets(self) -> typing.Sequence[mapr.asset.Asset]:
         return (
-            self.last_view.assets[: self._lazy_displayed_count]
+            self.last_view.get_first(self._lazy_displayed_count)
             if self.last_view is not None
             else ()
         )
 
+    def lazy_upcoming_assets(self, pages: int) -> typing.Sequence[mapr.asset.Asset]:
+        """Returns displayed assets followed by assets of the next 'pages' lazily displayed pages"""
+        if self.last_view is None:
+            return ()
+        return self.last_view.get_first(
+            self._lazy_displayed_count + pages * self._lazy_display_increment
+        )
+
+    @property
+    def current_asset_count(self) -> int:
+        return self.last_view.asset_count if self.last_view is not None else 0
+
     @property
     def current_assets(self) -> typing.Sequence[mapr.asset.Asset]:
         return self.last_view.assets if self.last_view is not None else ()
 
+    @property
+    def requested_category_id(self) -> mapr.category.CategoryID:
+        """Category of the latest query request, differs from the current one until it finishes"""
+        if self._requested_category_id is not None:
+            return self._requested_category_id
+
+        return self.current_category_id
+
     @property
     def current_category_id(self) -> mapr.category.CategoryID:
         return (
@@ -221,14 +369,15 @@ class BrowserFilter:
 
 def _filters_updated_bulk_query() -> None:
     filters_properties = get_filters()
-    # Repurpose existing view category_id, as we know it didn't change
+    # Repurpose category_id of the latest query, as we know it didn't change
     asset_repository.query(
         mapr.query.Query(
-            asset_repository.current_category_id,
+            asset_repository.requested_category_id,
             filters_properties.used_filters.values(),
             filters_properties.sort_mode,
         ),
         on_complete=lambda _: filters_properties.reenable(),
+        refine=True,
     )
 
 
@@ -236,14 +385,12 @@ def schedule_bulk_query() -> None:
     """Schedules a query against the asset repository based on current state.
 
     Call this whenever you want browser state to be updated based on any changes in filters.
-    Repeated calls of this function are grouped and only one query is performed after a certain delay.
+    Repeated calls of this function within one UI update are grouped and only one query is
+    performed. There is no need to delay the query, the repository cancels the running query
+    when a newer one is requested.
     """
-    # Each filter update re-registers a timer that will trigger the expensive operation - querying
-    # based on filter parameters only after a certain delay
-    if bpy.app.timers.is_registered(_filters_updated_bulk_query):
-        bpy.app.timers.unregister(_filters_updated_bulk_query)
-
-    bpy.app.timers.register(_filters_updated_bulk_query, first_interval=0.3)
+    if not bpy.app.timers.is_registered(_filters_updated_bulk_query):
+        bpy.app.timers.register(_filters_updated_bulk_query, first_interval=0.0)
 
 
 def _filter_updated_event(filter_instance: BrowserFilter) -> None:
@@ -340,6 +487,14 @@ class BrowserNumericParameterFilter(
 
         return super().filter_(asset)
 
+    def filter_columns(
+        self, store: mapr.parameter_store.ParameterStore, positions: np.ndarray
+    ) -> np.ndarray | None:
+        if self.is_default():
+            return np.ones(len(positions), dtype=bool)
+
+        return super().filter_columns(store, positions)
+
     def _convert_to_num_type(self, value: int | float) -> int | float:
         return int(value) if self.is_int else float(np.float32(value))
 
@@ -682,6 +837,14 @@ class BrowserVectorParameterFilter(
 
         return super().filter_(asset)
 
+    def filter_columns(
+        self, store: mapr.parameter_store.ParameterStore, positions: np.ndarray
+    ) -> np.ndarray | None:
+        if self.is_default():
+            return np.ones(len(positions), dtype=bool)
+
+        return super().filter_columns(store, positions)
+
     def _range_start_get(self):
         return self.get("range_start", mathutils.Vector((-1.0, -1.0, -1.0)))
 
@@ -1437,3 +1600,4 @@ def unregister():
 
     asset_registry.instance.on_refresh.remove(on_registry_update)
     bpy.app.handlers.load_post.remove(on_load_post)
+    asset_repository.stop_worker()
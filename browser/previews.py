@@ -17,6 +17,9 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 #
 # ##### END GPL LICENSE BLOCK #####
+import bpy
+import os
+import math
 import typing
 import logging
 
@@ -26,7 +29,41 @@ from .. import asset_registry
 
 logger = logging.getLogger(f"polygoniq.{__name__}")
 
-preview_manager = polib.preview_manager_bpy.PreviewManager(blocking_load=False)
+# Number of lazily displayed pages of assets following the displayed ones, whose previews
+# are prefetched
+PREFETCH_PAGES = 2
+
+# Largest scale of the preview tiles in the browser, see "preview_scale" in browser.py
+MAX_PREVIEW_SCALE = 12.5
+# Width of one scale unit of the preview tiles in pixels at UI scale 1
+PREVIEW_SCALE_UNIT_PX = 20
+MIN_THUMBNAIL_SIZE = 256
+
+
+def get_thumbnail_size() -> int:
+    """Returns size of thumbnails that aren't upscaled in the largest tiles at current UI scale"""
+    ui_scale = bpy.context.preferences.system.ui_scale
+    return max(MIN_THUMBNAIL_SIZE, math.ceil(MAX_PREVIEW_SCALE * PREVIEW_SCALE_UNIT_PX * ui_scale))
+
+
+# Previews are drawn downscaled in the browser, downscaled thumbnails of them are cached, so they
+# are not decoded at full resolution on each start.
+thumbnail_cache = polib.preview_manager_bpy.ThumbnailCache(
+    os.path.join(polib.utils_bpy.get_user_data_resource_path("engon"), "preview_thumbnails"),
+    size=get_thumbnail_size(),
+    max_bytes=512 * 1024 * 1024,
+)
+preview_manager = polib.preview_manager_bpy.PreviewManager(
+    blocking_load=False, thumbnail_cache=thumbnail_cache
+)
+preview_prefetcher = polib.preview_manager_bpy.PreviewPrefetcher(preview_manager)
+
+
+def prefetch_previews(assets: typing.Iterable[mapr.asset.Asset]) -> None:
+    """Prefetches previews of 'assets' in background, in the order of 'assets'"""
+    # UI scale can change at any time, thumbnails of the new size are cached separately
+    thumbnail_cache.size = get_thumbnail_size()
+    preview_prefetcher.request(asset.id_ for asset in assets)
 
 
 def asset_registry_changed(
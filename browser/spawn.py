@@ -62,9 +62,11 @@ class MAPR_SpawnAssetBase(bpy.types.Operator):
         """Spawns multiple assets at once into the scene.
 
         Adjust spawning options so this creates desirable result and doesn't spawn e. g. all
-        geometry nodes on the same object and crash Blender.
+        geometry nodes on the same object and crash Blender. Assets are spawned in one batch, so
+        shared files are materialized only once. Callers remove duplicates once afterwards.
         """
         prefs = preferences.prefs_utils.get_preferences(context).browser_preferences
+        assets_options: list[tuple[mapr.asset.Asset, hatchery.spawn.DatablockSpawnOptions]] = []
         for asset in assets:
             can_spawn, why_fail = prefs.spawn_options.can_spawn(asset, context)
             if not can_spawn:
@@ -81,9 +83,15 @@ class MAPR_SpawnAssetBase(bpy.types.Operator):
                 spawn_options.activate_spawned = False
             if isinstance(spawn_options, hatchery.spawn.ModelSpawnOptions):
                 spawn_options.make_active = True
-            # TODO: We use MAPR_SpawnAssetBase instead of self here, because of how the
-            # MAPR_SpawnAllDisplayed operator is implemented out of the hierarchy, this is not ideal.
-            MAPR_SpawnAssetBase._spawn(self, context, asset, spawn_options)
+            assets_options.append((asset, spawn_options))
+
+        if len(assets_options) == 0:
+            return
+
+        asset_provider = asset_registry.instance.master_asset_provider
+        file_provider = asset_registry.instance.master_file_provider
+        spawner = mapr.blender_asset_spawner.AssetSpawner(asset_provider, file_provider)
+        spawner.spawn_batch(context, assets_options)
 
     def _remove_duplicates(self):
         pack_paths = asset_registry.instance.get_packs_paths()
@@ -284,6 +292,9 @@ class MAPR_BrowserSpawnDisplayed(bpy.types.Operator):
                 context, True, keep_selection=True, keep_active=True
             )
 
+        if prefs.spawn_options.remove_duplicates:
+            MAPR_SpawnAssetBase._remove_duplicates(self)
+
         return {'FINISHED'}
 
 
@@ -799,7 +810,7 @@ class MAPR_BrowserSpawnSelected(MAPR_BrowserSelectedAssetsOperatorBase):
 
     @polib.utils_bpy.blender_cursor('WAIT')
     def execute(self, context: bpy.types.Context) -> set["rna_enums.OperatorReturnItems"]:
-
+        prefs = preferences.prefs_utils.get_preferences(context).browser_preferences
         assets = list(state.get_browser_state(context).selected_assets)
         prev_objects = set(bpy.context.selectable_objects)
 
@@ -808,6 +819,9 @@ class MAPR_BrowserSpawnSelected(MAPR_BrowserSelectedAssetsOperatorBase):
         spawned_objects = set(bpy.context.selectable_objects) - prev_objects
         for obj in spawned_objects:
             obj.select_set(True)
+
+        if prefs.spawn_options.remove_duplicates:
+            self._remove_duplicates()
         self.report({'INFO'}, f"Spawned {len(assets)} asset(s)")
         return {'FINISHED'}
 
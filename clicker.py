@@ -106,7 +106,9 @@ class Clicker(bpy.types.Operator):
         self.placed_object: bpy.types.Object | None = None
         self.initial_selected_objects: set[bpy.types.Object] = set()
         self.place_mouse_position: mathutils.Vector | None = None
-        self.current_object_hierarchy_names: set[str] = set()
+        # Collision surface prepared for raycasting on each mouse move, it doesn't contain the
+        # current object, placed objects are added to it when they are finalized
+        self.raycast_index: polib.linalg_bpy.RaycastIndex | None = None
         # Store the last adjustment of z rotation, so next placed objects continue with the same
         # base rotation.
         self.last_z_rotation_adjustment = 0.0
@@ -211,6 +213,7 @@ class Clicker(bpy.types.Operator):
     ) -> set[str]:
         Clicker.is_running = False
         Clicker.remove_draw_handlers()
+        self.raycast_index = None
 
         context.window.cursor_modal_restore()
         if self.models_collection is not None:
@@ -308,11 +311,9 @@ class Clicker(bpy.types.Operator):
         self, context: bpy.types.Context, event: bpy.types.Event
     ) -> None:
         assert self.current_object is not None
-        raycast_hit = polib.linalg_bpy.raycast_screen_to_world(
-            context,
-            (event.mouse_region_x, event.mouse_region_y),
-            self.current_object_hierarchy_names,
-            self.collision_collection,
+        assert self.raycast_index is not None
+        raycast_hit = self.raycast_index.raycast_screen_to_world(
+            context, (event.mouse_region_x, event.mouse_region_y)
         )
         # If we didn't hit anything, place the object at the mouse cursor position with reset rotation
         if raycast_hit is None:
@@ -396,8 +397,9 @@ class Clicker(bpy.types.Operator):
                 f"Object '{self.placed_object.name}' finalized at {self.placed_object.location} "
                 f"with scale {self.placed_object.scale} and rotation {self.placed_object.rotation_euler}"
             )
+            if self.raycast_index is not None:
+                self.raycast_index.add_object(context, self.placed_object)
 
-        self.current_object_hierarchy_names.clear()
         while self.current_object is None:
             random_object = random.choice(self.models_collection.objects)
             assert random_object is not None
@@ -418,13 +420,6 @@ class Clicker(bpy.types.Operator):
 
         polib.asset_pack_bpy.collection_add_object(self.target_collection, self.current_object)
 
-        # Add current hierarchy and the instancer to the current_object_hierarchy_names, that
-        # will be further used when raycasting on the geometry to completely exclude the currently
-        # placed object from raycasting.
-        for obj in polib.asset_pack_bpy.get_entire_object_hierarchy(self.current_object):
-            self.current_object_hierarchy_names.add(obj.name)
-        self.current_object_hierarchy_names.add(self.current_object.name)
-
         # Rotation randomization, use rotation from the last object if it exists so next clicked
         # asset base rotation aligned with the previous one.
         location, rotation, scale = self.current_object.matrix_world.decompose()
@@ -558,6 +553,12 @@ class Clicker(bpy.types.Operator):
         self.models_collection.hide_render = True
         self.models_collection.hide_viewport = True
 
+        # Index the collision surface before the current object is created, so it never
+        # collides with itself
+        self.raycast_index = polib.linalg_bpy.RaycastIndex(
+            context, raycast_collection=self.collision_collection
+        )
+
         self.choose_next_object(context)
 
         # Register the draw handler for the clicker help UI
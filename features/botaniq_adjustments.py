@@ -40,9 +40,9 @@ class BotaniqAdjustmentPreferences(bpy.types.PropertyGroup):
         max=10.0,
         soft_max=1.0,
         step=1,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            BotaniqAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            BotaniqAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.BQ_BRIGHTNESS,
             self.brightness,
         ),
@@ -55,9 +55,9 @@ class BotaniqAdjustmentPreferences(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0,
         step=1,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            BotaniqAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            BotaniqAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.BQ_RANDOM_PER_BRANCH,
             self.hue_per_branch,
         ),
@@ -70,9 +70,9 @@ class BotaniqAdjustmentPreferences(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0,
         step=1,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            BotaniqAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            BotaniqAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.BQ_RANDOM_PER_LEAF,
             self.hue_per_leaf,
         ),
@@ -85,9 +85,9 @@ class BotaniqAdjustmentPreferences(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0,
         step=1,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            BotaniqAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            BotaniqAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.BQ_SEASON_OFFSET,
             self.season_offset,
         ),
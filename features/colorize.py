@@ -87,9 +87,8 @@ def _make_prop_update(pref_attr: str, prop_name: str):
     """Return a property update callback that writes pref_attr's value to prop_name."""
 
     def update(self, context: bpy.types.Context) -> None:
-        assets = ColorizePanelMixin.get_multiedit_adjustable_assets(context)
         value = getattr(self, pref_attr)
-        polib.custom_props_bpy.update_custom_prop(context, assets, prop_name, value)
+        feature_utils.update_multiedit_property(context, ColorizePanelMixin, prop_name, value)
 
     return update
 
@@ -362,6 +362,238 @@ def has_engon_property_feature(
     return False
 
 
+class PropertyFeatureIndexStats(typing.NamedTuple):
+    datablocks: int
+    hierarchies: int
+    rebuilds: int
+    feature_hits: int
+    feature_misses: int
+    hierarchy_hits: int
+    hierarchy_misses: int
+
+
+class PropertyFeatureIndex:
+    """Index of property features supported by datablocks and of polygoniq object hierarchies.
+
+    Panels of property features filter the same selection in their 'poll' and 'draw' on every
+    redraw. The index computes property features of each datablock once and keeps the polygoniq
+    hierarchies of recently queried possible assets. Selection changes result in different
+    possible assets and thus in a different hierarchy. Depsgraph updates of objects drop only the
+    updated objects and hierarchies containing them, updates of collections drop all hierarchies
+    and removed objects. The whole index is invalidated on undo, redo and file load.
+    """
+
+    # Number of hierarchies kept, different panels query different possible assets
+    MAX_HIERARCHIES = 16
+
+    def __init__(self):
+        # Maps datablock to names of property features it has, None if it isn't polygoniq object
+        self._datablock_features: dict[bpy.types.ID, frozenset[str] | None] = {}
+        # Maps possible assets to polygoniq objects in them and in their children
+        self._hierarchies: dict[frozenset[bpy.types.ID], list[bpy.types.ID]] = {}
+        # Maps possible assets to all datablocks whose change can change their hierarchy
+        self._hierarchy_members: dict[frozenset[bpy.types.ID], set[bpy.types.ID]] = {}
+        self._is_empty = True
+        self._rebuilds = 0
+        self._feature_hits = 0
+        self._feature_misses = 0
+        self._hierarchy_hits = 0
+        self._hierarchy_misses = 0
+
+    @property
+    def stats(self) -> PropertyFeatureIndexStats:
+        return PropertyFeatureIndexStats(
+            len(self._datablock_features),
+            len(self._hierarchies),
+            self._rebuilds,
+            self._feature_hits,
+            self._feature_misses,
+            self._hierarchy_hits,
+            self._hierarchy_misses,
+        )
+
+    def invalidate(self) -> None:
+        self._datablock_features.clear()
+        self.invalidate_hierarchies()
+        self._is_empty = True
+
+    def invalidate_hierarchies(self) -> None:
+        """Drops all hierarchies, keeps indexed features of datablocks"""
+        self._hierarchies.clear()
+        self._hierarchy_members.clear()
+
+    def invalidate_datablocks(self, datablocks: typing.Iterable[bpy.types.ID]) -> None:
+        """Drops indexed features of 'datablocks' and hierarchies they can be part of"""
+        affected: set[bpy.types.ID] = set()
+        for datablock in datablocks:
+            self._datablock_features.pop(datablock, None)
+            affected.add(datablock)
+            # Changed parent adds the object to the hierarchy of the parent
+            parent = getattr(datablock, "parent", None)
+            if parent is not None:
+                affected.add(parent)
+
+        for key, members in list(self._hierarchy_members.items()):
+            if not members.isdisjoint(affected):
+                del self._hierarchies[key]
+                del self._hierarchy_members[key]
+
+    def invalidate_removed_datablocks(self) -> None:
+        """Drops indexed features of datablocks that were removed from 'bpy.data.objects'"""
+        objects = set(bpy.data.objects)
+        for datablock in list(self._datablock_features):
+            try:
+                # Accessing a freed datablock raises, its memory might be reused by a new one
+                datablock.name
+                is_removed = datablock not in objects
+            except ReferenceError:
+                is_removed = True
+            if is_removed:
+                del self._datablock_features[datablock]
+
+    def has_feature(self, datablock: bpy.types.ID, feature: str) -> bool:
+        features = self._get_features(datablock)
+        return features is not None and feature in features
+
+    def is_polygoniq_object(self, datablock: bpy.types.ID) -> bool:
+        return self._get_features(datablock) is not None
+
+    def get_hierarchy(self, possible_assets: typing.Iterable[bpy.types.ID]) -> list[bpy.types.ID]:
+        """Returns polygoniq objects from 'possible_assets' and all their polygoniq children."""
+        key = frozenset(possible_assets)
+        hierarchy = self._hierarchies.get(key, None)
+        if hierarchy is not None:
+            self._hierarchy_hits += 1
+            return hierarchy
+
+        self._hierarchy_misses += 1
+        self._mark_populated()
+        # we do not use get_hierarchy here to avoid duplicates
+        seen = {obj for obj in key if self.is_polygoniq_object(obj)}
+        queue = collections.deque(seen)
+
+        hierarchy = []
+        while len(queue) > 0:
+            obj = queue.popleft()
+            # Empties that don't instance anything are a leftover after making compound assets editable.
+            # They inherit properties from parent but don't control anything, let's filter them out.
+            if obj.type != 'EMPTY' or obj.instance_type != 'NONE':
+                hierarchy.append(obj)
+            for child in obj.children:
+                if not self.is_polygoniq_object(child):
+                    continue
+                if child in seen:
+                    continue
+                seen.add(child)
+                queue.append(child)
+
+        if len(self._hierarchies) >= PropertyFeatureIndex.MAX_HIERARCHIES:
+            # Drop the oldest hierarchy, dictionaries keep the insertion order
+            oldest_key = next(iter(self._hierarchies))
+            del self._hierarchies[oldest_key]
+            del self._hierarchy_members[oldest_key]
+        self._hierarchies[key] = hierarchy
+        self._hierarchy_members[key] = seen | key
+        return hierarchy
+
+    def _get_features(self, datablock: bpy.types.ID) -> frozenset[str] | None:
+        try:
+            features = self._datablock_features[datablock]
+            self._feature_hits += 1
+            return features
+        except KeyError:
+            pass
+
+        self._feature_misses += 1
+        self._mark_populated()
+        features = None
+        if polib.asset_pack_bpy.is_polygoniq_object(datablock):
+            features = frozenset(
+                feature
+                for feature in PROPERTY_FEATURE_PROPERTIES_MAP
+                if has_engon_property_feature(datablock, feature)
+            )
+        self._datablock_features[datablock] = features
+        return features
+
+    def _mark_populated(self) -> None:
+        if self._is_empty:
+            self._is_empty = False
+            self._rebuilds += 1
+
+
+property_feature_index = PropertyFeatureIndex()
+
+
+@bpy.app.handlers.persistent
+def _property_feature_index_depsgraph_update_post(
+    scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
+) -> None:
+    updated_objects: list[bpy.types.Object] = []
+    collections_updated = False
+    for update in depsgraph.updates:
+        # Transforms, e.g. moving objects, playback or 'update_tag' of the feature sliders, don't
+        # change custom properties nor the hierarchy. Parenting also updates shading.
+        if (
+            update.is_updated_transform
+            and not update.is_updated_geometry
+            and not update.is_updated_shading
+        ):
+            continue
+
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object):
+            updated_objects.append(datablock)
+        elif isinstance(datablock, bpy.types.Collection):
+            # Objects were added or removed
+            collections_updated = True
+
+    if len(updated_objects) > 0:
+        property_feature_index.invalidate_datablocks(updated_objects)
+    if collections_updated:
+        property_feature_index.invalidate_hierarchies()
+        property_feature_index.invalidate_removed_datablocks()
+
+
+@bpy.app.handlers.persistent
+def _property_feature_index_invalidate_handler(*args) -> None:
+    property_feature_index.invalidate()
+
+
+multiedit_propagator = polib.custom_props_bpy.CustomPropPropagator()
+
+
+def update_multiedit_property(
+    context: bpy.types.Context,
+    feature: type["EngonAssetFeatureControlPanelMixin"],
+    prop_name: str,
+    value: polib.custom_props_bpy.CustomAttributeValueType,
+) -> None:
+    """Sets custom property of multi-edit adjustable assets of 'feature' to 'value'
+
+    Used in updates of properties edited interactively, the adjustable assets are resolved
+    once per edit, see 'CustomPropPropagator'.
+    """
+    update_multiedit_properties(context, feature, {prop_name: value})
+
+
+def update_multiedit_properties(
+    context: bpy.types.Context,
+    feature: type["EngonAssetFeatureControlPanelMixin"],
+    values: typing.Mapping[str, polib.custom_props_bpy.CustomAttributeValueType],
+) -> None:
+    """Sets custom properties of multi-edit adjustable assets of 'feature' to 'values'
+
+    'values' maps property names to their values. See 'update_multiedit_property'.
+    """
+    multiedit_propagator.update(
+        context,
+        feature.feature_name,
+        lambda: feature.get_multiedit_adjustable_assets(context),
+        values,
+    )
+
+
 class EngonAssetFeatureControlPanelMixin(EngonFeaturePanelMixin):
     """Abstract mixin for displaying engon asset features in panels.
 
@@ -556,12 +788,11 @@ class PropertyAssetFeatureControlPanelMixin(EngonAssetFeatureControlPanelMixin):
         possible_assets: typing.Iterable[bpy.types.ID],
     ) -> typing.Iterable[bpy.types.ID]:
         """Filter assets out of possible assets that have the property feature."""
-        return set(
-            filter(
-                lambda obj: has_engon_property_feature(obj, cls.feature_name),
-                possible_assets,
-            )
-        )
+        return {
+            obj
+            for obj in possible_assets
+            if property_feature_index.has_feature(obj, cls.feature_name)
+        }
 
     @classmethod
     def filter_adjustable_assets_hierarchical(
@@ -569,27 +800,9 @@ class PropertyAssetFeatureControlPanelMixin(EngonAssetFeatureControlPanelMixin):
         possible_assets: typing.Iterable[bpy.types.ID],
     ) -> typing.Iterable[bpy.types.ID]:
         """Filter assets out of possible assets and their children that have the property feature."""
-
-        # we do not use get_hierarchy here to avoid duplicates
-        seen = {obj for obj in possible_assets if polib.asset_pack_bpy.is_polygoniq_object(obj)}
-        queue = collections.deque(seen)
-
-        possible_assets_and_children = []
-        while len(queue) > 0:
-            obj = queue.popleft()
-            # Empties that don't instance anything are a leftover after making compound assets editable.
-            # They inherit properties from parent but don't control anything, let's filter them out.
-            if obj.type != 'EMPTY' or obj.instance_type != 'NONE':
-                possible_assets_and_children.append(obj)
-            for child in obj.children:
-                if not polib.asset_pack_bpy.is_polygoniq_object(child):
-                    continue
-                if child in seen:
-                    continue
-                seen.add(child)
-                queue.append(child)
-
-        return cls.filter_adjustable_assets_simple(possible_assets_and_children)
+        return cls.filter_adjustable_assets_simple(
+            property_feature_index.get_hierarchy(possible_assets)
+        )
 
     @classmethod
     def filter_adjustable_assets_in_pps(
@@ -742,7 +955,18 @@ def register():
     for cls in MODULE_CLASSES:
         bpy.utils.register_class(cls)
 
+    bpy.app.handlers.depsgraph_update_post.append(_property_feature_index_depsgraph_update_post)
+    bpy.app.handlers.undo_post.append(_property_feature_index_invalidate_handler)
+    bpy.app.handlers.redo_post.append(_property_feature_index_invalidate_handler)
+    bpy.app.handlers.load_post.append(_property_feature_index_invalidate_handler)
+
 
 def unregister():
+    bpy.app.handlers.load_post.remove(_property_feature_index_invalidate_handler)
+    bpy.app.handlers.redo_post.remove(_property_feature_index_invalidate_handler)
+    bpy.app.handlers.undo_post.remove(_property_feature_index_invalidate_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(_property_feature_index_depsgraph_update_post)
+    property_feature_index.invalidate()
+
     for cls in MODULE_CLASSES:
         bpy.utils.unregister_class(cls)
@@ -33,32 +33,26 @@ class LightAdjustmentsPreferences(bpy.types.PropertyGroup):
     @staticmethod
     def update_prop_with_use_rgb(
         context: bpy.types.Context,
-        objs: typing.Iterable[bpy.types.Object],
         prop_name: str,
         value: polib.custom_props_bpy.CustomAttributeValueType,
         use_rgb_value: bool,
     ) -> None:
-        materialized_objs = list(objs)
-        polib.custom_props_bpy.update_custom_prop(
+        feature_utils.update_multiedit_properties(
             context,
-            materialized_objs,
-            polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_USE_RGB,
-            use_rgb_value,
-        )
-        polib.custom_props_bpy.update_custom_prop(
-            context,
-            materialized_objs,
-            prop_name,
-            value,
+            LightAdjustmentsPanel,
+            {
+                polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_USE_RGB: use_rgb_value,
+                prop_name: value,
+            },
         )
 
     use_rgb: bpy.props.BoolProperty(
         name="Use Direct Coloring instead of Temperature",
         description="Use Direct Coloring instead of Temperature",
         default=False,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            LightAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            LightAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_USE_RGB,
             self.use_rgb,
         ),
@@ -73,7 +67,6 @@ class LightAdjustmentsPreferences(bpy.types.PropertyGroup):
         max=12_000,  # blender "Temperature" shader node supports up to 12kK
         update=lambda self, context: LightAdjustmentsPreferences.update_prop_with_use_rgb(
             context,
-            LightAdjustmentsPanel.get_multiedit_adjustable_assets(context),
             polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_KELVIN,
             self.light_temperature,
             False,
@@ -91,7 +84,6 @@ class LightAdjustmentsPreferences(bpy.types.PropertyGroup):
         step=1,
         update=lambda self, context: LightAdjustmentsPreferences.update_prop_with_use_rgb(
             context,
-            LightAdjustmentsPanel.get_multiedit_adjustable_assets(context),
             polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_RGB,
             self.light_rgb,
             True,
@@ -106,9 +98,9 @@ class LightAdjustmentsPreferences(bpy.types.PropertyGroup):
         subtype='FACTOR',
         soft_max=200,  # mostly> interior use, exterior lights can go to 2000 or more
         step=1,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            LightAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            LightAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_LIGHT_STRENGTH,
             self.light_strength,
         ),
@@ -36,9 +36,9 @@ class PictorialAdjustmentsPreferences(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0,
         max=10.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            PictorialAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            PictorialAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_PICTORIAL_ADJUSTMENT_CONTRAST,
             self.contrast,
         ),
@@ -50,9 +50,9 @@ class PictorialAdjustmentsPreferences(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0,
         max=10.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            PictorialAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            PictorialAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_PICTORIAL_ADJUSTMENT_SATURATION,
             self.saturation,
         ),
@@ -64,9 +64,9 @@ class PictorialAdjustmentsPreferences(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0,
         max=10.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            PictorialAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            PictorialAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_PICTORIAL_ADJUSTMENT_VALUE,
             self.value,
         ),
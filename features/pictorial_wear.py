@@ -36,9 +36,9 @@ class PictorialWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            PictorialWearPanel.get_multiedit_adjustable_assets(context),
+            PictorialWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_PICTORIAL_WEAR_PAINT_CHIPPING,
             self.paint_chipping,
         ),
@@ -50,9 +50,9 @@ class PictorialWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            PictorialWearPanel.get_multiedit_adjustable_assets(context),
+            PictorialWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_PICTORIAL_WEAR_PRINT_TEAR,
             self.print_tear,
         ),
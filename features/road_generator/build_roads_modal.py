@@ -23,6 +23,7 @@
 
 import bpy
 import os
+import math
 import typing
 import mathutils
 import bpy_extras.view3d_utils
@@ -485,33 +486,34 @@ class BuildRoads(bpy.types.Operator):
             )
 
         self.mouse_point = road_builder.EmptyBuildPoint(self.mouse_pos_3d)
-        for segment, bezier_points in self.road_builder.get_spline_build_points():
-            for i, point in enumerate(bezier_points):
-                # Do not snap to any of the currently active build points
-                if self.road_builder.is_active_build_point(segment.spline, i):
-                    continue
-
-                # Snapping to crossroads is handled below, we don't want to snap to the
-                # adjacent points.
-                if self.road_builder.road_network.is_crossroad_endpoint(segment, i):
-                    continue
-
-                if (
-                    self._to_overlay_pos(self.mouse_pos_3d - point.co).length
-                    < segment.type_.half_width
-                ):
-                    self.snapped_point = (point.co, segment.type_.half_width)
-                    self.mouse_point = road_builder.RoadSegmentBuildPoint(segment, i)
-                    break
-
-        for crossroad in self.road_builder.get_crossroad_build_points():
-            if (
-                self._to_overlay_pos(self.mouse_pos_3d - crossroad.position).length
-                < crossroad.radius
-            ):
+        segment_points, crossroads = self.road_builder.get_snapping_candidates(self.mouse_pos_3d)
+        # Snap to the closest point in snapping distance
+        snapped_distance = math.inf
+        for segment, i in segment_points:
+            # Do not snap to any of the currently active build points
+            if self.road_builder.is_active_build_point(segment.spline, i):
+                continue
+
+            # Snapping to crossroads is handled below, we don't want to snap to the
+            # adjacent points.
+            if self.road_builder.road_network.is_crossroad_endpoint(segment, i):
+                continue
+
+            point = segment.spline.bezier_points[i]
+            distance = self._to_overlay_pos(self.mouse_pos_3d - point.co).length
+            if distance < segment.type_.half_width and distance < snapped_distance:
+                snapped_distance = distance
+                self.snapped_point = (point.co, segment.type_.half_width)
+                self.mouse_point = road_builder.RoadSegmentBuildPoint(segment, i)
+
+        # Crossroads take precedence over segment points
+        snapped_distance = math.inf
+        for crossroad in crossroads:
+            distance = self._to_overlay_pos(self.mouse_pos_3d - crossroad.position).length
+            if distance < crossroad.radius and distance < snapped_distance:
+                snapped_distance = distance
                 self.snapped_point = (crossroad.position, crossroad.radius)
                 self.mouse_point = road_builder.CrossroadBuildPoint(crossroad.position, crossroad)
-                break
 
         self.road_builder.update_provisional_end_point(self.mouse_point)
 
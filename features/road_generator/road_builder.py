@@ -90,6 +90,64 @@ def get_endpoint_neighbor_idx(idx: int) -> int:
     return 1 if idx == 0 else idx - 1
 
 
+class CurvePointsIndex:
+    """Lookup of bezier points of all splines of a curve by their position
+
+    Points are hashed into a grid of cubic cells, so points close to a position are found
+    in constant time instead of comparing the position with every point of the curve. The
+    cell size is derived from the largest coordinate of the curve, so any two positions
+    considered close by 'math.isclose(rel_tol=POSITION_REL_TOL)' are in the same or in
+    neighboring cells.
+    """
+
+    POSITION_REL_TOL = 1e-6
+    # Cell size used if all points are at the origin
+    MIN_CELL_SIZE = 1e-9
+
+    def __init__(self, curve: bpy.types.Object):
+        # Read all coordinates at once, accessing the bezier points one by one is slow
+        points: list[tuple[bpy.types.Spline, int, tuple[float, float, float]]] = []
+        for spline in curve.data.splines:
+            bezier_points = spline.bezier_points
+            coords = [0.0] * (len(bezier_points) * 3)
+            bezier_points.foreach_get("co", coords)
+            for i in range(len(bezier_points)):
+                points.append((spline, i, (coords[i * 3], coords[i * 3 + 1], coords[i * 3 + 2])))
+
+        max_abs_coord = max((abs(c) for _, _, co in points for c in co), default=0.0)
+        # Two close values differ by at most POSITION_REL_TOL times the larger of them, which is
+        # at most (1 + POSITION_REL_TOL) times the largest coordinate of the curve.
+        self.cell_size = max(2.0 * self.POSITION_REL_TOL * max_abs_coord, self.MIN_CELL_SIZE)
+        self.cells: dict[
+            tuple[int, int, int], list[tuple[bpy.types.Spline, int, tuple[float, float, float]]]
+        ] = {}
+        for point in points:
+            self.cells.setdefault(self._get_cell(point[2]), []).append(point)
+
+    def _get_cell(self, position: typing.Sequence[float]) -> tuple[int, int, int]:
+        return (
+            math.floor(position[0] / self.cell_size),
+            math.floor(position[1] / self.cell_size),
+            math.floor(position[2] / self.cell_size),
+        )
+
+    def find_close_points(
+        self, position: typing.Sequence[float]
+    ) -> typing.Iterator[tuple[bpy.types.Spline, int]]:
+        """Yields (spline, bezier point index) of all points close to 'position'"""
+        x, y, z = self._get_cell(position)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for spline, i, co in self.cells.get((x + dx, y + dy, z + dz), ()):
+                        if (
+                            math.isclose(co[0], position[0], rel_tol=self.POSITION_REL_TOL)
+                            and math.isclose(co[1], position[1], rel_tol=self.POSITION_REL_TOL)
+                            and math.isclose(co[2], position[2], rel_tol=self.POSITION_REL_TOL)
+                        ):
+                            yield spline, i
+
+
 @dataclasses.dataclass
 class ProvisionalCrossroadInfo:
     """Information about crossroad that building has started, but is not finished yet.
@@ -157,6 +215,9 @@ class RoadBuilder:
         self, scene: bpy.types.Scene, loader: road_type.RoadTypeBlendLoader
     ) -> None:
         """Initializes road network based on content of current scene"""
+        # Crossroads of the same road types search the same curves, points of each curve are
+        # indexed once, when the curve is searched for the first time.
+        curve_indices: dict[bpy.types.Object, CurvePointsIndex] = {}
         for obj in scene.objects:
             if not asset_helpers.is_road_generator_obj(obj):
                 continue
@@ -215,19 +276,17 @@ class RoadBuilder:
                     if type_ is None:
                         logger.warning(f"Unknown road type present on curve: '{curve.name}'")
                         continue
-                    for spline in curve.data.splines:
-                        for i, bp in enumerate(spline.bezier_points):
-                            for pos in searched_positions:
-                                if (
-                                    math.isclose(bp.co[0], pos[0], rel_tol=1e-6)
-                                    and math.isclose(bp.co[1], pos[1], rel_tol=1e-6)
-                                    and math.isclose(bp.co[2], pos[2], rel_tol=1e-6)
-                                ):
-                                    cx_adjacencies.append(
-                                        road_network.SegmentAdjacency(
-                                            road_network.RoadSegment(curve, spline, type_), i
-                                        )
-                                    )
+                    curve_index = curve_indices.get(curve)
+                    if curve_index is None:
+                        curve_index = CurvePointsIndex(curve)
+                        curve_indices[curve] = curve_index
+                    for pos in searched_positions:
+                        for spline, i in curve_index.find_close_points(pos):
+                            cx_adjacencies.append(
+                                road_network.SegmentAdjacency(
+                                    road_network.RoadSegment(curve, spline, type_), i
+                                )
+                            )
 
                 if len(cx_adjacencies) >= 2:
                     # If the position of crossroad is stored we reuse it. Otherwise calculate
@@ -277,6 +336,9 @@ class RoadBuilder:
         else:
             raise ValueError("Unknown start point!")
 
+        # Starting the segment can move or add points of existing segments
+        self.road_network.invalidate_snapping_grid()
+
     def update_provisional_end_point(self, point: BuildPoint):
         if not self.is_building:
             return
@@ -336,6 +398,24 @@ class RoadBuilder:
     def get_crossroad_build_points(self) -> typing.Iterable[road_network.Crossroad]:
         return self.road_network.crossroads
 
+    def get_snapping_candidates(
+        self, position: mathutils.Vector
+    ) -> tuple[list[tuple[road_network.RoadSegment, int]], list[road_network.Crossroad]]:
+        """Returns segment points and crossroads that can be in snapping distance of 'position'
+
+        Same as 'get_spline_build_points' and 'get_crossroad_build_points', but only the ones
+        near 'position' in the XY plane, see 'road_network.SnappingGrid'.
+        """
+        points, crossroads = self.road_network.get_snapping_grid().get_candidates(position)
+        # Don't allow connecting to the same spline
+        if isinstance(self.start_build_point, RoadSegmentBuildPoint):
+            points = [
+                (segment, i)
+                for segment, i in points
+                if segment.spline != self.start_build_point.segment.spline
+            ]
+        return points, crossroads
+
     def reset_state(self) -> None:
         self.start_build_point = None
         self.provisional_segment = None
@@ -374,6 +454,7 @@ class RoadBuilder:
             self._finish_provisional_cx(end_build_point)
 
         self.reset_state()
+        self.road_network.invalidate_snapping_grid()
 
     def _begin_provisional_cx(
         self,
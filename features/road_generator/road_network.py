@@ -24,6 +24,8 @@ import bpy
 import mathutils
 import typing
 import dataclasses
+import math
+import itertools
 import logging
 from . import road_type
 
@@ -139,6 +141,63 @@ class Crossroad:
             return "Crossroad: INVALID: Reference Error"
 
 
+class SnappingGrid:
+    """Uniform 2D grid of road segment points and crossroads the user can snap to
+
+    Each point is snappable within half width of its road type, each crossroad within its
+    radius. The cell size is the largest of these distances, so everything in snapping distance
+    of a position is in the 3x3 cells around it.
+    """
+
+    def __init__(
+        self, segments: typing.Iterable[RoadSegment], crossroads: typing.Iterable[Crossroad]
+    ):
+        points: list[tuple[mathutils.Vector, RoadSegment, int]] = []
+        for segment in segments:
+            for i, point in enumerate(segment.spline.bezier_points):
+                points.append((point.co.copy(), segment, i))
+        crossroads = list(crossroads)
+
+        self.cell_size = max(
+            itertools.chain(
+                (segment.type_.half_width for _, segment, _ in points),
+                (crossroad.radius for crossroad in crossroads),
+            ),
+            default=1.0,
+        )
+        # Avoid degenerate cells, e.g. for crossroads with all adjacencies at its position
+        self.cell_size = max(self.cell_size, 1e-3)
+
+        # maps cell to (segment, point index) of points in it
+        self._points: dict[tuple[int, int], list[tuple[RoadSegment, int]]] = {}
+        # maps cell to crossroads with position in it
+        self._crossroads: dict[tuple[int, int], list[Crossroad]] = {}
+        for position, segment, i in points:
+            self._points.setdefault(self._get_cell(position), []).append((segment, i))
+        for crossroad in crossroads:
+            self._crossroads.setdefault(self._get_cell(crossroad.position), []).append(crossroad)
+
+    def get_candidates(
+        self, position: mathutils.Vector
+    ) -> tuple[list[tuple[RoadSegment, int]], list[Crossroad]]:
+        """Returns points (as segment and point index) and crossroads near 'position' in XY plane
+
+        All points and crossroads in snapping distance of 'position' are returned, but some of the
+        returned can be further, the caller has to check the distance.
+        """
+        cell_x, cell_y = self._get_cell(position)
+        points = []
+        crossroads = []
+        for x in range(cell_x - 1, cell_x + 2):
+            for y in range(cell_y - 1, cell_y + 2):
+                points.extend(self._points.get((x, y), ()))
+                crossroads.extend(self._crossroads.get((x, y), ()))
+        return points, crossroads
+
+    def _get_cell(self, position: mathutils.Vector) -> tuple[int, int]:
+        return math.floor(position.x / self.cell_size), math.floor(position.y / self.cell_size)
+
+
 class RoadNetwork:
     """Representation of road network consisting of crossroads and segments.
 
@@ -150,10 +209,13 @@ class RoadNetwork:
         self._crossroads: set[Crossroad] = set()
         self._segments: set[RoadSegment] = set()
         self._endpoint_cx_map: dict[SegmentAdjacency, Crossroad] = {}
+        # Created on first use after any change of the network
+        self._snapping_grid: SnappingGrid | None = None
 
     def add_segment(self, segment: RoadSegment) -> None:
         if segment not in self._segments:
             self._segments.add(segment)
+            self.invalidate_snapping_grid()
 
     def add_crossroad(self, crossroad: Crossroad) -> None:
         for adj in crossroad.adjacencies:
@@ -161,8 +223,10 @@ class RoadNetwork:
             self._endpoint_cx_map[adj] = crossroad
 
         self._crossroads.add(crossroad)
+        self.invalidate_snapping_grid()
 
     def remove_crossroad(self, crossroad: Crossroad) -> None:
+        self.invalidate_snapping_grid()
         self._crossroads.remove(crossroad)
         for adj in crossroad.adjacencies:
             if adj in self._endpoint_cx_map:
@@ -177,6 +241,7 @@ class RoadNetwork:
         )
 
     def remove_segment(self, segment: RoadSegment) -> None:
+        self.invalidate_snapping_grid()
         self._segments.remove(segment)
         # Check if the segment was connected to any crossroad, if yes, then remove
         # the entry from point_cx_map and update the crossroad adjacency
@@ -217,6 +282,19 @@ class RoadNetwork:
         cx.adjacencies.add(adj)
         self._endpoint_cx_map[adj] = cx
 
+    def get_snapping_grid(self) -> SnappingGrid:
+        """Returns grid of segment points and crossroads of the network for snapping"""
+        if self._snapping_grid is None:
+            self._snapping_grid = SnappingGrid(self._segments, self._crossroads)
+        return self._snapping_grid
+
+    def invalidate_snapping_grid(self) -> None:
+        """Call when geometry of the network changes, e.g. when a point of a segment is moved
+
+        Changes done through methods of this class invalidate the grid automatically.
+        """
+        self._snapping_grid = None
+
     def split_segment(self, original: RoadSegment, head: RoadSegment, tail: RoadSegment) -> None:
         start_cx, end_cx = self.get_endpoints_connections(original)
         logger.debug(f"Splitting segment {original} to {head} and {tail}")
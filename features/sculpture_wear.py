@@ -36,9 +36,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.5,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_BUGHOLES_AREA,
             self.bugholes_area,
         ),
@@ -50,9 +50,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=2.0,
         min=0.01,
         max=10.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_BUGHOLES_MAPPING_SCALE,
             self.bugholes_mapping_scale,
         ),
@@ -64,9 +64,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_BUGHOLES_STRENGTH,
             self.bugholes_strength,
         ),
@@ -78,9 +78,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.5,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_FRACTURES_AREA,
             self.fractures_area,
         ),
@@ -91,9 +91,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.125,
         min=0.01,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_FRACTURES_THICKNESS,
             self.fractures_thickness,
         ),
@@ -104,9 +104,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_FRACTURES_STRENGTH,
             self.fractures_strength,
         ),
@@ -117,9 +117,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.5,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_MAPCRACKS_AREA,
             self.mapcracks_area,
         ),
@@ -130,9 +130,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_MAPCRACKS_STRENGTH,
             self.mapcracks_strength,
         ),
@@ -143,9 +143,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=5.0,
         min=0.01,
         max=10.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_WEAR_MAPCRACKS_MAPPING_SCALE,
             self.mapcracks_mapping_scale,
         ),
@@ -156,9 +156,9 @@ class SculptureWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            SculptureWearPanel.get_multiedit_adjustable_assets(context),
+            SculptureWearPanel,
             polib.custom_props_bpy.CustomPropertyNames.PQ_DIRT_DENSITY,
             self.dirt_density,
         ),
@@ -53,9 +53,9 @@ class TraffiqLightsSettingsPreferences(bpy.types.PropertyGroup):
     main_lights_status: bpy.props.EnumProperty(
         name="Main Lights Status",
         items=MAIN_LIGHT_STATUS,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqLightsSettingsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqLightsSettingsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_LIGHTS,
             float(self.main_lights_status),
         ),
@@ -68,9 +68,9 @@ class TraffiqLightsSettingsPreferences(bpy.types.PropertyGroup):
         soft_max=10.0,
         max=1_000_000.0,
         default=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqLightsSettingsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqLightsSettingsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_LIGHTS,
             self.main_lights_custom_strength,
         ),
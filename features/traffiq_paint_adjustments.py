@@ -38,9 +38,9 @@ class TraffiqPaintAdjustmentPreferences(bpy.types.PropertyGroup):
         max=1.0,
         default=(0.8, 0.8, 0.8, 1.0),
         size=4,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqPaintAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqPaintAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_PRIMARY_COLOR,
             self.primary_color,
         ),
@@ -51,9 +51,9 @@ class TraffiqPaintAdjustmentPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqPaintAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqPaintAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_FLAKES_AMOUNT,
             self.flakes_amount,
         ),
@@ -64,9 +64,9 @@ class TraffiqPaintAdjustmentPreferences(bpy.types.PropertyGroup):
         default=0.2,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqPaintAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqPaintAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_CLEARCOAT,
             self.clearcoat,
         ),
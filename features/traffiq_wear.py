@@ -84,9 +84,9 @@ class TraffiqWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqWearAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqWearAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_DIRT,
             self.dirt_wear_strength,
         ),
@@ -97,9 +97,9 @@ class TraffiqWearPreferences(bpy.types.PropertyGroup):
         default=0.0,
         min=0.0,
         max=1.0,
-        update=lambda self, context: polib.custom_props_bpy.update_custom_prop(
+        update=lambda self, context: feature_utils.update_multiedit_property(
             context,
-            TraffiqWearAdjustmentsPanel.get_multiedit_adjustable_assets(context),
+            TraffiqWearAdjustmentsPanel,
             polib.custom_props_bpy.CustomPropertyNames.TQ_SCRATCHES,
             self.scratches_wear_strength,
         ),
@@ -89,6 +89,11 @@ class SnapToGround(bpy.types.Operator):
             )
             return {'FINISHED'}
 
+        # Ground objects don't move while snapping, index them once for all snapped objects
+        ground = polib.snap_to_ground_bpy.GroundIndex(
+            ground_objects, context.evaluated_depsgraph_get()
+        )
+
         snapped_objects_names = []
         no_ground_object_names = []
         wrong_type_object_names = []
@@ -102,11 +107,6 @@ class SnapToGround(bpy.types.Operator):
                 if (
                     decomposed_car is not None and len(decomposed_car.wheels) > 0
                 ):  # traffiq vehicle behavior
-                    filtered_ground_objects = [
-                        obj
-                        for obj in ground_objects
-                        if not polib.asset_pack_bpy.is_part_of_decomposed_car(obj, decomposed_car)
-                    ]
                     logger.debug(
                         f"Was able to decompose {obj.name} as if it was a traffiq vehicle. "
                         f"Using {len(decomposed_car.wheels)} separate wheels to determine final rotation..."
@@ -117,7 +117,13 @@ class SnapToGround(bpy.types.Operator):
                         snappable_object = obj
 
                     is_snapped = polib.snap_to_ground_bpy.snap_to_ground_separate_wheels(
-                        snappable_object, decomposed_car.wheels, filtered_ground_objects
+                        snappable_object,
+                        decomposed_car.wheels,
+                        ground,
+                        object_filter=lambda o: not polib.asset_pack_bpy.is_part_of_decomposed_car(
+                            o, decomposed_car
+                        ),
+                        update_view_layer=False,
                     )
                 else:
                     # other traffiq assets are treated as generic assets
@@ -125,7 +131,7 @@ class SnapToGround(bpy.types.Operator):
                         f"No wheels present in this asset, using generic snapping method for {obj.name}."
                     )
                     is_snapped = polib.snap_to_ground_bpy.snap_to_ground_adjust_rotation(
-                        obj, ground_objects
+                        obj, ground, update_view_layer=False
                     )
             elif polib.asset_pack_bpy.is_polygoniq_object(obj, lambda x: x == "botaniq"):
                 logger.info(
@@ -133,9 +139,7 @@ class SnapToGround(bpy.types.Operator):
                     f"adjusting rotation."
                 )
                 try:
-                    is_snapped = polib.snap_to_ground_bpy.snap_to_ground_no_rotation(
-                        obj, ground_objects
-                    )
+                    is_snapped = polib.snap_to_ground_bpy.snap_to_ground_no_rotation(obj, ground)
                 except ValueError:
                     logger.exception(f"Failed to snap {obj.name} to the ground.")
                     wrong_type_object_names.append(obj.name)
@@ -146,7 +150,7 @@ class SnapToGround(bpy.types.Operator):
                     f"adjustment to rotation."
                 )
                 is_snapped = polib.snap_to_ground_bpy.snap_to_ground_adjust_rotation(
-                    obj, ground_objects
+                    obj, ground, update_view_layer=False
                 )
 
             if is_snapped:
@@ -154,6 +158,10 @@ class SnapToGround(bpy.types.Operator):
             else:
                 no_ground_object_names.append(obj.name)
 
+        # Snapped objects don't affect each other, update the scene once after all are snapped
+        if len(snapped_objects_names) > 0:
+            context.view_layer.update()
+
         if len(no_ground_object_names) + len(wrong_type_object_names) > 0:
             problems = []
 
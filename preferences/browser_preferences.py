@@ -388,6 +388,15 @@ class BrowserPreferences(bpy.types.PropertyGroup):
             default=20,
         )
     )
+    max_loaded_previews: polib.serialization_bpy.Serialize(
+        bpy.props.IntProperty(
+            name="Max Loaded Previews",
+            description="Number of asset previews kept in memory, least recently displayed "
+            "previews are unloaded when more previews are loaded",
+            min=100,
+            default=1000,
+        )
+    )
 
     debug: polib.serialization_bpy.Serialize(
         bpy.props.BoolProperty(
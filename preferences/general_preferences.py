@@ -753,14 +753,13 @@ class AssetPackInstallationDialog(
             )
 
     @staticmethod
-    def _install_pack(
-        context: bpy.types.Context, installer: asset_pack_installer.AssetPackInstaller
-    ) -> None:
-        prefs = prefs_utils.get_preferences(context)
-        gen_prefs = prefs.general_preferences
-
-        pack_info_path_to_add: str | None = installer.execute_installation()
-        if pack_info_path_to_add is not None and not installer.check_asset_pack_already_installed():
+    def _install_pack(installer: asset_pack_installer.AssetPackInstaller) -> None:
+        def on_finished(pack_info_path_to_add: str | None) -> None:
+            if pack_info_path_to_add is None or installer.check_asset_pack_already_installed():
+                return
+            # Extraction of .paq files finishes in a timer, the operator context is gone by then
+            context = bpy.context
+            gen_prefs = prefs_utils.get_preferences(context).general_preferences
             gen_prefs.add_new_pack_info_search_path(
                 context,
                 file_path=pack_info_path_to_add,
@@ -777,6 +776,8 @@ class AssetPackInstallationDialog(
             gen_prefs.refresh_packs()
             blend_maintenance.migrator.find_missing_files()
 
+        installer.execute_installation(on_finished)
+
     @polib.utils_bpy.blender_cursor('WAIT')
     def execute(self, context: bpy.types.Context) -> set["rna_enums.OperatorReturnItems"]:
         installer = asset_pack_installer.instance
@@ -789,7 +790,7 @@ class AssetPackInstallationDialog(
             bpy.ops.engon.asset_pack_update_dialog('INVOKE_DEFAULT')
             return {'FINISHED'}
 
-        AssetPackInstallationDialog._install_pack(context, installer)
+        AssetPackInstallationDialog._install_pack(installer)
 
         bpy.ops.engon.asset_pack_install_dialog('INVOKE_DEFAULT')
         return {'FINISHED'}
@@ -962,14 +963,13 @@ class AssetPackUpdateDialog(bpy.types.Operator, asset_pack_installer.AssetPackIn
             col.label(text="It will be REPLACED with the new version.")
 
     @staticmethod
-    def _update_pack(
-        context: bpy.types.Context, installer: asset_pack_installer.AssetPackInstaller
-    ) -> None:
-        prefs = prefs_utils.get_preferences(context)
-        gen_prefs = prefs.general_preferences
-
-        update_paths = installer.execute_update()
-        if update_paths is not None:
+    def _update_pack(installer: asset_pack_installer.AssetPackInstaller) -> None:
+        def on_finished(update_paths: tuple[str, str] | None) -> None:
+            if update_paths is None:
+                return
+            # Extraction of .paq files finishes in a timer, the operator context is gone by then
+            context = bpy.context
+            gen_prefs = prefs_utils.get_preferences(context).general_preferences
             pack_info_path_to_remove, pack_info_path_to_add = update_paths
             gen_prefs.remove_all_copies_of_pack_info_search_path(
                 context,
@@ -995,6 +995,8 @@ class AssetPackUpdateDialog(bpy.types.Operator, asset_pack_installer.AssetPackIn
             gen_prefs.refresh_packs()
             blend_maintenance.migrator.find_missing_files()
 
+        installer.execute_update(on_finished)
+
     @polib.utils_bpy.blender_cursor('WAIT')
     def execute(self, context: bpy.types.Context) -> set["rna_enums.OperatorReturnItems"]:
         installer = asset_pack_installer.instance
@@ -1002,7 +1004,7 @@ class AssetPackUpdateDialog(bpy.types.Operator, asset_pack_installer.AssetPackIn
         if self.close:
             return {'FINISHED'}
 
-        AssetPackUpdateDialog._update_pack(context, installer)
+        AssetPackUpdateDialog._update_pack(installer)
 
         bpy.ops.engon.asset_pack_update_dialog('INVOKE_DEFAULT')
         return {'FINISHED'}
@@ -1011,11 +1013,33 @@ class AssetPackUpdateDialog(bpy.types.Operator, asset_pack_installer.AssetPackIn
 MODULE_CLASSES.append(AssetPackUpdateDialog)
 
 
+@polib.log_helpers_bpy.logged_operator
+class CancelAssetPackExtraction(bpy.types.Operator):
+    bl_idname = "engon.cancel_asset_pack_extraction"
+    bl_label = "Cancel Extraction"
+    bl_description = (
+        "Stops extracting the Asset Pack, already extracted files are removed from the disk"
+    )
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        return asset_pack_installer.instance.is_extracting
+
+    def execute(self, context: bpy.types.Context) -> set["rna_enums.OperatorReturnItems"]:
+        asset_pack_installer.instance.cancel_extraction()
+        return {'FINISHED'}
+
+
+MODULE_CLASSES.append(CancelAssetPackExtraction)
+
+
 def register():
     for cls in MODULE_CLASSES:
         bpy.utils.register_class(cls)
 
 
 def unregister():
+    asset_pack_installer.instance.shutdown()
     for cls in reversed(MODULE_CLASSES):
         bpy.utils.unregister_class(cls)
@@ -5,14 +5,109 @@ import os
 import typing
 
 
+class LinkedDatablockIndex:
+    """Index of linked datablocks keyed by absolute path of their library and their name
+
+    The index of each datablock collection is built lazily on the first lookup into it. Data
+    linked later is added by 'try_get_linked_datablock' and 'load_master_collection', so repeated
+    links of already linked data cost a dictionary lookup instead of probing the libraries and
+    files on disk.
+
+    Removed datablocks and relocated libraries are detected on lookup. References to datablocks
+    aren't valid after undo or after loading another .blend, the index is cleared by handlers
+    added in 'register'.
+    """
+
+    def __init__(self):
+        # RNA identifier of datablock collection -> (library path, datablock name) ->
+        # (datablock, filepath of its library when it was indexed)
+        self._indices: dict[str, dict[tuple[str, str], tuple[bpy.types.ID, str]]] = {}
+
+    def get(
+        self,
+        datablock_collection: bpy.types.bpy_prop_collection,
+        datablock_name: str,
+        blend_path: str,
+    ) -> bpy.types.ID | None:
+        index = self._get_index(datablock_collection)
+        key = (_normalize_path(blend_path), datablock_name)
+        entry = index.get(key, None)
+        if entry is None:
+            return None
+
+        datablock, library_filepath = entry
+        try:
+            if datablock.library is not None and datablock.library.filepath == library_filepath:
+                return datablock
+        except ReferenceError:
+            # The datablock was removed
+            pass
+
+        del index[key]
+        return None
+
+    def add(
+        self,
+        datablock_collection: bpy.types.bpy_prop_collection,
+        datablock: bpy.types.ID,
+        blend_path: str,
+    ) -> None:
+        assert datablock.library is not None
+        index = self._get_index(datablock_collection)
+        index[(_normalize_path(blend_path), datablock.name)] = (
+            datablock,
+            datablock.library.filepath,
+        )
+
+    def clear(self) -> None:
+        self._indices.clear()
+
+    def _get_index(
+        self, datablock_collection: bpy.types.bpy_prop_collection
+    ) -> dict[tuple[str, str], tuple[bpy.types.ID, str]]:
+        identifier = datablock_collection.rna_type.identifier
+        index = self._indices.get(identifier, None)
+        if index is not None:
+            return index
+
+        library_paths: dict[bpy.types.Library, str] = {}
+        index = {}
+        for datablock in datablock_collection:
+            library = datablock.library
+            if library is None:
+                continue
+
+            library_path = library_paths.get(library, None)
+            if library_path is None:
+                library_path = _normalize_path(bpy.path.abspath(library.filepath))
+                library_paths[library] = library_path
+
+            index[(library_path, datablock.name)] = (datablock, library.filepath)
+
+        self._indices[identifier] = index
+        return index
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+linked_datablock_index = LinkedDatablockIndex()
+
+
 def try_get_linked_datablock(
     datablock_collection: bpy.types.bpy_prop_collection, datablock_name: str, blend_path: str
 ) -> bpy.types.ID | None:
     """Returns datablock 'datablock_name' linked from 'blend_path' or None if datablock wasn't linked yet.
 
-    Tries to find library corresponding to 'blend_path' and then checks if there's the datablock
-    'datablock_name' linked from this library.
+    Looks the datablock up in 'linked_datablock_index' first. If it isn't there, tries to find
+    library corresponding to 'blend_path' and then checks if there's the datablock
+    'datablock_name' linked from this library. Datablocks found this way are added to the index.
     """
+    datablock = linked_datablock_index.get(datablock_collection, datablock_name, blend_path)
+    if datablock is not None:
+        return datablock
+
     # Filenames longer than 63 characters are cropped in Blender
     expected_lib_name = os.path.basename(blend_path)[:63]
     # This is not 100% reliable, there can be multiple libraries with the same name, so we also
@@ -22,13 +117,16 @@ def try_get_linked_datablock(
         return None
 
     lib_path = bpy.path.abspath(library.filepath)
-    blend_path = os.path.abspath(blend_path)
     try:
-        if os.path.samefile(lib_path, blend_path):
-            return datablock_collection.get((datablock_name, library.filepath), None)
+        if not os.path.samefile(lib_path, os.path.abspath(blend_path)):
+            return None
     except OSError:
-        pass
-    return None
+        return None
+
+    datablock = datablock_collection.get((datablock_name, library.filepath), None)
+    if datablock is not None:
+        linked_datablock_index.add(datablock_collection, datablock, blend_path)
+    return datablock
 
 
 def load_master_collection(blend_path: str, link: bool = False) -> bpy.types.Collection:
@@ -51,7 +149,10 @@ def load_master_collection(blend_path: str, link: bool = False) -> bpy.types.Col
         assert asset_name in data_from.collections
         data_to.collections = [asset_name]
 
-    return data_to.collections[0]
+    collection = data_to.collections[0]
+    if link:
+        linked_datablock_index.add(bpy.data.collections, collection, blend_path)
+    return collection
 
 
 def load_material(blend_path: str, link: bool = False) -> bpy.types.Material:
@@ -157,3 +258,21 @@ def load_objects_by_name(blend_path: str, object_names: list[str]) -> list[bpy.t
             data_to.objects.append(object_name)
 
     return data_to.objects
+
+
+@bpy.app.handlers.persistent
+def _linked_datablock_index_clear_handler(*args) -> None:
+    linked_datablock_index.clear()
+
+
+def register():
+    bpy.app.handlers.load_post.append(_linked_datablock_index_clear_handler)
+    bpy.app.handlers.undo_post.append(_linked_datablock_index_clear_handler)
+    bpy.app.handlers.redo_post.append(_linked_datablock_index_clear_handler)
+
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(_linked_datablock_index_clear_handler)
+    bpy.app.handlers.undo_post.remove(_linked_datablock_index_clear_handler)
+    bpy.app.handlers.load_post.remove(_linked_datablock_index_clear_handler)
+    linked_datablock_index.clear()
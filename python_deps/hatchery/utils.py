@@ -4,6 +4,7 @@ import bpy
 import typing
 import bmesh
 import idprop
+import numpy
 from . import bounding_box
 
 # Margin for calculating viewport size of the empty object
@@ -108,14 +109,103 @@ def get_area_based_particle_count(
 
 
 def calculate_mesh_area(obj: bpy.types.Object, include_weight: bool = False) -> float:
+    """Returns area of 'obj' mesh in world space
+
+    If 'include_weight' is True, area of each face is multiplied by the average weight of its
+    vertices assigned to the active vertex group. Faces without any vertex in the group don't
+    count.
+    """
+    if obj.mode == 'EDIT':
+        # Mesh data aren't up to date in edit mode, the edit mesh is used instead
+        return _calculate_edit_mesh_area(obj, include_weight)
+
+    mesh: bpy.types.Mesh = obj.data
+    if len(mesh.polygons) == 0:
+        return 0.0
+
+    vg = obj.vertex_groups.active
+    if include_weight and vg is None:
+        return 0.0
+
+    co = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", co)
+    matrix_world = numpy.array(obj.matrix_world, dtype=numpy.float64)
+    co = co.reshape(-1, 3) @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+    loop_vertices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    # Area of each polygon is half the length of its Newell normal, same as in
+    # 'bmesh.types.BMFace.calc_area', so the results match also for non-planar polygons.
+    next_loops = numpy.arange(1, len(mesh.loops) + 1)
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+    current = co[loop_vertices]
+    following = co[loop_vertices[next_loops]]
+    difference = current - following
+    total = current + following
+    newell_terms = numpy.stack(
+        (
+            difference[:, 1] * total[:, 2],
+            difference[:, 2] * total[:, 0],
+            difference[:, 0] * total[:, 1],
+        ),
+        axis=1,
+    )
+    polygon_areas = 0.5 * numpy.linalg.norm(
+        numpy.add.reduceat(newell_terms, loop_starts, axis=0), axis=1
+    )
+    if not include_weight:
+        return float(polygon_areas.sum())
+
+    polygon_weights = _get_polygon_average_weights(mesh, vg.index, loop_vertices, loop_starts)
+    return float((polygon_areas * polygon_weights).sum())
+
+
+def _get_polygon_average_weights(
+    mesh: bpy.types.Mesh,
+    group_index: int,
+    loop_vertices: numpy.ndarray,
+    loop_starts: numpy.ndarray,
+) -> numpy.ndarray:
+    """Returns average weight of vertices of each polygon assigned to vertex group 'group_index'
+
+    Polygons without any vertex assigned to the group have zero weight.
+    """
+    # Vertex group weights are not exposed as attributes and cannot be read by 'foreach_get',
+    # this is the only loop over the vertices.
+    assigned_indices = []
+    assigned_weights = []
+    for vertex in mesh.vertices:
+        for element in vertex.groups:
+            if element.group == group_index:
+                assigned_indices.append(vertex.index)
+                assigned_weights.append(element.weight)
+                break
+
+    vertex_weights = numpy.zeros(len(mesh.vertices), dtype=numpy.float64)
+    vertex_weights[assigned_indices] = assigned_weights
+    is_assigned = numpy.zeros(len(mesh.vertices), dtype=numpy.float64)
+    is_assigned[assigned_indices] = 1.0
+
+    weight_sums = numpy.add.reduceat(vertex_weights[loop_vertices], loop_starts)
+    assigned_counts = numpy.add.reduceat(is_assigned[loop_vertices], loop_starts)
+    return numpy.divide(
+        weight_sums,
+        assigned_counts,
+        out=numpy.zeros_like(weight_sums),
+        where=assigned_counts > 0,
+    )
+
+
+def _calculate_edit_mesh_area(obj: bpy.types.Object, include_weight: bool = False) -> float:
     mesh = obj.data
     try:
-        if obj.mode == 'EDIT':
-            bm = bmesh.from_edit_mesh(mesh)
-        else:
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
-
+        # Copy, so the transform doesn't modify the edited mesh
+        bm = bmesh.from_edit_mesh(mesh).copy()
         bm.transform(obj.matrix_world)
         if include_weight:
             vg = obj.vertex_groups.active
@@ -13,10 +13,13 @@ from . import blender_asset_spawner
 from . import category
 from . import filters
 from . import file_provider
+from . import index_cache
 from . import known_metadata
 from . import local_json_provider
 from . import parameter_meta
+from . import parameter_store
 from . import query
+from . import search_index
 
 # fake bl_info so that this gets picked up by vscode blender integration
 bl_info = {
@@ -48,8 +51,11 @@ __all__ = [
     "category",
     "filters",
     "file_provider",
+    "index_cache",
     "known_metadata",
     "local_json_provider",
     "parameter_meta",
+    "parameter_store",
     "query",
+    "search_index",
 ]
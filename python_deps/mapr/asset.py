@@ -3,8 +3,9 @@
 
 import dataclasses
 import typing
-import functools
+import sys
 import collections
+import collections.abc
 from . import file_provider
 from . import asset_data
 from . import known_metadata
@@ -20,22 +21,118 @@ Tag = str
 # numeric parameters have values that can be sorted and compared - e.g. "Car Length" of 4.6 meters
 # then you can query all cars where a parameter is equal to something, in a certain range, lower
 # or higher than something, etc... For example I want a car with "Car Length" < 5 meters.
-NumericParameters = dict[str, float | int]
+NumericParameters = typing.Mapping[str, float | int]
 # vector parameters consist of same-length vector values for each parameter. Can be compared and
 # sorted. For example "released_in" > (5, 4, 0). The vector parameters can also contain
 # color parameters (RGB), sorting for those doesn't make sense, but proximity querying like (give
 # me all assets where color is close to red) does.
-VectorParameters = dict[str, tuple[float, ...] | tuple[int, ...]]
+VectorParameters = typing.Mapping[str, tuple[float, ...] | tuple[int, ...]]
 # text parameters can have values that can only be compared for equality. for example
 # "Genus" = "Abies concolor", then you can query all assets where Genus = "Abies concolor".
-TextParameters = dict[str, str]
+TextParameters = typing.Mapping[str, str]
 # location parameters are a list of tuples, each tuple is a pair of floats. The tuple represents a
 # location in 2D space. For example, "native_observations" = [(43.0, -98.4), (19.3, -70.3)].
 # contains lat/lon pairs of native plant observations.
-LocationParameters = dict[str, tuple[tuple[float, ...], ...]]
+LocationParameters = typing.Mapping[str, tuple[tuple[float, ...], ...]]
 
 
-@dataclasses.dataclass(frozen=True)
+class ParameterValues(collections.abc.Mapping):
+    """Read-only mapping of parameter names to values sharing the names with other assets
+
+    Assets of one provider mostly have the same parameters, so instead of a dictionary per asset
+    we store only a tuple of values and a 'schema' mapping parameter names to positions in the
+    tuple, that is shared by all assets with the same parameter names, see ParameterSchemas.
+    """
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: dict[str, int], values: tuple[typing.Any, ...]):
+        assert len(schema) == len(values)
+        self._schema = schema
+        self._values = values
+
+    def __getitem__(self, name: str) -> typing.Any:
+        return self._values[self._schema[name]]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._schema
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        index = self._schema.get(name, None)
+        return default if index is None else self._values[index]
+
+    def keys(self) -> collections.abc.KeysView[str]:
+        return self._schema.keys()
+
+    def values(self) -> collections.abc.ValuesView[typing.Any]:
+        return _ParameterValuesView(self)
+
+    def items(self) -> collections.abc.ItemsView[str, typing.Any]:
+        return _ParameterItemsView(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+
+class _ParameterValuesView(collections.abc.ValuesView):
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self._mapping._values)
+
+
+class _ParameterItemsView(collections.abc.ItemsView):
+    def __iter__(self) -> typing.Iterator[tuple[str, typing.Any]]:
+        return zip(self._mapping._schema, self._mapping._values)
+
+
+class ParameterSchemas:
+    """Creates ParameterValues sharing schemas and interned names among all created values
+
+    Use one instance per asset provider, the schemas are kept for the lifetime of the instance.
+    """
+
+    def __init__(self):
+        # maps tuple of parameter names to schema of ParameterValues with these names
+        self._schemas: dict[tuple[str, ...], dict[str, int]] = {}
+
+    def create(
+        self, parameters: typing.Mapping[str, typing.Any], intern_values: bool = False
+    ) -> ParameterValues:
+        """Returns ParameterValues with the same items as 'parameters'
+
+        If 'intern_values' is True, string values are interned, use it for parameters with many
+        repeated values, e.g. text parameters.
+        """
+        names = tuple(parameters)
+        schema = self._schemas.get(names, None)
+        if schema is None:
+            schema = {sys.intern(name): i for i, name in enumerate(names)}
+            self._schemas[tuple(schema)] = schema
+
+        if intern_values:
+            values = tuple(
+                sys.intern(value) if isinstance(value, str) else value
+                for value in parameters.values()
+            )
+        else:
+            values = tuple(parameters.values())
+        return ParameterValues(schema, values)
+
+
+EMPTY_PARAMETERS = ParameterValues({}, ())
+
+
+def make_tags(tags: typing.Iterable[Tag]) -> tuple[Tag, ...]:
+    """Returns deduplicated interned 'tags' in the original order, in the form Asset stores them"""
+    return tuple(sys.intern(tag) for tag in dict.fromkeys(tags))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Asset:
     """Asset represents metadata of one separated, reusable piece that can be spawned into a scene
 
@@ -46,6 +143,10 @@ class Asset:
     The mapping is Asset --- 1..N --- AssetData. One Asset can have 0 or more AssetData.
 
     Both Asset and AssetData instances are provided by the AssetProvider.
+
+    Many assets are loaded at once, so the storage is compact - the class has slots, tags are
+    a tuple and providers are expected to pass parameters as ParameterValues created by one
+    ParameterSchemas instance, so assets share the parameter names.
     """
 
     id_: AssetID = ""
@@ -54,31 +155,58 @@ class Asset:
     type_: asset_data.AssetDataType = asset_data.AssetDataType.unknown
     preview_file: file_provider.FileID | None = None
     category_path: tuple[str] | None = None
-    tags: set[Tag] = dataclasses.field(default_factory=set)
-    numeric_parameters: NumericParameters = dataclasses.field(default_factory=dict)
-    vector_parameters: VectorParameters = dataclasses.field(default_factory=dict)
-    text_parameters: TextParameters = dataclasses.field(default_factory=dict)
-    location_parameters: LocationParameters = dataclasses.field(default_factory=dict)
+    tags: tuple[Tag, ...] = ()
+    # The shared empty ParameterValues is not hashable, dataclasses allow it only from a factory
+    numeric_parameters: NumericParameters = dataclasses.field(
+        default_factory=lambda: EMPTY_PARAMETERS
+    )
+    vector_parameters: VectorParameters = dataclasses.field(
+        default_factory=lambda: EMPTY_PARAMETERS
+    )
+    text_parameters: TextParameters = dataclasses.field(default_factory=lambda: EMPTY_PARAMETERS)
+    location_parameters: LocationParameters = dataclasses.field(
+        default_factory=lambda: EMPTY_PARAMETERS
+    )
     # Search matter that's not coming from this asset
-    foreign_search_matter: dict[str, float] = dataclasses.field(default_factory=dict)
+    foreign_search_matter: typing.Mapping[str, float] = dataclasses.field(
+        default_factory=lambda: EMPTY_PARAMETERS
+    )
+    # Lazily computed 'parameters' and 'search_matter', slots can't be used with cached_property
+    _parameters: dict[str, typing.Any] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _search_matter: collections.defaultdict[str, float] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    @functools.cached_property
+    @property
     def parameters(self) -> dict[str, typing.Any]:
         """Numeric, text, vector and location parameters combined in one dictionary."""
-        return {
-            **self.numeric_parameters,
-            **self.text_parameters,
-            **self.vector_parameters,
-            **self.location_parameters,
-        }
-
-    @functools.cached_property
+        if self._parameters is None:
+            object.__setattr__(
+                self,
+                "_parameters",
+                {
+                    **self.numeric_parameters,
+                    **self.text_parameters,
+                    **self.vector_parameters,
+                    **self.location_parameters,
+                },
+            )
+        return self._parameters
+
+    @property
     def search_matter(self) -> collections.defaultdict[str, float]:
         """Return a dictionary of lowercase text searchable tokens, each mapped to its search weight
 
         Search weight 0 means excluded from search. Since tokens with weight 0 never contribute to
         the search we exclude them. We guarantee all tokens to map to weight > 0.
         """
+        if self._search_matter is None:
+            object.__setattr__(self, "_search_matter", self._compute_search_matter())
+        return self._search_matter
+
+    def _compute_search_matter(self) -> collections.defaultdict[str, float]:
         TITLE_DEFAULT_WEIGHT = 2.0
         CATEGORY_DEFAULT_WEIGHT = 2.0
         TAG_DEFAULT_WEIGHT = 1.0
@@ -154,4 +282,4 @@ class Asset:
         return ret
 
     def clear_search_matter_cache(self) -> None:
-        self.__dict__.pop("search_matter", None)
+        object.__setattr__(self, "_search_matter", None)
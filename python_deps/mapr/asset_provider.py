@@ -3,37 +3,167 @@
 
 import typing
 import abc
+import collections
 import functools
+import heapq
+import sys
+import threading
+import numpy as np
 from . import category
 from . import asset
 from . import asset_data
 from . import query
 from . import filters
 from . import parameter_meta
+from . import parameter_store
+from . import search_index
 import logging
 
 logger = logging.getLogger(f"polygoniq.{__name__}")
 
 
 class DataView:
-    """One view of data - lists of assets based on provided Query and AssetProvider."""
+    """One view of data - lists of assets based on provided Query and AssetProvider.
 
-    def __init__(self, asset_provider: 'AssetProvider', query_: query.Query):
-        assets: list[asset.Asset] = []
-        for asset_ in asset_provider.list_assets(query_.category_id, query_.recursive):
-            if all(f.filter_(asset_) for f in query_.filters):
-                assets.append(asset_)
+    If 'previous_view' is provided and the query only narrows the query of the 'previous_view',
+    only assets of the 'previous_view' are filtered instead of all assets of the provider. The
+    'previous_view' has to come from the same asset provider with the same assets!
 
-        sort_lambda, reverse = self._get_sort_parameters(query_.sort_mode)
-        assets.sort(key=lambda x: sort_lambda(x), reverse=reverse)
+    If 'cancellation_token' is cancelled during the construction, query.QueryCancelledError
+    is raised.
+    """
 
-        # Freeze the result into a tuple for the public API. This allows us to construct the
-        # internal incrementally and then pass immutable references to the AssetParametersMeta.
-        self.assets: tuple[asset.Asset, ...] = tuple(assets)
-        self.parameters_meta = parameter_meta.AssetParametersMeta(self.assets)
+    # Number of assets filtered between checks of the cancellation token
+    CANCELLATION_CHECK_INTERVAL = 1024
+
+    def __init__(
+        self,
+        asset_provider: 'AssetProvider',
+        query_: query.Query,
+        previous_view: typing.Optional['DataView'] = None,
+        cancellation_token: query.CancellationToken | None = None,
+    ):
+        if cancellation_token is None:
+            # Simplifies the checks, the token is never cancelled
+            cancellation_token = query.CancellationToken()
+
+        if (
+            previous_view is not None
+            and previous_view.used_query is not None
+            and query_.is_narrowing(previous_view.used_query)
+        ):
+            logger.debug(f"Refining assets of {previous_view}")
+            candidate_assets: typing.Iterable[asset.Asset] = previous_view._unsorted_assets
+        else:
+            previous_view = None
+            candidate_assets = asset_provider.list_assets(query_.category_id, query_.recursive)
+
+        query_filters = query_.filters
+        # Search is evaluated against the search index of the provider, only assets with
+        # a positive search score are candidates for the rest of the filters.
+        search_scores: dict[asset.AssetID, float] | None = None
+        search_filter = next(
+            (f for f in query_filters if isinstance(f, filters.SearchFilter)), None
+        )
+        if search_filter is not None and len(search_filter.needle_keywords) > 0:
+            search_scores = asset_provider.get_search_index().score(search_filter.needle_keywords)
+            filters.SEARCH_ASSET_SCORE.update(search_scores)
+            query_filters = [f for f in query_filters if f is not search_filter]
+
+        if search_scores is not None:
+            candidate_assets = [a for a in candidate_assets if a.id_ in search_scores]
+        else:
+            candidate_assets = list(candidate_assets)
+        cancellation_token.raise_if_cancelled()
+
+        # Filters that support it are evaluated on the parameter columns for all the candidates at
+        # once, the rest of the filters is evaluated per asset on candidates passing the columns.
+        store = asset_provider.get_parameter_store()
+        mask: np.ndarray | None = None
+        positions = store.get_positions(candidate_assets) if len(query_filters) > 0 else None
+        if positions is not None:
+            per_asset_filters = []
+            for filter_ in query_filters:
+                filter_mask = filter_.filter_columns(store, positions)
+                if filter_mask is None:
+                    per_asset_filters.append(filter_)
+                elif mask is None:
+                    mask = filter_mask
+                else:
+                    mask &= filter_mask
+            query_filters = per_asset_filters
+
+        cancellation_token.raise_if_cancelled()
+
+        assets: list[asset.Asset] = []
+        if mask is not None:
+            candidate_assets = [a for a, passed in zip(candidate_assets, mask) if passed]
+        for i, asset_ in enumerate(candidate_assets):
+            if i % DataView.CANCELLATION_CHECK_INTERVAL == 0:
+                cancellation_token.raise_if_cancelled()
+            if all(f.filter_(asset_) for f in query_filters):
+                assets.append(asset_)
+        cancellation_token.raise_if_cancelled()
+
+        # Assets in the order of listing from the provider, views refining this one filter these,
+        # so the sorting of equal assets is the same as if all assets were listed.
+        self._unsorted_assets: tuple[asset.Asset, ...] = tuple(assets)
+        self.asset_count = len(self._unsorted_assets)
+        # Sorting all the assets and constructing the parameters meta is postponed until they are
+        # needed, first assets can be selected without sorting all of them, see 'get_first'.
+        # The sort keys are computed right away as they depend on global search scores.
+        sort_lambda, self._sort_reverse = self._get_sort_parameters(query_.sort_mode)
+        self._sort_keys = [sort_lambda(asset_) for asset_ in self._unsorted_assets]
+        self._first_assets: tuple[asset.Asset, ...] = ()
+        self._store = store
+        previous_parameters_meta = (
+            previous_view.__dict__.get("parameters_meta", None)
+            if previous_view is not None
+            else None
+        )
+        if previous_parameters_meta is not None and self.asset_count == previous_view.asset_count:
+            # Refined view is a subset of the previous one, the same length means the same assets
+            self.parameters_meta = previous_parameters_meta
         self.used_query = query_
         logger.debug(f"Created DataView {self}")
 
+    @functools.cached_property
+    def assets(self) -> tuple[asset.Asset, ...]:
+        """All assets of the view sorted based on the query sort mode"""
+        order = sorted(
+            range(self.asset_count), key=self._sort_keys.__getitem__, reverse=self._sort_reverse
+        )
+        # Freeze the result into a tuple for the public API. This allows us to pass immutable
+        # references to the AssetParametersMeta.
+        return tuple(self._unsorted_assets[i] for i in order)
+
+    @functools.cached_property
+    def parameters_meta(self) -> parameter_meta.AssetParametersMeta:
+        return parameter_meta.AssetParametersMeta(self.assets, self._store)
+
+    def get_first(self, count: int) -> tuple[asset.Asset, ...]:
+        """Returns first 'count' assets of the view, same as 'assets[:count]'
+
+        Doesn't sort all the assets if they weren't sorted yet, selects the first ones using a heap.
+        """
+        if "assets" in self.__dict__ or count >= self.asset_count:
+            return self.assets[:count]
+
+        first_assets = self._first_assets
+        if len(first_assets) < count:
+            # heapq selection is equivalent to stable sorting and taking first 'count' items
+            select = heapq.nlargest if self._sort_reverse else heapq.nsmallest
+            order = select(count, range(self.asset_count), key=self._sort_keys.__getitem__)
+            first_assets = tuple(self._unsorted_assets[i] for i in order)
+            self._first_assets = first_assets
+
+        return first_assets[:count]
+
+    def complete(self) -> None:
+        """Sorts all assets and constructs the parameters meta if it wasn't done yet"""
+        self.assets
+        self.parameters_meta
+
     @staticmethod
     def sorted_most_relevant_key(x: asset.Asset) -> tuple[float, tuple[str] | None, str]:
         """Sort key for SORTED_MOST_RELEVANT mode: (-score, category_path, title)."""
@@ -65,7 +195,7 @@ class DataView:
     def __repr__(self) -> str:
         return (
             f"DataView at {id(self)} based on query:\n {self.used_query} "
-            f"containing {len(self.assets)} assets"
+            f"containing {self.asset_count} assets"
         )
 
     def find_asset_by_id(self, asset_id: asset.AssetID) -> tuple[int, asset.Asset]:
@@ -78,12 +208,39 @@ class DataView:
                 return index, asset
         raise ValueError(f"Asset with ID {asset_id} not found in DataView {self}")
 
+    def get_size_bytes(self) -> int:
+        """Returns estimated memory owned by this view in bytes
+
+        Assets themselves are owned by the asset provider and are not included, only the containers
+        referencing them, the sort keys and the parameter names. Sorted assets are included even if
+        they weren't sorted yet.
+        """
+        size_bytes = sys.getsizeof(self)
+        # Unsorted and sorted assets, parameters meta references the sorted ones
+        size_bytes += 2 * sys.getsizeof(self._unsorted_assets)
+        size_bytes += sys.getsizeof(self._first_assets)
+        size_bytes += sys.getsizeof(self._sort_keys)
+        if len(self._sort_keys) > 0 and not isinstance(self._sort_keys[0], str):
+            # String keys are titles owned by the assets, other keys are created for the view
+            size_bytes += len(self._sort_keys) * sys.getsizeof(self._sort_keys[0])
+        parameters_meta_ = self.__dict__.get("parameters_meta", None)
+        if parameters_meta_ is not None:
+            size_bytes += sys.getsizeof(parameters_meta_.unique_parameter_names)
+            size_bytes += sys.getsizeof(parameters_meta_.unique_tags)
+        return size_bytes
+
 
 class EmptyDataView(DataView):
     """Data view containing no data - useful on places, where DataView cannot be constructed yet."""
 
     def __init__(self):
-        self.assets: tuple[asset.Asset, ...] = ()
+        self._unsorted_assets: tuple[asset.Asset, ...] = ()
+        self.asset_count = 0
+        self._sort_reverse = False
+        self._sort_keys = []
+        self._first_assets: tuple[asset.Asset, ...] = ()
+        self._store = None
+        self.assets = ()
         self.parameters_meta = parameter_meta.AssetParametersMeta(self.assets)
         self.used_query = None
         logger.debug(f"Created EmptyDataView {self}")
@@ -153,12 +310,41 @@ class AssetProvider(abc.ABC):
         """Returns metadata of asset data with given ID"""
         pass
 
-    def query(self, query_: query.Query) -> DataView:
+    def query(
+        self,
+        query_: query.Query,
+        previous_view: DataView | None = None,
+        cancellation_token: query.CancellationToken | None = None,
+    ) -> DataView:
         """Queries the asset provider for assets based on given query
 
         This is a high level API, consider using this instead of list_assets.
+
+        'previous_view' is an optional view previously returned by this provider, if 'query_' only
+        narrows its query, the result is computed from the 'previous_view' assets.
+        Raises query.QueryCancelledError if 'cancellation_token' is cancelled during the query.
+        """
+        return DataView(self, query_, previous_view, cancellation_token)
+
+    def get_search_index(self) -> search_index.SearchIndex:
+        """Returns search index of all assets provided by this asset provider
+
+        The default implementation constructs the index on each call, providers should override
+        this and cache the index if their assets don't change.
+        """
+        return search_index.AssetSearchIndex(
+            self.list_assets(self.get_root_category_id(), recursive=True)
+        )
+
+    def get_parameter_store(self) -> parameter_store.ParameterStore:
+        """Returns parameter store of all assets provided by this asset provider
+
+        The default implementation constructs the store on each call, providers should override
+        this and cache the store if their assets don't change.
         """
-        return DataView(self, query_)
+        return parameter_store.ParameterStore(
+            self.list_assets(self.get_root_category_id(), recursive=True)
+        )
 
     def list_categories(
         self, parent_id: category.CategoryID, recursive: bool = False
@@ -236,6 +422,21 @@ class AssetProvider(abc.ABC):
                 yield asset_data_
 
 
+class AssetListing(typing.NamedTuple):
+    """Flattened listing of all assets of an asset provider
+
+    'asset_ids' are ordered the same way as 'AssetProvider.list_assets' of the root category lists
+    them - depth first, direct children of a category first. Assets of each category and its
+    descendants thus form a contiguous slice of 'asset_ids'.
+    """
+
+    asset_ids: tuple[asset.AssetID, ...]
+    # maps category ID to (start, direct children end, descendants end) indices to 'asset_ids'
+    category_slices: dict[category.CategoryID, tuple[int, int, int]]
+    # maps asset ID to the asset provider providing it
+    routing: dict[asset.AssetID, 'AssetProvider']
+
+
 class AssetProviderMultiplexer(AssetProvider):
     """Allows you to add multiple asset providers and treat them as one asset provider.
 
@@ -245,16 +446,129 @@ class AssetProviderMultiplexer(AssetProvider):
 
     def __init__(self):
         super().__init__()
+        # The list is replaced on each change, never modified in place, so the lazily constructed
+        # data below can be built from a consistent snapshot of it on the browser query thread.
         self._asset_providers: list[AssetProvider] = []
+        # Incremented on each change of the providers, data built from providers of an older
+        # generation are not stored. Guarded by '_providers_lock' together with the data.
+        self._providers_generation = 0
+        self._providers_lock = threading.Lock()
+        # Constructed lazily from search indices of the providers on first search
+        self._search_index: search_index.SearchIndexMultiplexer | None = None
+        # Constructed lazily from all provided assets on first query
+        self._parameter_store: parameter_store.ParameterStore | None = None
+        # Constructed lazily from the category trees of the providers on first listing
+        self._asset_listing: AssetListing | None = None
 
     def add_asset_provider(self, asset_provider: AssetProvider) -> None:
-        self._asset_providers.append(asset_provider)
+        self._set_asset_providers(self._asset_providers + [asset_provider])
 
     def remove_asset_provider(self, asset_provider: AssetProvider) -> None:
-        self._asset_providers.remove(asset_provider)
+        asset_providers = list(self._asset_providers)
+        asset_providers.remove(asset_provider)
+        self._set_asset_providers(asset_providers)
 
     def clear_providers(self) -> None:
-        self._asset_providers.clear()
+        self._set_asset_providers([])
+
+    def _set_asset_providers(self, asset_providers: list[AssetProvider]) -> None:
+        with self._providers_lock:
+            self._asset_providers = asset_providers
+            self._providers_generation += 1
+            self._search_index = None
+            self._parameter_store = None
+            self._asset_listing = None
+
+    def _get_providers_snapshot(self) -> tuple[int, list[AssetProvider]]:
+        with self._providers_lock:
+            return self._providers_generation, self._asset_providers
+
+    def _store_if_current(self, generation: int, attribute_name: str, value: typing.Any) -> None:
+        """Stores lazily constructed 'value' if providers didn't change since 'generation'"""
+        with self._providers_lock:
+            if generation == self._providers_generation:
+                setattr(self, attribute_name, value)
+
+    def _get_asset_listing(self) -> AssetListing:
+        asset_listing = self._asset_listing
+        if asset_listing is None:
+            generation, asset_providers = self._get_providers_snapshot()
+            asset_listing = self._create_asset_listing(asset_providers)
+            self._store_if_current(generation, "_asset_listing", asset_listing)
+        return asset_listing
+
+    def _create_asset_listing(self, asset_providers: list[AssetProvider]) -> AssetListing:
+        asset_ids: list[asset.AssetID] = []
+        category_slices: dict[category.CategoryID, tuple[int, int, int]] = {}
+        # maps asset ID to index of the last provider listing it, see 'get_asset'
+        routing_indices: dict[asset.AssetID, int] = {}
+
+        def visit(category_id: category.CategoryID) -> None:
+            existing_slice = category_slices.get(category_id, None)
+            if existing_slice is not None:
+                # Category reachable from multiple parents is listed under each of them
+                start, _, end = existing_slice
+                asset_ids.extend(asset_ids[start:end])
+                return
+
+            start = len(asset_ids)
+            child_category_ids: set[category.CategoryID] = set()
+            for i, asset_provider in enumerate(asset_providers):
+                for asset_id in asset_provider.list_child_asset_ids(category_id):
+                    asset_ids.append(asset_id)
+                    # Providers added later override, same as in 'get_asset'
+                    if routing_indices.get(asset_id, -1) < i:
+                        routing_indices[asset_id] = i
+                child_category_ids.update(asset_provider.list_child_category_ids(category_id))
+            direct_end = len(asset_ids)
+            for child_id in child_category_ids:
+                visit(child_id)
+            category_slices[category_id] = (start, direct_end, len(asset_ids))
+
+        visit(self.get_root_category_id())
+        logger.debug(
+            f"Created asset listing of {len(asset_ids)} assets in {len(category_slices)} categories"
+        )
+        routing = {asset_id: asset_providers[i] for asset_id, i in routing_indices.items()}
+        return AssetListing(tuple(asset_ids), category_slices, routing)
+
+    def list_assets(
+        self, parent_id: category.CategoryID, recursive: bool = False
+    ) -> typing.Iterable[asset.Asset]:
+        asset_listing = self._get_asset_listing()
+        category_slice = asset_listing.category_slices.get(parent_id, None)
+        if category_slice is None:
+            # Category not reachable from the root category
+            yield from super().list_assets(parent_id, recursive)
+            return
+
+        start, direct_end, end = category_slice
+        for asset_id in asset_listing.asset_ids[start : end if recursive else direct_end]:
+            asset_ = self.get_asset(asset_id)
+            if asset_ is not None:
+                yield asset_
+
+    def get_search_index(self) -> search_index.SearchIndex:
+        search_index_ = self._search_index
+        if search_index_ is None:
+            generation, asset_providers = self._get_providers_snapshot()
+            search_index_ = search_index.SearchIndexMultiplexer(
+                asset_provider.get_search_index() for asset_provider in asset_providers
+            )
+            self._store_if_current(generation, "_search_index", search_index_)
+        return search_index_
+
+    def get_parameter_store(self) -> parameter_store.ParameterStore:
+        # The store is constructed from assets resolved by this multiplexer, so the assets
+        # overridden by later providers are stored only once.
+        parameter_store_ = self._parameter_store
+        if parameter_store_ is None:
+            generation, _ = self._get_providers_snapshot()
+            parameter_store_ = super().get_parameter_store()
+            # If the providers changed during the construction, the store can contain assets of
+            # both the old and the new providers, it is not stored then.
+            self._store_if_current(generation, "_parameter_store", parameter_store_)
+        return parameter_store_
 
     def list_child_category_ids(
         self, parent_id: category.CategoryID
@@ -288,6 +602,13 @@ class AssetProviderMultiplexer(AssetProvider):
         return None
 
     def get_asset(self, asset_id: asset.AssetID) -> asset.Asset | None:
+        # We assume the asset is provided by the provider listing it in its categories
+        asset_provider = self._get_asset_listing().routing.get(asset_id, None)
+        if asset_provider is not None:
+            ret = asset_provider.get_asset(asset_id)
+            if ret is not None:
+                return ret
+
         # TODO: reversed because providers added later override, does that make sense?
         for asset_provider in reversed(self._asset_providers):
             ret = asset_provider.get_asset(asset_id)
@@ -304,33 +625,194 @@ class AssetProviderMultiplexer(AssetProvider):
         return None
 
 
+class QueryCacheStats(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+
+
+class QueryCache:
+    """LRU cache of query results bounded by estimated memory of the cached views
+
+    Views are keyed by 'Query.key'. Least recently used views are evicted when the total size
+    of cached views exceeds 'max_size_bytes'. The cache is thread-safe.
+    """
+
+    def __init__(self, max_size_bytes: int):
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        # Cached views and their sizes in the order of use, the most recently used one is last
+        self._entries: collections.OrderedDict[str, tuple[DataView, int]] = (
+            collections.OrderedDict()
+        )
+        self._size_bytes = 0
+        # Incremented on each invalidation, views computed before it are not stored
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def stats(self) -> QueryCacheStats:
+        with self._lock:
+            return QueryCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size_bytes,
+                self.max_size_bytes,
+            )
+
+    def get(self, query_: query.Query) -> DataView | None:
+        with self._lock:
+            entry = self._entries.get(query_.key, None)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(query_.key)
+            return entry[0]
+
+    def put(self, query_: query.Query, view: DataView, generation: int) -> None:
+        """Stores 'view' as result of 'query_'
+
+        'generation' is the cache generation from before the view was computed, if the cache
+        was invalidated since then, the view might be outdated and it is not stored.
+        """
+        size_bytes = view.get_size_bytes()
+        with self._lock:
+            if generation != self._generation or size_bytes > self.max_size_bytes:
+                return
+
+            previous_entry = self._entries.pop(query_.key, None)
+            if previous_entry is not None:
+                self._size_bytes -= previous_entry[1]
+            self._entries[query_.key] = (view, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self.max_size_bytes:
+                _, (_, evicted_size_bytes) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size_bytes
+                self._evictions += 1
+
+    def invalidate(self, predicate: typing.Callable[[DataView], bool]) -> int:
+        """Drops cached views for which 'predicate' returns True, returns number of dropped views"""
+        with self._lock:
+            self._generation += 1
+            entries = [(key, view) for key, (view, _) in self._entries.items()]
+
+        # The predicate can be slow, it is evaluated outside of the lock, so queries running on
+        # other threads aren't blocked by it. Views stored after the generation change above
+        # are already up to date.
+        affected_entries = [(key, view) for key, view in entries if predicate(view)]
+        dropped_count = 0
+        with self._lock:
+            for key, view in affected_entries:
+                entry = self._entries.get(key, None)
+                if entry is None or entry[0] is not view:
+                    continue
+
+                del self._entries[key]
+                self._size_bytes -= entry[1]
+                dropped_count += 1
+        return dropped_count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._size_bytes = 0
+
+
 class CachedAssetProviderMultiplexer(AssetProviderMultiplexer):
-    """Wraps the 'query' call and caches the results using LRU cache."""
+    """Wraps the 'query' call and caches the results in QueryCache.
+
+    When an asset provider is added or removed, only cached views that could contain its assets
+    are dropped.
+    """
 
-    def __init__(self, maxsize: int = 128):
+    def __init__(self, max_cache_size_bytes: int = 64 * 1024 * 1024):
         super().__init__()
-        # Create 'cached_query' method wrapped with lru_cache for each instance of the
-        # cached asset provider, that wraps the actual call to self._cached_query.
-        # The decorator version keeps hard reference to self, which may cause memory leaks
-        # when the instances are deleted.
-        # More info: https://rednafi.com/python/lru_cache_on_methods/
-        self.query = functools.lru_cache(maxsize=maxsize)(self._cached_query)
+        self.query_cache = QueryCache(max_cache_size_bytes)
 
     def add_asset_provider(self, asset_provider: AssetProvider) -> None:
         super().add_asset_provider(asset_provider)
-        self.clear_cache()
+        self._invalidate_cache_of(asset_provider)
 
     def remove_asset_provider(self, asset_provider: AssetProvider) -> None:
+        # Invalidate before removing, so the provider categories are still present in the tree
+        self._invalidate_cache_of(asset_provider)
         super().remove_asset_provider(asset_provider)
-        self.clear_cache()
 
     def clear_providers(self) -> None:
         super().clear_providers()
         self.clear_cache()
 
-    def _cached_query(self, query_: query.Query) -> DataView:
+    def query(
+        self,
+        query_: query.Query,
+        previous_view: DataView | None = None,
+        cancellation_token: query.CancellationToken | None = None,
+    ) -> DataView:
+        view = self.query_cache.get(query_)
+        if view is not None:
+            return view
+
         logger.debug(f"Cache miss for query {query_}, querying...")
-        return super().query(query_)
+        generation = self.query_cache.generation
+        view = super().query(query_, previous_view, cancellation_token)
+        self.query_cache.put(query_, view, generation)
+        return view
 
     def clear_cache(self) -> None:
-        self.query.cache_clear()
+        self.query_cache.clear()
+
+    def _invalidate_cache_of(self, asset_provider: AssetProvider) -> None:
+        """Drops cached views listing categories with assets of 'asset_provider' or its assets"""
+        # Categories where 'asset_provider' has its assets and IDs of the assets
+        asset_categories: set[category.CategoryID] = set()
+        asset_ids: set[asset.AssetID] = set()
+        category_ids = [asset_provider.get_root_category_id()]
+        while len(category_ids) > 0:
+            category_id = category_ids.pop()
+            child_asset_ids = set(asset_provider.list_child_asset_ids(category_id))
+            if len(child_asset_ids) > 0:
+                asset_categories.add(category_id)
+                asset_ids.update(child_asset_ids)
+            category_ids.extend(asset_provider.list_child_category_ids(category_id))
+
+        # Categories listing the asset categories recursively, based on the category tree of this
+        # multiplexer as other providers can place the same categories elsewhere.
+        recursive_categories: set[category.CategoryID] = set()
+
+        def visit(category_id: category.CategoryID, path: tuple[category.CategoryID, ...]) -> None:
+            path = path + (category_id,)
+            if category_id in asset_categories:
+                recursive_categories.update(path)
+            for child_id in self.list_child_category_ids(category_id):
+                visit(child_id, path)
+
+        visit(self.get_root_category_id(), ())
+
+        def is_affected(view: DataView) -> bool:
+            query_ = view.used_query
+            if query_ is None:
+                return False
+            if query_.category_id in (
+                recursive_categories if query_.recursive else asset_categories
+            ):
+                return True
+            # Views in other categories can still contain assets overridden by the provider
+            # Unsorted assets are used, so the views aren't sorted just to be dropped.
+            return any(asset_.id_ in asset_ids for asset_ in view._unsorted_assets)
+
+        invalidated_count = self.query_cache.invalidate(is_affected)
+        logger.debug(f"Invalidated {invalidated_count} cached queries of {asset_provider}")
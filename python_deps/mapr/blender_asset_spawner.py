@@ -48,23 +48,82 @@ class AssetSpawner:
         options: hatchery.spawn.DatablockSpawnOptions,
     ) -> hatchery.spawn.SpawnedData | None:
         """Tries to spawn first asset data, materializes required files and dependencies."""
-        for asset_data_ in self.asset_provider_.list_asset_data(asset_.id_):
-            path = self._materialize_files(asset_data_)
-            spawned_data = asset_data_.spawn(path, context, options)
-            for datablock in spawned_data.datablocks:
-                mark_datablock_with_ids(datablock, asset_.id_, asset_data_.id_)
+        asset_data_ = self._get_first_asset_data(asset_)
+        if asset_data_ is None:
+            return None
+
+        path = self._materialize_files(asset_data_)
+        return self._spawn_asset_data(context, asset_, asset_data_, path, options)
+
+    def spawn_batch(
+        self,
+        context: bpy.types.Context,
+        assets_options: typing.Iterable[tuple[asset.Asset, hatchery.spawn.DatablockSpawnOptions]],
+    ) -> list[hatchery.spawn.SpawnedData | None]:
+        """Spawns multiple assets, files shared by the assets are materialized only once.
 
-            return spawned_data
+        Models already linked from the same .blend are reused by 'hatchery.load'. Returns spawned
+        data in the order of 'assets_options', None for assets that couldn't be spawned.
+        Duplicate datablocks are not removed, callers should do that once after the batch.
+        """
+        materialized_files: dict[file_provider.FileID, str] = {}
+        spawned: list[hatchery.spawn.SpawnedData | None] = []
+        for asset_, options in assets_options:
+            asset_data_ = self._get_first_asset_data(asset_)
+            if asset_data_ is None:
+                spawned.append(None)
+                continue
+
+            path = self._materialize_files(asset_data_, materialized_files)
+            spawned.append(self._spawn_asset_data(context, asset_, asset_data_, path, options))
+
+        return spawned
+
+    def _get_first_asset_data(
+        self, asset_: asset.Asset
+    ) -> blender_asset_data.BlenderAssetData | None:
+        for asset_data_ in self.asset_provider_.list_asset_data(asset_.id_):
+            return asset_data_
 
         return None
 
-    def _materialize_files(self, asset_data_: blender_asset_data.BlenderAssetData) -> str:
+    def _spawn_asset_data(
+        self,
+        context: bpy.types.Context,
+        asset_: asset.Asset,
+        asset_data_: blender_asset_data.BlenderAssetData,
+        path: str,
+        options: hatchery.spawn.DatablockSpawnOptions,
+    ) -> hatchery.spawn.SpawnedData:
+        spawned_data = asset_data_.spawn(path, context, options)
+        for datablock in spawned_data.datablocks:
+            mark_datablock_with_ids(datablock, asset_.id_, asset_data_.id_)
+
+        return spawned_data
+
+    def _materialize_files(
+        self,
+        asset_data_: blender_asset_data.BlenderAssetData,
+        materialized_files: dict[file_provider.FileID, str] | None = None,
+    ) -> str:
+        """Materializes files of 'asset_data_' and returns path to its primary .blend
+
+        If 'materialized_files' is given, files already present in it are not materialized again
+        and newly materialized files are added to it.
+        """
+        if materialized_files is None:
+            materialized_files = {}
+
         # 1. Materialize dependencies
         for dep_id in asset_data_.dependency_files:
-            if dep_id == "<builtin>":
+            if dep_id == "<builtin>" or dep_id in materialized_files:
                 continue
 
-            self.file_provider_.materialize_file(dep_id)
+            materialized_files[dep_id] = self.file_provider_.materialize_file(dep_id)
 
         # 2. Materialize file
-        return self.file_provider_.materialize_file(asset_data_.primary_blend_file)
+        file_id = asset_data_.primary_blend_file
+        if file_id not in materialized_files:
+            materialized_files[file_id] = self.file_provider_.materialize_file(file_id)
+
+        return materialized_files[file_id]
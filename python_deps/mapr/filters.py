@@ -15,9 +15,11 @@ import typing
 import mathutils
 import re
 import math
+import numpy as np
 from . import asset
 from . import asset_data
 from . import parameter_meta
+from . import parameter_store
 
 
 class Filter:
@@ -34,6 +36,17 @@ class Filter:
         """
         raise NotImplementedError()
 
+    def filter_columns(
+        self, store: parameter_store.ParameterStore, positions: np.ndarray
+    ) -> np.ndarray | None:
+        """Decides which assets at 'positions' of the 'store' should be filtered, all at once.
+
+        Returns boolean mask aligned with 'positions', True for assets passing the filter. Returns
+        None if the filter can't be evaluated on the store, then 'filter_' is used for each asset.
+        The result has to be the same as if 'filter_' was called for each asset.
+        """
+        return None
+
     def as_dict(self) -> dict:
         """Returns a dict entry representing this filter - {key: filter-parameters}.
 
@@ -42,6 +55,15 @@ class Filter:
         """
         raise NotImplementedError()
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        """Returns True if filter parameters 'value' pass only assets passed by 'previous_value'
+
+        Both values are filter-parameters from the 'as_dict' representation of this filter. We
+        compare the representations and not filters themselves, as the filters can mutate.
+        By default only equal filter parameters are considered narrowing.
+        """
+        return value == previous_value
+
 
 class NumericParameterFilter(Filter):
     def __init__(self, name: str, range_start: float, range_end: float):
@@ -57,9 +79,22 @@ class NumericParameterFilter(Filter):
             self.range_start <= asset_.numeric_parameters[self.name_without_type] <= self.range_end
         )
 
+    def filter_columns(
+        self, store: parameter_store.ParameterStore, positions: np.ndarray
+    ) -> np.ndarray | None:
+        column = store.get_numeric_column(self.name_without_type)
+        if column is None:
+            return None
+
+        values = column.values[positions]
+        return column.present[positions] & (self.range_start <= values) & (values <= self.range_end)
+
     def as_dict(self) -> dict:
         return {self.name: {"min": self.range_start, "max": self.range_end}}
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        return value["min"] >= previous_value["min"] and value["max"] <= previous_value["max"]
+
 
 class TagFilter(Filter):
     def __init__(self, name: str):
@@ -89,6 +124,9 @@ class TextParameterFilter(Filter):
     def as_dict(self) -> dict:
         return {self.name: list(self.values)}
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        return set(value).issubset(previous_value)
+
 
 class VectorComparator(abc.ABC):
     @abc.abstractmethod
@@ -100,6 +138,16 @@ class VectorComparator(abc.ABC):
         """The dict representation of the comparator, has to be unique for each comparator type."""
         pass
 
+    def compare_columns(self, values: np.ndarray) -> np.ndarray | None:
+        """Compares each row of 'values' array, returns None if it can't be done on the array"""
+        return None
+
+    def is_narrowing(self, value: dict, previous_value: dict) -> bool:
+        """Returns True if comparator represented by 'value' passes only values passed by
+        'previous_value', both are 'as_dict' representations of this comparator type.
+        """
+        return value == previous_value
+
 
 DistanceFunction = typing.Callable[[mathutils.Vector, mathutils.Vector], float]
 NamedDistanceFunction = tuple[DistanceFunction, str]
@@ -142,6 +190,13 @@ class VectorDistanceComparator(VectorComparator):
             "function": self.distance_function_name,
         }
 
+    def is_narrowing(self, value: dict, previous_value: dict) -> bool:
+        return (
+            value.get("value") == previous_value.get("value")
+            and value.get("function") == previous_value.get("function")
+            and value.get("distance", math.inf) <= previous_value.get("distance", -math.inf)
+        )
+
     @staticmethod
     def _euclidean_distance(a: mathutils.Vector, b: mathutils.Vector) -> float:
         return (a - b).length
@@ -157,9 +212,30 @@ class VectorLexicographicComparator(VectorComparator):
     def compare(self, value: mathutils.Vector) -> bool:
         return tuple(self.min_) <= tuple(value) <= tuple(self.max_)
 
+    def compare_columns(self, values: np.ndarray) -> np.ndarray | None:
+        length = values.shape[1]
+        if not len(self.min_) == len(self.max_) == length:
+            return None
+
+        min_ = np.array(tuple(self.min_), dtype=np.float64)
+        max_ = np.array(tuple(self.max_), dtype=np.float64)
+        # Same as tuple comparison - the first different component decides, equal rows pass
+        above_min = np.ones(len(values), dtype=bool)
+        below_max = np.ones(len(values), dtype=bool)
+        for i in reversed(range(length)):
+            component = values[:, i]
+            above_min = (component > min_[i]) | ((component == min_[i]) & above_min)
+            below_max = (component < max_[i]) | ((component == max_[i]) & below_max)
+        return above_min & below_max
+
     def as_dict(self) -> dict:
         return {"min": tuple(self.min_), "max": tuple(self.max_), "method": "lexicographic"}
 
+    def is_narrowing(self, value: dict, previous_value: dict) -> bool:
+        if value.get("method") != previous_value.get("method"):
+            return False
+        return value["min"] >= previous_value["min"] and value["max"] <= previous_value["max"]
+
 
 class VectorComponentWiseComparator(VectorComparator):
     """Compares vectors component-wise - each component separately, the min_ and max_ are inclusive"""
@@ -179,9 +255,29 @@ class VectorComponentWiseComparator(VectorComparator):
 
         return True
 
+    def compare_columns(self, values: np.ndarray) -> np.ndarray | None:
+        if not len(self.min_) == len(self.max_) == values.shape[1]:
+            return None
+
+        min_ = np.array(tuple(self.min_), dtype=np.float64)
+        max_ = np.array(tuple(self.max_), dtype=np.float64)
+        return np.all((min_ <= values) & (values <= max_), axis=1)
+
     def as_dict(self) -> dict:
         return {"min": tuple(self.min_), "max": tuple(self.max_), "method": "component-wise"}
 
+    def is_narrowing(self, value: dict, previous_value: dict) -> bool:
+        if value.get("method") != previous_value.get("method"):
+            return False
+        if not len(value["min"]) == len(value["max"]) == len(previous_value["min"]):
+            return False
+        return all(
+            new_min >= previous_min and new_max <= previous_max
+            for new_min, new_max, previous_min, previous_max in zip(
+                value["min"], value["max"], previous_value["min"], previous_value["max"]
+            )
+        )
+
 
 class MapProjection(abc.ABC):
     """Projects from latitude and longitude to XY coordinates on a fixed-sized grid"""
@@ -288,6 +384,14 @@ class LocationParameterFilter(Filter):
     def as_dict(self) -> dict:
         return {self.name: self.selected_tiles}
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        # Narrowing if no new tile was selected
+        return all(
+            not selected or previous_selected
+            for row, previous_row in zip(value, previous_value)
+            for selected, previous_selected in zip(row, previous_row)
+        )
+
 
 class VectorParameterFilter(Filter):
     def __init__(
@@ -305,9 +409,32 @@ class VectorParameterFilter(Filter):
 
         return self.comparator.compare(mathutils.Vector(value))
 
+    def filter_columns(
+        self, store: parameter_store.ParameterStore, positions: np.ndarray
+    ) -> np.ndarray | None:
+        column = store.get_vector_column(self.name_without_type)
+        if column is None:
+            return None
+
+        present = column.present[positions]
+        if not present.any():
+            return present
+
+        # mathutils.Vector stores single precision floats, round the values the same way
+        # as 'filter_' does before comparing.
+        values = column.values[positions].astype(np.float32).astype(np.float64)
+        mask = self.comparator.compare_columns(values)
+        if mask is None:
+            return None
+
+        return present & mask
+
     def as_dict(self) -> dict:
         return {self.name: self.comparator.as_dict()}
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        return self.comparator.is_narrowing(value, previous_value)
+
 
 class AssetTypesFilter(Filter):
     def __init__(
@@ -343,6 +470,13 @@ class AssetTypesFilter(Filter):
     def as_dict(self) -> dict:
         return {self.name: self._all}
 
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        # Narrowing if no new asset type was enabled
+        return all(
+            not enabled or previously_enabled
+            for enabled, previously_enabled in zip(value, previous_value)
+        )
+
     @property
     def _all(self) -> tuple:
         return (
@@ -363,156 +497,202 @@ class MatchCount(typing.NamedTuple):
     weight: float
 
 
+class KeywordMatch(typing.NamedTuple):
+    """Match of one needle keyword against an asset"""
+
+    # Score the keyword contributes to the maximal relevancy score of the asset
+    relevancy_score: float
+    # Score the keyword contributes to the weight of the subsequent and multiple matches
+    affix_score: float
+
+
 class SearchFilter(Filter):
+    REQUIRED_EXACT_MATCH_COEFFICIENT = 10.0
+    EXACT_MATCH_COEFFICIENT = 5.0
+    PREFIX_MATCH_COEFFICIENT = 3.0
+    INFIX_MATCH_COEFFICIENT = 2.0
+    SUFFIX_MATCH_COEFFICIENT = 2.0
+
+    MATCH_ORDER_COEFFICIENT = 1.0
+
+    SUBSEQUENT_MATCH_COEFFICIENT = 5.0
+    MULTIPLE_MATCH_COEFFICIENT = 1.0
+
+    # Quoted keywords contribute the required exact match score, but don't add to the weight of
+    # subsequent or multiple matches.
+    EXACT_KEYWORD_MATCH = KeywordMatch(REQUIRED_EXACT_MATCH_COEFFICIENT, 0.0)
+
     def __init__(self, search: str):
         super().__init__("builtin:search")
         self.search = search
         self.needle_keywords = SearchFilter.keywords_from_search(search)
 
     def filter_(self, asset_: asset.Asset) -> bool:
-        REQUIRED_EXACT_MATCH_COEFFICIENT = 10.0
-        EXACT_MATCH_COEFFICIENT = 5.0
-        PREFIX_MATCH_COEFFICIENT = 3.0
-        INFIX_MATCH_COEFFICIENT = 2.0
-        SUFFIX_MATCH_COEFFICIENT = 2.0
-
-        MATCH_ORDER_COEFFICIENT = 1.0
-
-        SUBSEQUENT_MATCH_COEFFICIENT = 5.0
-        MULTIPLE_MATCH_COEFFICIENT = 1.0
-
-        def get_affix_score(
-            needle_keyword: str,
-            needle_keyword_index: int,
-            haystack_keyword: str,
-            haystack_keyword_weight: float,
-        ) -> float:
-            affix_score = 0.0
-            index = haystack_keyword.find(needle_keyword)
-            if index == -1:
-                # no match
-                return affix_score
-            if index == 0 and len(haystack_keyword) == len(needle_keyword):
-                # bump exact matches even if exact match not requested
-                affix_score = EXACT_MATCH_COEFFICIENT * haystack_keyword_weight
-            elif index == 0:
-                # prefix match
-                affix_score = PREFIX_MATCH_COEFFICIENT * haystack_keyword_weight
-            elif index < len(haystack_keyword) - len(needle_keyword):
-                # infix match
-                affix_score = INFIX_MATCH_COEFFICIENT * haystack_keyword_weight
-            else:
-                # suffix match
-                affix_score = SUFFIX_MATCH_COEFFICIENT * haystack_keyword_weight
-
-            if affix_score > 0.0:
-                # Boost score based on needle keyword order - earlier keywords are more relevant
-                affix_score += (
-                    MATCH_ORDER_COEFFICIENT
-                    * (len(self.needle_keywords) - needle_keyword_index)
-                    / len(self.needle_keywords)
-                )
-            return affix_score
-
-        def get_multiplicity_score(
-            subsequent_match: MatchCount, multiple_match: MatchCount
-        ) -> float:
-            """Computes multiplicity score based on subsequent and multiple matches.
-
-            The scores take into account both the count and the weight of matches. The weight comes
-            from the sum of affix scores meaning exact matches weight more than prefix, etc...
-            """
-            multiplicity_score = 1.0
-            weighted_subsequent_match = subsequent_match.match_count + subsequent_match.weight / 10
-            weighted_multiple_match = multiple_match.match_count + multiple_match.weight / 10
-            if weighted_subsequent_match <= 1 and weighted_multiple_match <= 1:
-                return multiplicity_score
-            if weighted_subsequent_match >= weighted_multiple_match:
-                multiplicity_score = SUBSEQUENT_MATCH_COEFFICIENT * weighted_subsequent_match
-            else:
-                multiplicity_score = MULTIPLE_MATCH_COEFFICIENT * weighted_multiple_match
-            return multiplicity_score
-
-        def get_exact_match_score(needle_keyword: str, asset_: asset.Asset) -> float:
-            haystack_keywords = list(asset_.search_matter.keys())
-            needle_keyword_trimmed = needle_keyword[1:-1]
-            if needle_keyword_trimmed in haystack_keywords:
-                return REQUIRED_EXACT_MATCH_COEFFICIENT
-
-            needle_keywords = needle_keyword_trimmed.split(' ')
-            needle_index = next(
-                (i for i, kw in enumerate(haystack_keywords) if kw == needle_keywords[0]), -1
-            )
-            if needle_index == -1:
-                return 0.0
-            for keyword in needle_keywords[1:]:
-                needle_index += 1
-                if (
-                    needle_index >= len(haystack_keywords)
-                    or haystack_keywords[needle_index] != keyword
-                ):
-                    return 0.0
-            return REQUIRED_EXACT_MATCH_COEFFICIENT
-
         # we make sure all needle keywords are present in given haystack for the haystack not to be
         # filtered
 
         if len(self.needle_keywords) == 0:
             return True
 
-        max_relevancy_score = 0.0
-        # represent (count, weighted_sum) as tuples to keep integer counts pure
-        multiple_match = MatchCount(0, 0.0)
-        subsequent_match = MatchCount(0, 0.0)
-        max_subsequent_match = MatchCount(0, 0.0)
-
+        keyword_matches: list[KeywordMatch | None] = []
         for i, needle_keyword in enumerate(self.needle_keywords):
-            affix_score = 0.0
-            match_flag = False
-            require_exact_match = needle_keyword.startswith('"') and needle_keyword.endswith('"')
-
-            if require_exact_match:
-                exact_match_score = get_exact_match_score(needle_keyword, asset_)
-                if exact_match_score == 0.0:
+            if SearchFilter.is_exact_match_keyword(needle_keyword):
+                if not SearchFilter.is_exact_match(needle_keyword, asset_):
                     # exclude results which do not contain keywords in quotation marks (even if other keywords would match)
                     SEARCH_ASSET_SCORE[asset_.id_] = 0.0
                     return False
-                max_relevancy_score = max(max_relevancy_score, exact_match_score)
-                match_flag = max_relevancy_score > 0.0
-            else:
-                for haystack_keyword, haystack_keyword_weight in asset_.search_matter.items():
-                    relevancy_score = 0.0
-                    # this is guaranteed by the API
-                    assert haystack_keyword_weight > 0.0
-                    relevancy_score = get_affix_score(
+                keyword_matches.append(SearchFilter.EXACT_KEYWORD_MATCH)
+                continue
+
+            affix_score = 0.0
+            for haystack_keyword, haystack_keyword_weight in asset_.search_matter.items():
+                # this is guaranteed by the API
+                assert haystack_keyword_weight > 0.0
+                affix_score = max(
+                    affix_score,
+                    SearchFilter.get_affix_score(
                         needle_keyword,
                         i,
+                        len(self.needle_keywords),
                         haystack_keyword,
                         haystack_keyword_weight,
-                    )
-
-                    match_flag = relevancy_score > 0.0 or match_flag
-                    affix_score = max(affix_score, relevancy_score)
-                    max_relevancy_score = max(max_relevancy_score, relevancy_score)
-
-            if match_flag:
-                subsequent_match = MatchCount(
-                    subsequent_match.match_count + 1, subsequent_match.weight + affix_score
-                )
-                multiple_match = MatchCount(
-                    multiple_match.match_count + 1, multiple_match.weight + affix_score
+                    ),
                 )
-                max_subsequent_match = max(
-                    max_subsequent_match, subsequent_match, key=lambda x: x.match_count
-                )
-            else:
-                subsequent_match = MatchCount(0, 0.0)
 
-        max_relevancy_score *= get_multiplicity_score(max_subsequent_match, multiple_match)
+            keyword_matches.append(
+                KeywordMatch(affix_score, affix_score) if affix_score > 0.0 else None
+            )
 
+        max_relevancy_score = SearchFilter.get_relevancy_score(keyword_matches)
         SEARCH_ASSET_SCORE[asset_.id_] = max_relevancy_score
         return max_relevancy_score > 0.0
 
+    @staticmethod
+    def get_affix_coefficient(needle_keyword: str, haystack_keyword: str) -> float:
+        """Returns coefficient of the affix match of 'needle_keyword' in 'haystack_keyword'
+
+        Returns 0.0 if the 'haystack_keyword' doesn't contain the 'needle_keyword'.
+        """
+        index = haystack_keyword.find(needle_keyword)
+        if index == -1:
+            # no match
+            return 0.0
+        if index == 0 and len(haystack_keyword) == len(needle_keyword):
+            # bump exact matches even if exact match not requested
+            return SearchFilter.EXACT_MATCH_COEFFICIENT
+        elif index == 0:
+            # prefix match
+            return SearchFilter.PREFIX_MATCH_COEFFICIENT
+        elif index < len(haystack_keyword) - len(needle_keyword):
+            # infix match
+            return SearchFilter.INFIX_MATCH_COEFFICIENT
+        else:
+            # suffix match
+            return SearchFilter.SUFFIX_MATCH_COEFFICIENT
+
+    @staticmethod
+    def get_affix_score(
+        needle_keyword: str,
+        needle_keyword_index: int,
+        needle_keyword_count: int,
+        haystack_keyword: str,
+        haystack_keyword_weight: float,
+    ) -> float:
+        affix_score = (
+            SearchFilter.get_affix_coefficient(needle_keyword, haystack_keyword)
+            * haystack_keyword_weight
+        )
+        if affix_score > 0.0:
+            # Boost score based on needle keyword order - earlier keywords are more relevant
+            affix_score += (
+                SearchFilter.MATCH_ORDER_COEFFICIENT
+                * (needle_keyword_count - needle_keyword_index)
+                / needle_keyword_count
+            )
+        return affix_score
+
+    @staticmethod
+    def is_exact_match_keyword(needle_keyword: str) -> bool:
+        """Returns True if 'needle_keyword' is in quotation marks and requires an exact match"""
+        return needle_keyword.startswith('"') and needle_keyword.endswith('"')
+
+    @staticmethod
+    def is_exact_match(needle_keyword: str, asset_: asset.Asset) -> bool:
+        """Returns True if the asset contains the quoted 'needle_keyword' exactly
+
+        Either as one haystack keyword or as subsequent haystack keywords, one for each word.
+        """
+        haystack_keywords = list(asset_.search_matter.keys())
+        needle_keyword_trimmed = needle_keyword[1:-1]
+        if needle_keyword_trimmed in haystack_keywords:
+            return True
+
+        needle_keywords = needle_keyword_trimmed.split(' ')
+        needle_index = next(
+            (i for i, kw in enumerate(haystack_keywords) if kw == needle_keywords[0]), -1
+        )
+        if needle_index == -1:
+            return False
+        for keyword in needle_keywords[1:]:
+            needle_index += 1
+            if needle_index >= len(haystack_keywords) or haystack_keywords[needle_index] != keyword:
+                return False
+        return True
+
+    @staticmethod
+    def get_multiplicity_score(subsequent_match: MatchCount, multiple_match: MatchCount) -> float:
+        """Computes multiplicity score based on subsequent and multiple matches.
+
+        The scores take into account both the count and the weight of matches. The weight comes
+        from the sum of affix scores meaning exact matches weight more than prefix, etc...
+        """
+        multiplicity_score = 1.0
+        weighted_subsequent_match = subsequent_match.match_count + subsequent_match.weight / 10
+        weighted_multiple_match = multiple_match.match_count + multiple_match.weight / 10
+        if weighted_subsequent_match <= 1 and weighted_multiple_match <= 1:
+            return multiplicity_score
+        if weighted_subsequent_match >= weighted_multiple_match:
+            multiplicity_score = (
+                SearchFilter.SUBSEQUENT_MATCH_COEFFICIENT * weighted_subsequent_match
+            )
+        else:
+            multiplicity_score = SearchFilter.MULTIPLE_MATCH_COEFFICIENT * weighted_multiple_match
+        return multiplicity_score
+
+    @staticmethod
+    def get_relevancy_score(keyword_matches: typing.Sequence['KeywordMatch | None']) -> float:
+        """Combines matches of individual needle keywords into the final relevancy score
+
+        'keyword_matches' contain one entry for each needle keyword in the order of the needle
+        keywords, None if the keyword didn't match the asset.
+        """
+        max_relevancy_score = 0.0
+        # represent (count, weighted_sum) as tuples to keep integer counts pure
+        multiple_match = MatchCount(0, 0.0)
+        subsequent_match = MatchCount(0, 0.0)
+        max_subsequent_match = MatchCount(0, 0.0)
+
+        for keyword_match in keyword_matches:
+            if keyword_match is None:
+                subsequent_match = MatchCount(0, 0.0)
+                continue
+
+            max_relevancy_score = max(max_relevancy_score, keyword_match.relevancy_score)
+            subsequent_match = MatchCount(
+                subsequent_match.match_count + 1,
+                subsequent_match.weight + keyword_match.affix_score,
+            )
+            multiple_match = MatchCount(
+                multiple_match.match_count + 1, multiple_match.weight + keyword_match.affix_score
+            )
+            max_subsequent_match = max(
+                max_subsequent_match, subsequent_match, key=lambda x: x.match_count
+            )
+
+        return max_relevancy_score * SearchFilter.get_multiplicity_score(
+            max_subsequent_match, multiple_match
+        )
+
     @staticmethod
     @functools.lru_cache(maxsize=128)
     def keywords_from_search(search: str) -> list[str]:
@@ -536,3 +716,30 @@ class SearchFilter(Filter):
 
     def as_dict(self) -> dict:
         return {self.name: self.search}
+
+    def is_narrowing(self, value: typing.Any, previous_value: typing.Any) -> bool:
+        needle_keywords = SearchFilter.keywords_from_search(value)
+        previous_needle_keywords = SearchFilter.keywords_from_search(previous_value)
+        if len(previous_needle_keywords) == 0:
+            return True
+        if len(needle_keywords) == 0:
+            return False
+
+        quoted = {kw for kw in needle_keywords if SearchFilter.is_exact_match_keyword(kw)}
+        previous_quoted = {
+            kw for kw in previous_needle_keywords if SearchFilter.is_exact_match_keyword(kw)
+        }
+        if len(previous_quoted) > 0:
+            # Previous results contained exactly the assets matching all the quoted keywords,
+            # the new results are narrower if they require at least the same quoted keywords.
+            return previous_quoted.issubset(quoted)
+
+        if len(quoted) > 0:
+            return False
+
+        # Asset passes if it matches any of the keywords. If each keyword contains one of the
+        # previous keywords, it can only match assets which the previous keyword matched.
+        return all(
+            any(previous_kw in kw for previous_kw in previous_needle_keywords)
+            for kw in needle_keywords
+        )
@@ -0,0 +1,233 @@
+#!/usr/bin/python3
+# copyright (c) 2018- polygoniq xyz s.r.o.
+
+# On-disk cache of parsed MAPR index JSONs. Parsing large index JSONs on each start is slow, so
+# after the first parse the index is stored in a binary file that is memory-mapped on the next
+# load. Everything except asset metadata is decoded right away, metadata of each asset are stored
+# as a separate record and decoded only when the asset is accessed.
+#
+# Layout of the cache file (all integers are little-endian):
+# - magic, length of the cache key
+# - cache key - source index path, its mtime and size and versions of the cache writer
+# - length of the header, header - index JSON without asset metadata and list of asset IDs
+# - record table - (offset, length) of asset metadata record for each asset ID in the header
+# - asset metadata records
+#
+# Name of the cache file is derived from the cache key, a changed index is cached into a new file.
+# The previous file might still be memory-mapped by a provider and mapped files can't be replaced
+# on Windows. Cache files of changed or removed indices are removed by IndexCache.prune.
+
+import collections.abc
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import typing
+import logging
+
+logger = logging.getLogger(f"polygoniq.{__name__}")
+
+
+# Bump this whenever the layout of the cache file changes
+FORMAT_VERSION = 1
+MAGIC = b"MAPRIDXC"
+PREAMBLE = struct.Struct("<8sQ")
+LENGTH = struct.Struct("<Q")
+RECORD = struct.Struct("<QQ")
+CACHE_FILE_EXTENSION = ".mapr_cache"
+# Cache files of indices that are not loaded are removed only after this many seconds without use,
+# other running instances might still use them
+UNUSED_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+class CachedAssetMetadata(collections.abc.Mapping):
+    """Maps asset IDs to their metadata JSON, decoding them from the cache file on access"""
+
+    def __init__(self, buffer: mmap.mmap, asset_ids: list[str], record_table_offset: int):
+        self._buffer = buffer
+        self._positions = {asset_id: i for i, asset_id in enumerate(asset_ids)}
+        self._record_table_offset = record_table_offset
+
+    def __getitem__(self, asset_id: str) -> dict[str, typing.Any]:
+        position = self._positions[asset_id]
+        offset, length = RECORD.unpack_from(
+            self._buffer, self._record_table_offset + position * RECORD.size
+        )
+        # Each access returns a new dictionary, callers are free to mutate it
+        return marshal.loads(self._buffer[offset : offset + length])
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class IndexCache:
+    """Stores parsed MAPR index JSONs in 'folder_path', one cache file per index file
+
+    'version' is part of the cache key, use version of the application, so the caches written by
+    different versions of the loading code are never mixed.
+    """
+
+    def __init__(self, folder_path: str, version: str):
+        self.folder_path = folder_path
+        self.version = version
+
+    def load(
+        self, index_file_path: str
+    ) -> tuple[dict[str, typing.Any], typing.Mapping[str, dict[str, typing.Any]]]:
+        """Loads index JSON from 'index_file_path', using the cache if it is valid
+
+        Returns tuple of index JSON without 'asset_metadata' and mapping of asset ID to its
+        metadata JSON. If the cache is not valid, the index JSON is parsed and stored into
+        the cache.
+        """
+        key = self._get_key(index_file_path)
+        cache_file_path = self._get_cache_file_path(key)
+        cached = self._read(cache_file_path, key)
+        if cached is not None:
+            logger.debug(f"Loaded index '{index_file_path}' from cache '{cache_file_path}'")
+            try:
+                # Modification time tells 'prune' when the cache was used the last time
+                os.utime(cache_file_path)
+            except OSError:
+                pass
+            return cached
+
+        with open(index_file_path) as f:
+            index_json = json.load(f)
+
+        asset_metadata = index_json.pop("asset_metadata", {})
+        try:
+            self._write(cache_file_path, key, index_json, asset_metadata)
+            logger.debug(f"Stored index '{index_file_path}' to cache '{cache_file_path}'")
+        except Exception:
+            logger.exception(f"Failed to store index '{index_file_path}' to cache")
+
+        return index_json, asset_metadata
+
+    def _get_key(self, index_file_path: str) -> tuple:
+        stat = os.stat(index_file_path)
+        return (
+            os.path.realpath(index_file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.version,
+            FORMAT_VERSION,
+            marshal.version,
+            tuple(sys.version_info[:2]),
+        )
+
+    def prune(self, index_file_paths: typing.Iterable[str]) -> None:
+        """Removes cache files except the current caches of 'index_file_paths'
+
+        Outdated caches of 'index_file_paths' are removed right away, caches of other indices
+        only if they weren't used for UNUSED_CACHE_MAX_AGE. Files that can't be removed, e.g.
+        because they are still mapped on Windows, are skipped and removed by a later call.
+        """
+        current_file_names: set[str] = set()
+        for index_file_path in index_file_paths:
+            try:
+                key = self._get_key(index_file_path)
+            except OSError:
+                continue
+            current_file_names.add(os.path.basename(self._get_cache_file_path(key)))
+        current_path_hashes = {file_name.split("_")[0] for file_name in current_file_names}
+
+        try:
+            file_names = os.listdir(self.folder_path)
+        except OSError:
+            return
+
+        min_mtime = time.time() - UNUSED_CACHE_MAX_AGE
+        for file_name in file_names:
+            if not file_name.endswith(CACHE_FILE_EXTENSION) or file_name in current_file_names:
+                continue
+            cache_file_path = os.path.join(self.folder_path, file_name)
+            try:
+                if (
+                    file_name.split("_")[0] in current_path_hashes
+                    or os.path.getmtime(cache_file_path) < min_mtime
+                ):
+                    os.remove(cache_file_path)
+                    logger.debug(f"Removed stale index cache '{cache_file_path}'")
+            except OSError as e:
+                logger.debug(f"Failed to remove stale index cache '{cache_file_path}': {e}")
+
+    def _get_cache_file_path(self, key: tuple) -> str:
+        path_hash = hashlib.sha1(key[0].encode("utf-8")).hexdigest()
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.folder_path, f"{path_hash}_{key_hash}{CACHE_FILE_EXTENSION}")
+
+    def _read(
+        self, cache_file_path: str, key: tuple
+    ) -> tuple[dict[str, typing.Any], CachedAssetMetadata] | None:
+        if not os.path.isfile(cache_file_path):
+            return None
+
+        try:
+            with open(cache_file_path, "rb") as f:
+                # The mapping stays valid after the file is closed
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, key_length = PREAMBLE.unpack_from(buffer, 0)
+            if magic != MAGIC:
+                logger.warning(f"Cache file '{cache_file_path}' is not a valid index cache")
+                buffer.close()
+                return None
+
+            offset = PREAMBLE.size
+            cached_key = marshal.loads(buffer[offset : offset + key_length])
+            if cached_key != key:
+                logger.debug(f"Cache file '{cache_file_path}' is outdated")
+                buffer.close()
+                return None
+
+            offset += key_length
+            (header_length,) = LENGTH.unpack_from(buffer, offset)
+            offset += LENGTH.size
+            index_json, asset_ids = marshal.loads(buffer[offset : offset + header_length])
+            offset += header_length
+            return index_json, CachedAssetMetadata(buffer, asset_ids, offset)
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            logger.exception(f"Failed to read index cache '{cache_file_path}'")
+            return None
+
+    def _write(
+        self,
+        cache_file_path: str,
+        key: tuple,
+        index_json: dict[str, typing.Any],
+        asset_metadata: dict[str, dict[str, typing.Any]],
+    ) -> None:
+        asset_ids = list(asset_metadata)
+        key_data = marshal.dumps(key)
+        header_data = marshal.dumps((index_json, asset_ids))
+        records = [marshal.dumps(asset_metadata[asset_id]) for asset_id in asset_ids]
+
+        os.makedirs(self.folder_path, exist_ok=True)
+        # Write to a temporary file first, so other instances never read a partially written file.
+        # Caches can be written from multiple threads, the temporary file has to be unique.
+        temp_file_path = f"{cache_file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_file_path, "wb") as f:
+                f.write(PREAMBLE.pack(MAGIC, len(key_data)))
+                f.write(key_data)
+                f.write(LENGTH.pack(len(header_data)))
+                f.write(header_data)
+                offset = f.tell() + len(records) * RECORD.size
+                for record in records:
+                    f.write(RECORD.pack(offset, len(record)))
+                    offset += len(record)
+                for record in records:
+                    f.write(record)
+            os.replace(temp_file_path, cache_file_path)
+        finally:
+            if os.path.isfile(temp_file_path):
+                os.remove(temp_file_path)
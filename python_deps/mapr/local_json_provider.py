@@ -3,8 +3,12 @@
 
 import typing
 import os
+import sys
 import json
 import collections
+import collections.abc
+import functools
+import threading
 from . import category
 from . import asset
 from . import asset_data
@@ -12,11 +16,69 @@ from . import blender_asset_data
 from . import file_provider
 from . import asset_provider
 from . import country_locations
+from . import index_cache
+from . import parameter_store
+from . import search_index
 import logging
 
 logger = logging.getLogger(f"polygoniq.{__name__}")
 
 
+class LazyAssets(collections.abc.Mapping):
+    """Maps asset IDs to assets, creating each asset from its metadata JSON on first access
+
+    Assets that fail to be created are logged and skipped, as if they weren't in the metadata.
+    Such assets are known only after first access, until then they are counted in the length.
+    Creation is guarded by a lock, so each asset is created once even if accessed from the
+    browser query thread and the main thread at the same time.
+    """
+
+    def __init__(
+        self,
+        asset_metadata: typing.Mapping[asset.AssetID, dict[str, typing.Any]],
+        create_asset: typing.Callable[[asset.AssetID, dict[str, typing.Any]], asset.Asset | None],
+    ):
+        self._asset_metadata = asset_metadata
+        self._create_asset = create_asset
+        self._assets: dict[asset.AssetID, asset.Asset] = {}
+        self._invalid_asset_ids: set[asset.AssetID] = set()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, asset_id: asset.AssetID) -> asset.Asset:
+        asset_ = self._assets.get(asset_id, None)
+        if asset_ is not None:
+            return asset_
+
+        with self._lock:
+            asset_ = self._assets.get(asset_id, None)
+            if asset_ is not None:
+                return asset_
+            if asset_id in self._invalid_asset_ids:
+                raise KeyError(asset_id)
+
+            asset_ = self._create_asset(asset_id, self._asset_metadata[asset_id])
+            if asset_ is None:
+                self._invalid_asset_ids.add(asset_id)
+                raise KeyError(asset_id)
+
+            self._assets[asset_id] = asset_
+            return asset_
+
+    def __iter__(self) -> typing.Iterator[asset.AssetID]:
+        for asset_id in self._asset_metadata:
+            if asset_id not in self._invalid_asset_ids:
+                yield asset_id
+
+    def __len__(self) -> int:
+        return len(self._asset_metadata) - len(self._invalid_asset_ids)
+
+    def values(self) -> typing.Iterator[asset.Asset]:  # type: ignore[override]
+        for asset_id in self._asset_metadata:
+            asset_ = self.get(asset_id, None)
+            if asset_ is not None:
+                yield asset_
+
+
 class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider):
     def __init__(
         self,
@@ -24,6 +86,7 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
         file_id_folder_path: str,
         file_id_prefix: str,
         index_json_override: dict | None = None,
+        index_cache: index_cache.IndexCache | None = None,
     ):
         """Dual purpose asset and file provider, index is loaded from JSON, all files from disk
 
@@ -33,6 +96,7 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
         file_id_prefix: all files provided with this providers have to have an ID starting with
                         this prefix
         index_json_override: optional dictionary to override the index JSON with, useful for testing
+        index_cache: optional cache of parsed index JSONs, the index is loaded from it if valid
         """
 
         self.index_file_path = index_file_path
@@ -40,6 +104,7 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
         self.file_id_prefix = file_id_prefix
 
         self.index_json_override = index_json_override
+        self.index_cache = index_cache
 
         # maps category ID to IDs of its child categories
         self.child_categories: collections.defaultdict[
@@ -58,11 +123,13 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
         # maps category ID to its metadata
         self.categories: dict[category.CategoryID, category.Category] = {}
         # maps asset ID to its metadata
-        self.assets: dict[asset.AssetID, asset.Asset] = {}
+        self.assets: typing.Mapping[asset.AssetID, asset.Asset] = {}
         # maps asset data ID to its data
         self.asset_data: dict[asset_data.AssetDataID, asset_data.AssetData] = {}
         # maps datablock basename to its FileID
         self.basenames_to_file_ids: dict[str, file_provider.FileID] = {}
+        # parameter names shared by assets of this provider
+        self._parameter_schemas = asset.ParameterSchemas()
 
         self.load_index()
 
@@ -97,11 +164,17 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
 
     def load_index(self):
         index_json = {}
-        if self.index_json_override is None:
+        asset_metadata: typing.Mapping[asset.AssetID, dict[str, typing.Any]] = {}
+        if self.index_json_override is not None:
+            index_json = self.index_json_override
+            # Copy, so the override isn't emptied when the assets are created
+            asset_metadata = dict(index_json.get("asset_metadata", {}))
+        elif self.index_cache is not None:
+            index_json, asset_metadata = self.index_cache.load(self.index_file_path)
+        else:
             with open(self.index_file_path) as f:
                 index_json = json.load(f)
-        else:
-            index_json = self.index_json_override
+            asset_metadata = index_json.get("asset_metadata", {})
 
         # TODO: sanity check the input json?
         # TODO: convert from dict mapping str->list to str->set?
@@ -118,69 +191,20 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
                 preview_file=category_metadata_json.get("preview_file", None),
             )
 
-        asset_to_category_id: dict[str, str] = {}
-        for child_category_id, asset_ids in self.child_assets.items():
-            for asset_id in asset_ids:
-                asset_to_category_id[asset_id] = child_category_id
-
         self.asset_categories = self.map_assets_to_categories()
-        for asset_id, asset_metadata_json in index_json.get("asset_metadata", {}).items():
-            # Update vector parameters with color parameters for older asset packs
-            # compatibility (prior to engon 1.2.0). Color parameters were defined solely prior to
-            # the introduction of vector parameters.
-            vector_parameters = asset_metadata_json.get("vector_parameters", {})
-            vector_parameters.update(asset_metadata_json.get("color_parameters", {}))
-
-            foreign_search_matter: dict[str, float] = {}
-            category_list = [
-                part.replace("_", " ")
-                for part in max(
-                    self.asset_categories.get(asset_id, set()), key=len, default=""
-                ).split("/")
-                if part != ""
-            ]
-            category_path = None if len(category_list) == 0 else tuple(category_list)
-
-            # Convert country of origin to location parameters to make the country of origin
-            # compatible with the search map feature. This is relevant for asset packs with
-            # implied geographical data, such as "country_of_origin" in traffiq and interniq.
-            text_parameters = asset_metadata_json.get("text_parameters", {})
-            location_parameters = asset_metadata_json.get("location_parameters", {})
-            if (
-                "country_of_origin" in text_parameters
-                and "location_of_origin" not in location_parameters
-            ):
-                location = country_locations.COUNTRY_COORDINATES.get(
-                    text_parameters["country_of_origin"], None
-                )
-                if location is None:
-                    logger.info(
-                        f"Country of origin '{text_parameters['country_of_origin']}' in asset "
-                        f"'{asset_id}' not found in known country locations. "
-                        f"This asset will be updated in newer version of the asset pack."
-                    )
-                else:
-                    location_parameters.update({"location_of_origin": location})
-                    asset_metadata_json.update({"location_parameters": location_parameters})
-
-            asset_metadata = asset.Asset(
-                id_=asset_id,
-                title=asset_metadata_json.get("title", "unknown"),
-                type_=asset_data.AssetDataType[asset_metadata_json.get("type", "unknown")],
-                preview_file=asset_metadata_json.get("preview_file", ""),
-                tags=asset_metadata_json.get("tags", []),
-                category_path=category_path,
-                numeric_parameters=asset_metadata_json.get("numeric_parameters", {}),
-                vector_parameters=vector_parameters,
-                text_parameters=asset_metadata_json.get("text_parameters", {}),
-                location_parameters=asset_metadata_json.get("location_parameters", {}),
-                foreign_search_matter=foreign_search_matter,
-            )
-            # clear search matter cache since we updated search matter
-            # we instantiated the class right here so this will do nothing but we include it for
-            # people who will copy code from here
-            asset_metadata.clear_search_matter_cache()
-            self.assets[asset_id] = asset_metadata
+        if isinstance(asset_metadata, dict):
+            # Metadata parsed from the JSON are already decoded, we create all assets right away
+            # and don't keep the metadata around.
+            self.assets = {}
+            for asset_id in list(asset_metadata):
+                asset_ = self._create_asset(asset_id, asset_metadata.pop(asset_id))
+                if asset_ is not None:
+                    self.assets[asset_id] = asset_
+        else:
+            # Assets are constructed from their metadata on first access, this way the metadata
+            # of assets loaded from the index cache are decoded only for assets that are
+            # actually used.
+            self.assets = LazyAssets(asset_metadata, self._create_asset)
 
         for asset_data_id, asset_data_json in index_json.get("asset_data", {}).items():
             asset_data_class: type[blender_asset_data.BlenderAssetData] | None = None
@@ -230,6 +254,87 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
 
             self.asset_data[asset_data_id] = asset_data_instance
 
+    def _create_asset(
+        self, asset_id: asset.AssetID, asset_metadata_json: dict[str, typing.Any]
+    ) -> asset.Asset | None:
+        """Creates asset from its metadata JSON, returns None if the metadata are malformed"""
+        try:
+            return self._create_asset_from_json(asset_id, asset_metadata_json)
+        except Exception:
+            logger.exception(
+                f"Failed to create asset '{asset_id}' of '{self.index_file_path}', skipping it"
+            )
+            return None
+
+    def _create_asset_from_json(
+        self, asset_id: asset.AssetID, asset_metadata_json: dict[str, typing.Any]
+    ) -> asset.Asset:
+        # Update vector parameters with color parameters for older asset packs
+        # compatibility (prior to engon 1.2.0). Color parameters were defined solely prior to
+        # the introduction of vector parameters.
+        vector_parameters = asset_metadata_json.get("vector_parameters", {})
+        vector_parameters.update(asset_metadata_json.get("color_parameters", {}))
+
+        foreign_search_matter: dict[str, float] = {}
+        category_list = [
+            part.replace("_", " ")
+            for part in max(self.asset_categories.get(asset_id, set()), key=len, default="").split(
+                "/"
+            )
+            if part != ""
+        ]
+        # Assets of the same category share the category path parts
+        category_path = (
+            None if len(category_list) == 0 else tuple(sys.intern(part) for part in category_list)
+        )
+
+        # Convert country of origin to location parameters to make the country of origin
+        # compatible with the search map feature. This is relevant for asset packs with
+        # implied geographical data, such as "country_of_origin" in traffiq and interniq.
+        text_parameters = asset_metadata_json.get("text_parameters", {})
+        location_parameters = asset_metadata_json.get("location_parameters", {})
+        if (
+            "country_of_origin" in text_parameters
+            and "location_of_origin" not in location_parameters
+        ):
+            location = country_locations.COUNTRY_COORDINATES.get(
+                text_parameters["country_of_origin"], None
+            )
+            if location is None:
+                logger.info(
+                    f"Country of origin '{text_parameters['country_of_origin']}' in asset "
+                    f"'{asset_id}' not found in known country locations. "
+                    f"This asset will be updated in newer version of the asset pack."
+                )
+            else:
+                location_parameters.update({"location_of_origin": location})
+                asset_metadata_json.update({"location_parameters": location_parameters})
+
+        asset_metadata = asset.Asset(
+            id_=asset_id,
+            title=asset_metadata_json.get("title", "unknown"),
+            type_=asset_data.AssetDataType[asset_metadata_json.get("type", "unknown")],
+            preview_file=asset_metadata_json.get("preview_file", ""),
+            tags=asset.make_tags(asset_metadata_json.get("tags", [])),
+            category_path=category_path,
+            numeric_parameters=self._parameter_schemas.create(
+                asset_metadata_json.get("numeric_parameters", {})
+            ),
+            vector_parameters=self._parameter_schemas.create(vector_parameters),
+            text_parameters=self._parameter_schemas.create(
+                asset_metadata_json.get("text_parameters", {}), intern_values=True
+            ),
+            location_parameters=self._parameter_schemas.create(
+                asset_metadata_json.get("location_parameters", {})
+            ),
+            foreign_search_matter=self._parameter_schemas.create(foreign_search_matter),
+        )
+        # clear search matter cache since we updated search matter
+        # we instantiated the class right here so this will do nothing but we include it for
+        # people who will copy code from here
+        asset_metadata.clear_search_matter_cache()
+        return asset_metadata
+
     def list_child_category_ids(
         self, parent_id: category.CategoryID
     ) -> typing.Iterable[category.CategoryID]:
@@ -254,6 +359,22 @@ class LocalJSONProvider(file_provider.FileProvider, asset_provider.AssetProvider
     def get_asset_data(self, asset_data_id: asset_data.AssetDataID) -> asset_data.AssetData | None:
         return self.asset_data.get(asset_data_id, None)
 
+    def get_search_index(self) -> search_index.SearchIndex:
+        return self._search_index
+
+    @functools.cached_property
+    def _search_index(self) -> search_index.AssetSearchIndex:
+        # Assets of this provider don't change after the index is loaded, the search index is
+        # constructed on first search and kept for the lifetime of the provider.
+        return search_index.AssetSearchIndex(self.assets.values())
+
+    def get_parameter_store(self) -> parameter_store.ParameterStore:
+        return self._parameter_store
+
+    @functools.cached_property
+    def _parameter_store(self) -> parameter_store.ParameterStore:
+        return parameter_store.ParameterStore(self.assets.values())
+
     def map_assets_to_categories(
         self,
     ) -> collections.defaultdict[asset.AssetID, list[category.CategoryID]]:
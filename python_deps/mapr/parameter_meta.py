@@ -2,7 +2,9 @@
 
 import typing
 import functools
+import numpy as np
 from . import asset
+from . import parameter_store
 
 
 class NumericParameterMeta:
@@ -82,13 +84,19 @@ class AssetParametersMeta:
     - 'tag:outdoor'
 
     The unique parameter names and tags are constructed right away. The expensive per-parameter
-    metadata are constructed lazily on demand and cached.
+    metadata are constructed lazily on demand and cached. If 'store' containing the assets is
+    provided, ranges of numeric and vector parameters are computed from its columns.
     """
 
-    def __init__(self, assets: typing.Sequence[asset.Asset]):
+    def __init__(
+        self,
+        assets: typing.Sequence[asset.Asset],
+        store: parameter_store.ParameterStore | None = None,
+    ):
         # This references the original assets from DataView if it a tuple is passed in.
         # If a list is passed in, we make a tuple copy to ensure immutability.
         self._assets: tuple[asset.Asset, ...] = tuple(assets)
+        self._store = store
 
         # Collect raw names first, then construct the unique names with prefixes.
         # This way we don't have to check for the existence of the unique name in the loop and
@@ -105,6 +113,8 @@ class AssetParametersMeta:
             location_names.update(asset_.location_parameters)
             tags.update(asset_.tags)
 
+        self._numeric_names = numeric_names
+        self._vector_names = vector_names
         self.unique_tags: set[str] = {f"tag:{t}" for t in tags}
         self.unique_parameter_names: set[str] = set()
         self.unique_parameter_names.update(f"num:{n}" for n in numeric_names)
@@ -120,8 +130,19 @@ class AssetParametersMeta:
         vector: dict[str, VectorParameterMeta] = {}
         location: dict[str, LocationParameterMeta] = {}
 
+        # Parameters with ranges computed from the store columns, to be skipped in the loop below
+        stored_numeric: set[str] = set()
+        stored_vector: set[str] = set()
+        positions = self._store.get_positions(self._assets) if self._store is not None else None
+        if positions is not None and len(positions) > 0:
+            assert self._store is not None
+            numeric, stored_numeric = self._get_numeric_ranges_from_store(self._store, positions)
+            vector, stored_vector = self._get_vector_ranges_from_store(self._store, positions)
+
         for asset_ in self._assets:
             for param, value in asset_.numeric_parameters.items():
+                if param in stored_numeric:
+                    continue
                 unique_name = f"num:{param}"
                 if unique_name not in numeric:
                     numeric[unique_name] = NumericParameterMeta(unique_name, value)
@@ -136,6 +157,8 @@ class AssetParametersMeta:
                     text[unique_name].register_value(value)
 
             for param, value in asset_.vector_parameters.items():
+                if param in stored_vector:
+                    continue
                 unique_name = f"vec:{param}"
                 if unique_name not in vector:
                     vector[unique_name] = VectorParameterMeta(unique_name, value)
@@ -149,8 +172,88 @@ class AssetParametersMeta:
                 else:
                     location[unique_name].register_value(value)
 
+        # Keep the same order of parameters as if all were registered in the loop
+        if len(stored_numeric) > 0:
+            numeric = self._sorted_by_appearance(numeric, "num:", lambda a: a.numeric_parameters)
+        if len(stored_vector) > 0:
+            vector = self._sorted_by_appearance(vector, "vec:", lambda a: a.vector_parameters)
+
         return ParameterRanges(numeric, text, vector, location)
 
+    def _get_numeric_ranges_from_store(
+        self, store: parameter_store.ParameterStore, positions: np.ndarray
+    ) -> tuple[dict[str, NumericParameterMeta], set[str]]:
+        numeric: dict[str, NumericParameterMeta] = {}
+        stored: set[str] = set()
+        for param in self._numeric_names:
+            column = store.get_numeric_column(param)
+            if column is None:
+                continue
+
+            stored.add(param)
+            present_indices = np.flatnonzero(column.present[positions])
+            values = column.values[positions[present_indices]]
+            # Registering values one by one keeps the last of equal extremes, it matters for ints
+            # and floats of the same value.
+            last = len(values) - 1
+            min_index = present_indices[last - np.argmin(values[::-1])]
+            max_index = present_indices[last - np.argmax(values[::-1])]
+            unique_name = f"num:{param}"
+            meta = NumericParameterMeta(
+                unique_name, self._assets[min_index].numeric_parameters[param]
+            )
+            meta.max_ = self._assets[max_index].numeric_parameters[param]
+            numeric[unique_name] = meta
+
+        return numeric, stored
+
+    def _get_vector_ranges_from_store(
+        self, store: parameter_store.ParameterStore, positions: np.ndarray
+    ) -> tuple[dict[str, VectorParameterMeta], set[str]]:
+        vector: dict[str, VectorParameterMeta] = {}
+        stored: set[str] = set()
+        for param in self._vector_names:
+            column = store.get_vector_column(param)
+            if column is None:
+                continue
+
+            stored.add(param)
+            present_indices = np.flatnonzero(column.present[positions])
+            values = column.values[positions[present_indices]]
+            unique_name = f"vec:{param}"
+            meta = VectorParameterMeta(
+                unique_name, self._assets[present_indices[0]].vector_parameters[param]
+            )
+            # Registering values one by one keeps the first of equal extremes in each component
+            for i, (min_index, max_index) in enumerate(
+                zip(np.argmin(values, axis=0), np.argmax(values, axis=0))
+            ):
+                meta.min_[i] = self._assets[present_indices[min_index]].vector_parameters[param][i]
+                meta.max_[i] = self._assets[present_indices[max_index]].vector_parameters[param][i]
+            vector[unique_name] = meta
+
+        return vector, stored
+
+    def _sorted_by_appearance(
+        self,
+        metas: dict[str, typing.Any],
+        prefix: str,
+        get_parameters: typing.Callable[[asset.Asset], dict[str, typing.Any]],
+    ) -> dict[str, typing.Any]:
+        """Orders 'metas' by the first appearance of the parameters in the assets
+
+        This is the order in which they would be registered when iterating the assets.
+        """
+        ret: dict[str, typing.Any] = {}
+        for asset_ in self._assets:
+            if len(ret) == len(metas):
+                break
+            for param in get_parameters(asset_):
+                unique_name = f"{prefix}{param}"
+                if unique_name not in ret:
+                    ret[unique_name] = metas[unique_name]
+        return ret
+
     @property
     def numeric(self) -> dict[str, NumericParameterMeta]:
         return self._ranges.numeric
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# copyright (c) 2018- polygoniq xyz s.r.o.
+
+# Column-oriented store of numeric and vector parameters of assets. Each parameter is stored as
+# a NumPy array of values and a mask of assets having the parameter present, aligned to a dense
+# index of assets in the store. Filters can then be evaluated for many assets at once as array
+# operations, see 'filters.Filter.filter_columns', and parameter ranges can be computed by array
+# reductions, see 'parameter_meta.AssetParametersMeta'.
+
+import typing
+import numpy as np
+from . import asset
+import logging
+
+logger = logging.getLogger(f"polygoniq.{__name__}")
+
+
+# Integers with larger magnitude can't be represented exactly in float64, parameters containing
+# them are not stored and are evaluated per asset.
+MAX_EXACT_INT = 2**53
+
+
+class NumericColumn(typing.NamedTuple):
+    # float64 array of values, 0.0 where the parameter is not present
+    values: np.ndarray
+    present: np.ndarray
+
+
+class VectorColumn(typing.NamedTuple):
+    # float64 array of shape (asset count, vector length), 0.0 where the parameter is not present
+    values: np.ndarray
+    present: np.ndarray
+
+
+def _is_exact_number(value: typing.Any) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, int):
+        return -MAX_EXACT_INT <= value <= MAX_EXACT_INT
+    return False
+
+
+class ParameterStore:
+    """Numeric and vector parameters of given assets stored in columns
+
+    Parameters with values that can't be stored exactly (non-numbers, vectors of different lengths)
+    are not stored, their 'get_*_column' methods return None and callers have to fall back to
+    evaluating the assets one by one.
+    """
+
+    def __init__(self, assets: typing.Iterable[asset.Asset]):
+        self.assets: tuple[asset.Asset, ...] = tuple(assets)
+        self._positions: dict[asset.AssetID, int] = {
+            asset_.id_: i for i, asset_ in enumerate(self.assets)
+        }
+
+        # Collect positions and values of each parameter first and then convert them to arrays
+        numeric_values: dict[str, tuple[list[int], list[typing.Any]]] = {}
+        vector_values: dict[str, tuple[list[int], list[typing.Any]]] = {}
+        for i, asset_ in enumerate(self.assets):
+            for param, value in asset_.numeric_parameters.items():
+                positions, values = numeric_values.setdefault(param, ([], []))
+                positions.append(i)
+                values.append(value)
+            for param, value in asset_.vector_parameters.items():
+                positions, values = vector_values.setdefault(param, ([], []))
+                positions.append(i)
+                values.append(value)
+
+        self._numeric: dict[str, NumericColumn] = {}
+        self._vector: dict[str, VectorColumn] = {}
+        self._unsupported_numeric: set[str] = set()
+        self._unsupported_vector: set[str] = set()
+        asset_count = len(self.assets)
+        for param, (positions, values) in numeric_values.items():
+            if not all(_is_exact_number(v) for v in values):
+                self._unsupported_numeric.add(param)
+                continue
+
+            column = NumericColumn(np.zeros(asset_count), np.zeros(asset_count, dtype=bool))
+            column.values[positions] = values
+            column.present[positions] = True
+            self._numeric[param] = column
+
+        for param, (positions, values) in vector_values.items():
+            length = len(values[0])
+            if not all(len(v) == length and all(_is_exact_number(x) for x in v) for v in values):
+                self._unsupported_vector.add(param)
+                continue
+
+            column = VectorColumn(
+                np.zeros((asset_count, length)), np.zeros(asset_count, dtype=bool)
+            )
+            column.values[positions] = values
+            column.present[positions] = True
+            self._vector[param] = column
+
+        logger.debug(
+            f"Created parameter store of {asset_count} assets, {len(self._numeric)} numeric and "
+            f"{len(self._vector)} vector columns"
+        )
+
+    def get_positions(self, assets: typing.Iterable[asset.Asset]) -> np.ndarray | None:
+        """Returns positions of 'assets' in the store, None if any of the assets is not stored"""
+        try:
+            return np.fromiter((self._positions[asset_.id_] for asset_ in assets), dtype=np.intp)
+        except KeyError:
+            return None
+
+    def get_numeric_column(self, param: str) -> NumericColumn | None:
+        """Returns column of numeric parameter 'param' (without the type prefix)
+
+        Returns None if the parameter values can't be stored in a column.
+        """
+        if param in self._unsupported_numeric:
+            return None
+        column = self._numeric.get(param, None)
+        if column is None:
+            # No asset has the parameter
+            asset_count = len(self.assets)
+            return NumericColumn(np.zeros(asset_count), np.zeros(asset_count, dtype=bool))
+        return column
+
+    def get_vector_column(self, param: str) -> VectorColumn | None:
+        """Returns column of vector parameter 'param' (without the type prefix)
+
+        Returns None if the parameter values can't be stored in a column.
+        """
+        if param in self._unsupported_vector:
+            return None
+        column = self._vector.get(param, None)
+        if column is None:
+            # No asset has the parameter, the vector length doesn't matter
+            asset_count = len(self.assets)
+            return VectorColumn(np.zeros((asset_count, 0)), np.zeros(asset_count, dtype=bool))
+        return column
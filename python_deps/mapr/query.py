@@ -1,7 +1,9 @@
 # copyright (c) 2018- polygoniq xyz s.r.o.
 
 import typing
+import hashlib
 import json
+import threading
 from . import category
 from . import filters
 
@@ -13,7 +15,34 @@ class SortMode:
     SORTED_MOST_RELEVANT = "Sorted Most Relevant"
 
 
+class QueryCancelledError(Exception):
+    """Raised from evaluation of a query when its CancellationToken was cancelled"""
+
+    pass
+
+
+class CancellationToken:
+    """Allows cooperative cancellation of a query evaluated possibly in another thread"""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise QueryCancelledError()
+
+
 class Query:
+    # Keys of the dict representation that don't come from filters
+    NON_FILTER_KEYS = {"category_id", "recursive", "sort_mode"}
+
     def __init__(
         self,
         category_id: category.CategoryID,
@@ -30,6 +59,10 @@ class Query:
         # constructed. Resulting in values provided by the filters being always equal to the filters
         # dict representation when the query would be converted to dict.
         self._dict = self._as_dict()
+        # Content address of the query, computed once so hashing and comparing queries is cheap.
+        # Keys are sorted, so the order of filters doesn't matter.
+        self.key = hashlib.sha1(json.dumps(self._dict, sort_keys=True).encode("utf-8")).hexdigest()
+        self._hash = hash(self.key)
 
     def _as_dict(self) -> dict:
         ret = {}
@@ -41,12 +74,36 @@ class Query:
 
         return ret
 
+    def is_narrowing(self, previous: 'Query') -> bool:
+        """Returns True if results of this query are guaranteed to be a subset of 'previous' results
+
+        This is the case if both queries list the same category and each filter of the 'previous'
+        query is present in this query with the same or narrower parameters. Filters present only
+        in this query can only narrow the results further. Sort mode is not considered.
+        """
+        if self.category_id != previous.category_id or self.recursive != previous.recursive:
+            return False
+
+        filters_by_name = {filter_.name: filter_ for filter_ in self.filters}
+        for name, previous_value in previous._dict.items():
+            if name in Query.NON_FILTER_KEYS:
+                continue
+
+            filter_ = filters_by_name.get(name, None)
+            if filter_ is None or name not in self._dict:
+                return False
+
+            if not filter_.is_narrowing(self._dict[name], previous_value):
+                return False
+
+        return True
+
     def __hash__(self) -> int:
-        return hash(json.dumps(self._dict))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Query):
-            return self._dict == other._dict
+            return self.key == other.key
 
         return False
 
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# copyright (c) 2018- polygoniq xyz s.r.o.
+
+# Inverted index of asset search matter used to evaluate 'filters.SearchFilter' without scanning
+# search matter of every asset. The index maps each search token to assets containing it and
+# n-grams of the tokens to the tokens themselves, so affix (prefix, infix, suffix) matches of
+# a needle keyword are resolved against the token vocabulary instead of against each asset.
+# The scores produced are the same as 'filters.SearchFilter.filter_' would produce.
+
+import abc
+import collections
+import typing
+from . import asset
+from . import filters
+import logging
+
+logger = logging.getLogger(f"polygoniq.{__name__}")
+
+
+# Length of n-grams used to look up tokens containing a needle keyword, needle keywords shorter
+# than this are matched against the whole token vocabulary.
+NGRAM_LENGTH = 3
+
+
+class SearchIndex(abc.ABC):
+    @abc.abstractmethod
+    def score(self, needle_keywords: typing.Sequence[str]) -> dict[asset.AssetID, float]:
+        """Returns relevancy scores of all assets matching the 'needle_keywords'
+
+        Assets that don't match the keywords are not present in the result. The scores are
+        the same as 'filters.SearchFilter' would compute for each asset separately.
+        """
+        pass
+
+
+class AssetSearchIndex(SearchIndex):
+    """Search index constructed from search matter of given assets"""
+
+    def __init__(self, assets: typing.Iterable[asset.Asset]):
+        self._assets: dict[asset.AssetID, asset.Asset] = {}
+        # maps search token to IDs of assets containing it and the token weight in the asset
+        self._token_postings: collections.defaultdict[str, list[tuple[asset.AssetID, float]]] = (
+            collections.defaultdict(list)
+        )
+        for asset_ in assets:
+            self._assets[asset_.id_] = asset_
+            for token, weight in asset_.search_matter.items():
+                self._token_postings[token].append((asset_.id_, weight))
+
+        # maps n-gram to all tokens containing it
+        self._ngram_tokens: collections.defaultdict[str, set[str]] = collections.defaultdict(set)
+        for token in self._token_postings:
+            for i in range(len(token) - NGRAM_LENGTH + 1):
+                self._ngram_tokens[token[i : i + NGRAM_LENGTH]].add(token)
+
+        logger.debug(
+            f"Created search index of {len(self._assets)} assets, "
+            f"{len(self._token_postings)} tokens and {len(self._ngram_tokens)} n-grams"
+        )
+
+    def score(self, needle_keywords: typing.Sequence[str]) -> dict[asset.AssetID, float]:
+        if len(needle_keywords) == 0:
+            return {}
+
+        # maps asset ID to matches of the individual needle keywords
+        keyword_matches: collections.defaultdict[
+            asset.AssetID, list[filters.KeywordMatch | None]
+        ] = collections.defaultdict(lambda: [None] * len(needle_keywords))
+        # IDs of assets matching all the quoted keywords, None if there are no quoted keywords
+        exact_matched_asset_ids: set[asset.AssetID] | None = None
+        for i, needle_keyword in enumerate(needle_keywords):
+            if filters.SearchFilter.is_exact_match_keyword(needle_keyword):
+                matched_asset_ids = self._get_exact_matched_asset_ids(needle_keyword)
+                for asset_id in matched_asset_ids:
+                    keyword_matches[asset_id][i] = filters.SearchFilter.EXACT_KEYWORD_MATCH
+                if exact_matched_asset_ids is None:
+                    exact_matched_asset_ids = matched_asset_ids
+                else:
+                    exact_matched_asset_ids &= matched_asset_ids
+                continue
+
+            affix_scores: dict[asset.AssetID, float] = {}
+            for token in self._get_tokens_containing(needle_keyword):
+                for asset_id, weight in self._token_postings[token]:
+                    affix_score = filters.SearchFilter.get_affix_score(
+                        needle_keyword, i, len(needle_keywords), token, weight
+                    )
+                    if affix_score > affix_scores.get(asset_id, 0.0):
+                        affix_scores[asset_id] = affix_score
+
+            for asset_id, affix_score in affix_scores.items():
+                keyword_matches[asset_id][i] = filters.KeywordMatch(affix_score, affix_score)
+
+        ret: dict[asset.AssetID, float] = {}
+        for asset_id, matches in keyword_matches.items():
+            # Assets not containing all the quoted keywords are excluded even if other keywords
+            # would match
+            if exact_matched_asset_ids is not None and asset_id not in exact_matched_asset_ids:
+                continue
+            ret[asset_id] = filters.SearchFilter.get_relevancy_score(matches)
+
+        return ret
+
+    def _get_tokens_containing(self, needle_keyword: str) -> typing.Iterable[str]:
+        if len(needle_keyword) < NGRAM_LENGTH:
+            return (token for token in self._token_postings if needle_keyword in token)
+
+        candidates: set[str] | None = None
+        # Intersect tokens of the n-grams from the least common one to prune the candidates early
+        ngrams = sorted(
+            {
+                needle_keyword[i : i + NGRAM_LENGTH]
+                for i in range(len(needle_keyword) - NGRAM_LENGTH + 1)
+            },
+            key=lambda x: len(self._ngram_tokens.get(x, ())),
+        )
+        for ngram in ngrams:
+            ngram_tokens = self._ngram_tokens.get(ngram, set())
+            candidates = set(ngram_tokens) if candidates is None else candidates & ngram_tokens
+            if len(candidates) == 0:
+                return ()
+
+        assert candidates is not None
+        # n-grams only guarantee the token contains all parts of the needle, not the needle itself
+        return (token for token in candidates if needle_keyword in token)
+
+    def _get_exact_matched_asset_ids(self, needle_keyword: str) -> set[asset.AssetID]:
+        needle_keyword_trimmed = needle_keyword[1:-1]
+        first_keyword = needle_keyword_trimmed.split(' ')[0]
+        # Asset can match the quoted keyword only if it contains the whole quoted text or its first
+        # word as one of the tokens, the rest is checked on the asset itself.
+        candidate_ids = {asset_id for asset_id, _ in self._token_postings.get(first_keyword, ())}
+        candidate_ids.update(
+            asset_id for asset_id, _ in self._token_postings.get(needle_keyword_trimmed, ())
+        )
+        return {
+            asset_id
+            for asset_id in candidate_ids
+            if filters.SearchFilter.is_exact_match(needle_keyword, self._assets[asset_id])
+        }
+
+
+class SearchIndexMultiplexer(SearchIndex):
+    """Combines search indices of multiple asset providers into one
+
+    We assume no two search indices contain the same AssetID, same as AssetProviderMultiplexer.
+    """
+
+    def __init__(self, search_indices: typing.Iterable[SearchIndex]):
+        self._search_indices = list(search_indices)
+
+    def score(self, needle_keywords: typing.Sequence[str]) -> dict[asset.AssetID, float]:
+        ret: dict[asset.AssetID, float] = {}
+        for search_index in self._search_indices:
+            ret.update(search_index.score(needle_keywords))
+        return ret
@@ -6,6 +6,7 @@
 import bpy
 import inspect
 import functools
+import time
 import typing
 
 from . import ui_bpy
@@ -201,6 +202,86 @@ def update_custom_prop(
     ui_bpy.tag_areas_redraw(context, {'VIEW_3D'})
 
 
+class CustomPropPropagator:
+    """Propagates values of custom properties to many datablocks during interactive edits
+
+    Dragging a slider calls the property update on every intermediate value. The datablocks
+    to update are resolved once per edit and reused while the same source keeps updating
+    with the same selection, until there is no update for 'edit_timeout' seconds.
+
+    Datablocks are tagged right away, so the change is evaluated even if no event loop runs,
+    e.g. in background mode or when a script renders right after setting the property. Objects
+    sharing the same data get the data tagged only once. Only the redraw of 3D views is deferred
+    to a timer, all updates within one event loop iteration result in a single redraw.
+    """
+
+    def __init__(self, edit_timeout: float = 0.5):
+        self.edit_timeout = edit_timeout
+        self._edit_key: typing.Hashable | None = None
+        self._edit_datablocks: list[bpy.types.ID] = []
+        # Datablocks of the current edit having the property, filtered on first update of it
+        self._edit_property_datablocks: dict[str, list[bpy.types.ID]] = {}
+        self._last_update_time = 0.0
+        # Bound method is stored so 'bpy.app.timers.is_registered' recognizes it
+        self._redraw_timer = self._redraw_3d_views
+
+    def update(
+        self,
+        context: bpy.types.Context,
+        key: typing.Hashable,
+        get_datablocks: typing.Callable[[], typing.Iterable[bpy.types.ID]],
+        values: typing.Mapping[str, CustomAttributeValueType],
+        update_tag_refresh: set[str] = {'OBJECT'},
+    ) -> None:
+        """Update custom properties 'values' of datablocks returned by 'get_datablocks'
+
+        'values' maps property names to their new values, each property is set only on
+        datablocks that have it. 'key' identifies the source of the edit, e.g. name of the
+        feature. 'get_datablocks' is called only at the start of each edit. See
+        'update_custom_prop' for 'update_tag_refresh'.
+        """
+        edit_key = (key, context.active_object, frozenset(context.selected_objects))
+        now = time.monotonic()
+        if edit_key != self._edit_key or now - self._last_update_time > self.edit_timeout:
+            self._edit_key = edit_key
+            self._edit_datablocks = list(get_datablocks())
+            self._edit_property_datablocks = {}
+        self._last_update_time = now
+
+        updated_datablocks: dict[bpy.types.ID, None] = {}
+        for prop_name, value in values.items():
+            datablocks = self._edit_property_datablocks.get(prop_name, None)
+            if datablocks is None:
+                datablocks = [
+                    datablock for datablock in self._edit_datablocks if prop_name in datablock
+                ]
+                self._edit_property_datablocks[prop_name] = datablocks
+
+            for datablock in datablocks:
+                datablock[prop_name] = value
+                updated_datablocks[datablock] = None
+
+        if len(updated_datablocks) == 0:
+            return
+
+        tagged_data: set[bpy.types.ID] = set()
+        for datablock in updated_datablocks:
+            refresh = update_tag_refresh
+            if 'DATA' in refresh and isinstance(datablock, bpy.types.Object):
+                if datablock.data is not None and datablock.data in tagged_data:
+                    # Data shared with already tagged object, tag only the object itself
+                    refresh = (refresh - {'DATA'}) or {'OBJECT'}
+                elif datablock.data is not None:
+                    tagged_data.add(datablock.data)
+            datablock.update_tag(refresh=refresh)
+
+        if not bpy.app.background and not bpy.app.timers.is_registered(self._redraw_timer):
+            bpy.app.timers.register(self._redraw_timer, first_interval=0.0)
+
+    def _redraw_3d_views(self) -> None:
+        ui_bpy.tag_areas_redraw(bpy.context, {'VIEW_3D'})
+
+
 def is_api_defined_prop(datablock: bpy.types.ID, property_name: str) -> bool:
     """Check if the property is defined by the API."""
     prop = datablock.bl_rna.properties.get(property_name, None)
@@ -6,8 +6,12 @@ import bpy_extras.view3d_utils
 import collections
 import math
 import mathutils
+import mathutils.bvhtree
 import numpy
 import typing
+import logging
+
+logger = logging.getLogger(f"polygoniq.{__name__}")
 
 
 def plane_from_points(
@@ -46,6 +50,70 @@ def mean_position(vs: typing.Iterable[mathutils.Vector]) -> mathutils.Vector:
 RaycastHit = collections.namedtuple("RaycastHit", ["object", "position", "normal"])
 
 
+def get_visible_objects_and_instances(
+    context: bpy.types.Context,
+    excluded_objects_names: set[str] | None = None,
+    raycast_collection: bpy.types.Collection | None = None,
+    skip_particle_instances: bool = True,
+) -> typing.Iterable[tuple[bpy.types.Object, mathutils.Matrix]]:
+    """Get (Object, Matrix) pairs of all the objects and instanced objects in the scene
+
+    Objects are the evaluated objects from the depsgraph, they are valid only during
+    the iteration. See 'raycast_screen_to_world' for description of the arguments.
+    """
+    if excluded_objects_names is None:
+        excluded_objects_names = set()
+
+    depsgraph = context.evaluated_depsgraph_get()
+    for dup in depsgraph.object_instances:
+        if dup.is_instance:  # Real dupli instance
+            if dup.is_instance and dup.particle_system is not None and skip_particle_instances:
+                continue
+
+            obj = dup.instance_object
+            matrix = dup.matrix_world.copy()
+            # If there is instanced object and both its instancer and the object it instances
+            # are in excluded_object_names, exclude it.
+            if (
+                dup.instance_object.name in excluded_objects_names
+                and dup.parent is not None
+                and dup.parent.name in excluded_objects_names
+            ):
+                continue
+
+            # If the instancer isn't in the raycast collection we consider it not visible.
+            # The instanced object doesn't have to be in it, it can live only in bpy.data.
+            if (
+                raycast_collection is not None
+                and dup.parent is not None
+                and dup.parent.name not in raycast_collection.all_objects
+            ):
+                continue
+
+        else:  # Usual object
+            obj = dup.object
+            matrix = obj.matrix_world.copy()
+            if obj.name in excluded_objects_names:
+                continue
+
+            # If the object isn't in the raycast collection, we don't consider it visible.
+            if raycast_collection is not None and obj.name not in raycast_collection.all_objects:
+                continue
+
+        yield (obj, matrix)
+
+
+def get_screen_ray(
+    context: bpy.types.Context, screen_position: tuple[int, int]
+) -> tuple[mathutils.Vector, mathutils.Vector]:
+    """Returns origin and direction of the ray from the viewport at 'screen_position'"""
+    region = context.region
+    region_3d = context.region_data
+    view_vector = bpy_extras.view3d_utils.region_2d_to_vector_3d(region, region_3d, screen_position)
+    ray_origin = bpy_extras.view3d_utils.region_2d_to_origin_3d(region, region_3d, screen_position)
+    return ray_origin, view_vector
+
+
 def raycast_screen_to_world(
     context: bpy.types.Context,
     screen_position: tuple[int, int],
@@ -64,68 +132,16 @@ def raycast_screen_to_world(
 
     'skip_particle_instances' is a flag that determines whether instances coming from a particle
     systems are skipped for performance gain.
+
+    This raycasts each object in the scene, use RaycastIndex when raycasting repeatedly.
     """
     # This code was taken from operator_modal_view3d_raycast.py Blender python template and adjusted
     # to our use case.
 
-    if excluded_objects_names is None:
-        excluded_objects_names = set()
-
-    # get the context arguments
-    region = context.region
-    region_3d = context.region_data
-
     # get the ray from the viewport and mouse
-    view_vector = bpy_extras.view3d_utils.region_2d_to_vector_3d(region, region_3d, screen_position)
-    ray_origin = bpy_extras.view3d_utils.region_2d_to_origin_3d(region, region_3d, screen_position)
-
+    ray_origin, view_vector = get_screen_ray(context, screen_position)
     ray_target = ray_origin + view_vector
 
-    def get_visible_objects_and_instances() -> (
-        typing.Iterable[tuple[bpy.types.Object, mathutils.Matrix]]
-    ):
-        """Get (Object, Matrix) pairs of all the objects and instanced objects in the scene"""
-        depsgraph = context.evaluated_depsgraph_get()
-        for dup in depsgraph.object_instances:
-            if dup.is_instance:  # Real dupli instance
-                if dup.is_instance and dup.particle_system is not None and skip_particle_instances:
-                    continue
-
-                obj = dup.instance_object
-                matrix = dup.matrix_world.copy()
-                # If there is instanced object and both its instancer and the object it instances
-                # are in excluded_object_names, exclude it.
-                if (
-                    dup.instance_object.name in excluded_objects_names
-                    and dup.parent is not None
-                    and dup.parent.name in excluded_objects_names
-                ):
-                    continue
-
-                # If the instancer isn't in the raycast collection we consider it not visible.
-                # The instanced object doesn't have to be in it, it can live only in bpy.data.
-                if (
-                    raycast_collection is not None
-                    and dup.parent is not None
-                    and dup.parent.name not in raycast_collection.all_objects
-                ):
-                    continue
-
-            else:  # Usual object
-                obj = dup.object
-                matrix = obj.matrix_world.copy()
-                if obj.name in excluded_objects_names:
-                    continue
-
-                # If the object isn't in the raycast collection, we don't consider it visible.
-                if (
-                    raycast_collection is not None
-                    and obj.name not in raycast_collection.all_objects
-                ):
-                    continue
-
-            yield (obj, matrix)
-
     def obj_ray_cast(
         obj: bpy.types.Object, matrix: mathutils.Matrix
     ) -> tuple[mathutils.Vector | None, mathutils.Vector | None]:
@@ -155,7 +171,9 @@ def raycast_screen_to_world(
     best_hit_world = None
     best_normal = None
 
-    for obj, matrix in get_visible_objects_and_instances():
+    for obj, matrix in get_visible_objects_and_instances(
+        context, excluded_objects_names, raycast_collection, skip_particle_instances
+    ):
         if obj.type not in {'MESH', 'CURVE'}:
             continue
 
@@ -173,3 +191,194 @@ def raycast_screen_to_world(
         return None
 
     return RaycastHit(best_hit_obj, best_hit_world, best_normal)
+
+
+class RaycastIndex:
+    """Scene objects and instances prepared for repeated raycasting, e.g. in modal operators
+
+    Geometry of each unique evaluated object is stored in one BVH tree shared by all its
+    instances. World space bounds of all instances are stored in arrays, so a ray is tested
+    against the bounds of all instances at once and only instances whose bounds it hits are
+    raycast, nearest first.
+
+    The index is a snapshot of the scene at the time it was created, use 'add_object' to add
+    objects created later. Objects in the index are the original objects, the evaluated ones are
+    valid only until the next depsgraph evaluation.
+    """
+
+    # Bounds are extended by this distance, so rays exactly at the boundary aren't missed
+    BOUNDS_TOLERANCE = 1e-4
+
+    def __init__(
+        self,
+        context: bpy.types.Context,
+        excluded_objects_names: set[str] | None = None,
+        raycast_collection: bpy.types.Collection | None = None,
+        skip_particle_instances: bool = True,
+    ):
+        """Indexes objects that 'raycast_screen_to_world' with the same arguments would raycast"""
+        self.raycast_collection = raycast_collection
+        self._objects: list[bpy.types.Object] = []
+        self._bvh_trees: list[mathutils.bvhtree.BVHTree] = []
+        self._matrices: list[mathutils.Matrix] = []
+        self._matrices_inverted: list[mathutils.Matrix] = []
+        self._bounds: list[tuple[mathutils.Vector, mathutils.Vector]] = []
+        # Bounds as arrays of shape (instance count, 3), created on first raycast
+        self._bounds_min: numpy.ndarray | None = None
+        self._bounds_max: numpy.ndarray | None = None
+
+        # maps pointers identifying an evaluated object and its data to the BVH tree of the object,
+        # None if it couldn't be built
+        self._object_bvh_trees: dict[tuple[int, int, int], mathutils.bvhtree.BVHTree | None] = {}
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj, matrix in get_visible_objects_and_instances(
+            context, excluded_objects_names, raycast_collection, skip_particle_instances
+        ):
+            self._add_instance(obj, matrix, depsgraph)
+
+        logger.debug(
+            f"Created raycast index of {len(self._objects)} instances of "
+            f"{len(self._object_bvh_trees)} objects"
+        )
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def add_object(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
+        """Adds 'obj' and objects it instances through its instance collection to the index
+
+        The depsgraph is evaluated, so the current transform of 'obj' is used.
+        """
+        if (
+            self.raycast_collection is not None
+            and obj.name not in self.raycast_collection.all_objects
+        ):
+            return
+
+        depsgraph = context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        self._add_instance_hierarchy(obj_eval, obj_eval.matrix_world.copy(), depsgraph)
+
+    def ray_cast(
+        self, ray_origin: mathutils.Vector, ray_direction: mathutils.Vector
+    ) -> RaycastHit | None:
+        """Returns hit of the ray closest to 'ray_origin', None if nothing was hit"""
+        if len(self._objects) == 0:
+            return None
+
+        if self._bounds_min is None or self._bounds_max is None:
+            self._bounds_min = numpy.array([bounds[0] for bounds in self._bounds])
+            self._bounds_max = numpy.array([bounds[1] for bounds in self._bounds])
+
+        ray_direction = ray_direction.normalized()
+        origin = numpy.array(ray_origin)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            inverse_direction = 1.0 / numpy.array(ray_direction)
+            t1 = (self._bounds_min - origin) * inverse_direction
+            t2 = (self._bounds_max - origin) * inverse_direction
+        # Distances along the ray where it enters and leaves the bounds, fmin and fmax ignore NaNs
+        # coming from rays parallel to a bounds plane
+        t_enter = numpy.maximum(numpy.fmin(t1, t2).max(axis=1), 0.0)
+        t_exit = numpy.fmax(t1, t2).min(axis=1)
+        candidates = numpy.flatnonzero(t_enter <= t_exit)
+        candidates = candidates[numpy.argsort(t_enter[candidates], kind="stable")]
+
+        ray_target = ray_origin + ray_direction
+        best_length = math.inf
+        best_hit = None
+        for i in candidates:
+            # The ray can't hit anything closer than where it enters the bounds
+            if t_enter[i] > best_length:
+                break
+
+            matrix_inv = self._matrices_inverted[i]
+            ray_origin_obj = matrix_inv @ ray_origin
+            ray_direction_obj = matrix_inv @ ray_target - ray_origin_obj
+            location, normal, _, _ = self._bvh_trees[i].ray_cast(ray_origin_obj, ray_direction_obj)
+            if location is None:
+                continue
+
+            matrix = self._matrices[i]
+            hit_world = matrix @ location
+            length = (hit_world - ray_origin).length
+            if length < best_length:
+                # Move the normal to world space
+                _, rotation, _ = matrix.decompose()
+                normal = normal.normalized()
+                normal.rotate(rotation)
+                best_length = length
+                best_hit = RaycastHit(self._objects[i], hit_world, normal)
+
+        return best_hit
+
+    def raycast_screen_to_world(
+        self, context: bpy.types.Context, screen_position: tuple[int, int]
+    ) -> RaycastHit | None:
+        """Same as 'raycast_screen_to_world' with the arguments the index was created with"""
+        return self.ray_cast(*get_screen_ray(context, screen_position))
+
+    def _add_instance_hierarchy(
+        self,
+        obj: bpy.types.Object,
+        matrix: mathutils.Matrix,
+        depsgraph: bpy.types.Depsgraph,
+    ) -> None:
+        self._add_instance(obj, matrix, depsgraph)
+        if obj.instance_type != 'COLLECTION' or obj.instance_collection is None:
+            return
+
+        collection = obj.instance_collection
+        instance_matrix = matrix @ mathutils.Matrix.Translation(-collection.instance_offset)
+        for collection_object in collection.all_objects:
+            if collection_object.hide_viewport:
+                continue
+            collection_object_eval = collection_object.evaluated_get(depsgraph)
+            self._add_instance_hierarchy(
+                collection_object_eval,
+                instance_matrix @ collection_object_eval.matrix_world,
+                depsgraph,
+            )
+
+    def _add_instance(
+        self,
+        obj: bpy.types.Object,
+        matrix: mathutils.Matrix,
+        depsgraph: bpy.types.Depsgraph,
+    ) -> None:
+        if obj.type not in {'MESH', 'CURVE'}:
+            return
+
+        try:
+            matrix_inverted = matrix.inverted()
+        except ValueError:
+            # Instances with zero scale can't be hit anyway
+            return
+
+        # The evaluated object alone could be freed and its memory reused by another object
+        key = (obj.as_pointer(), obj.original.as_pointer(), obj.data.as_pointer())
+        if key not in self._object_bvh_trees:
+            try:
+                self._object_bvh_trees[key] = mathutils.bvhtree.BVHTree.FromObject(obj, depsgraph)
+            except:
+                logger.exception(f"Failed to build BVH tree of '{obj.name}'")
+                self._object_bvh_trees[key] = None
+        bvh_tree = self._object_bvh_trees[key]
+        if bvh_tree is None:
+            return
+
+        bounds_min = mathutils.Vector((math.inf,) * 3)
+        bounds_max = mathutils.Vector((-math.inf,) * 3)
+        for corner in obj.bound_box:
+            corner_world = matrix @ mathutils.Vector(corner)
+            for axis in range(3):
+                bounds_min[axis] = min(bounds_min[axis], corner_world[axis])
+                bounds_max[axis] = max(bounds_max[axis], corner_world[axis])
+
+        tolerance = mathutils.Vector((RaycastIndex.BOUNDS_TOLERANCE,) * 3)
+        self._objects.append(obj.original)
+        self._bvh_trees.append(bvh_tree)
+        self._matrices.append(matrix)
+        self._matrices_inverted.append(matrix_inverted)
+        self._bounds.append((bounds_min - tolerance, bounds_max + tolerance))
+        self._bounds_min = None
+        self._bounds_max = None
@@ -3,7 +3,15 @@
 
 import bpy
 import bpy.utils.previews
+import collections
+import hashlib
+import numpy as np
+import OpenImageIO
 import os
+import struct
+import threading
+import time
+import typing
 import urllib.request
 import urllib.error
 import logging
@@ -16,16 +24,257 @@ logger = logging.getLogger(f"polygoniq.{__name__}")
 QUESTION_MARK_ICON_ID = 2 if bpy.app.version >= (4, 5, 0) else 1
 
 
+class Thumbnail(typing.NamedTuple):
+    width: int
+    height: int
+    # RGBA bytes of pixels from the bottom row up, viewed as one int32 per pixel, as expected
+    # by 'ImagePreview.image_pixels'
+    pixels: np.ndarray
+
+
+class ThumbnailCache:
+    """On-disk cache of images downscaled to fit into 'size' x 'size' pixels
+
+    Thumbnails are stored in 'folder_path' as raw RGBA pixels, so reading them is only a matter
+    of reading the file. The cache file is keyed by the source image path, its mtime and size,
+    changed source images get new cache files. Used cache files are touched, when the cache
+    grows over 'max_bytes', least recently used cache files are removed.
+
+    Thumbnails are created using OpenImageIO, all methods are safe to call from any thread.
+    """
+
+    # Bump this whenever the layout of the cache file changes
+    FORMAT_VERSION = 1
+    MAGIC = b"PQTHUMB1"
+    HEADER = struct.Struct("<8sII")
+    EXTENSION = ".thumb"
+    # After exceeding the limit, the cache is cleaned up to this fraction of 'max_bytes', so
+    # the cleanup doesn't run after each created thumbnail.
+    CLEANUP_TARGET_RATIO = 0.8
+
+    def __init__(self, folder_path: str, size: int = 256, max_bytes: int = 512 * 1024 * 1024):
+        self.folder_path = folder_path
+        self.size = size
+        self.max_bytes = max_bytes
+        # Guards the size of the cache, None until the folder is scanned for the first time
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def get(self, source_path: str) -> Thumbnail | None:
+        """Returns thumbnail of 'source_path' if it is cached, None otherwise"""
+        try:
+            cache_file_path = self._get_cache_file_path(source_path)
+            with open(cache_file_path, "rb") as f:
+                magic, width, height = self.HEADER.unpack(f.read(self.HEADER.size))
+                if magic != self.MAGIC:
+                    return None
+                pixels = np.fromfile(f, dtype=np.int32, count=width * height)
+            if len(pixels) != width * height:
+                return None
+            # Mark the thumbnail as recently used for the cleanup
+            os.utime(cache_file_path)
+            return Thumbnail(width, height, pixels)
+        except (OSError, struct.error):
+            return None
+
+    def get_or_create(self, source_path: str) -> Thumbnail | None:
+        """Returns thumbnail of 'source_path', creates and caches it if it isn't cached
+
+        Returns None if the source image can't be read.
+        """
+        thumbnail = self.get(source_path)
+        if thumbnail is not None:
+            return thumbnail
+
+        thumbnail = self._create_thumbnail(source_path)
+        if thumbnail is None:
+            return None
+
+        try:
+            self._write(source_path, thumbnail)
+        except OSError:
+            logger.exception(f"Failed to cache thumbnail of '{source_path}'")
+        return thumbnail
+
+    def clear(self) -> None:
+        """Removes all cached thumbnails"""
+        with self._lock:
+            for cache_file_path, _, _ in self._list_cache_files():
+                try:
+                    os.remove(cache_file_path)
+                except OSError:
+                    logger.exception(f"Failed to remove cached thumbnail '{cache_file_path}'")
+            self._total_bytes = 0
+
+    def _get_cache_file_path(self, source_path: str) -> str:
+        stat = os.stat(source_path)
+        key = (
+            f"{os.path.realpath(source_path)}|{stat.st_mtime_ns}|{stat.st_size}|{self.size}|"
+            f"{self.FORMAT_VERSION}"
+        )
+        return os.path.join(
+            self.folder_path, hashlib.sha1(key.encode("utf-8")).hexdigest() + self.EXTENSION
+        )
+
+    def _create_thumbnail(self, source_path: str) -> Thumbnail | None:
+        image = OpenImageIO.ImageBuf(source_path)
+        spec = image.spec()
+        if image.has_error or spec.width == 0 or spec.height == 0:
+            logger.error(f"Failed to read image '{source_path}': {image.geterror()}")
+            return None
+
+        scale = min(1.0, self.size / max(spec.width, spec.height))
+        width = max(1, round(spec.width * scale))
+        height = max(1, round(spec.height * scale))
+        if (width, height) != (spec.width, spec.height):
+            # The default filter is wide for large downscales and takes orders of magnitude longer
+            # than box filter, that is good enough for thumbnails.
+            image = OpenImageIO.ImageBufAlgo.resize(
+                image,
+                filtername="box",
+                roi=OpenImageIO.ROI(0, width, 0, height, 0, 1, 0, spec.nchannels),
+            )
+            if image.has_error:
+                logger.error(f"Failed to downscale image '{source_path}': {image.geterror()}")
+                return None
+
+        pixels = image.get_pixels(OpenImageIO.UINT8).reshape(height, width, spec.nchannels)
+        rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+        if spec.nchannels >= 3:
+            rgba[:, :, : min(spec.nchannels, 4)] = pixels[:, :, :4]
+        else:
+            # Grayscale with optional alpha
+            rgba[:, :, :3] = pixels[:, :, :1]
+            if spec.nchannels == 2:
+                rgba[:, :, 3] = pixels[:, :, 1]
+
+        # Previews are stored from the bottom row up
+        return Thumbnail(width, height, np.ascontiguousarray(rgba[::-1]).view(np.int32).ravel())
+
+    def _write(self, source_path: str, thumbnail: Thumbnail) -> None:
+        os.makedirs(self.folder_path, exist_ok=True)
+        cache_file_path = self._get_cache_file_path(source_path)
+        # Write to a temporary file first, so other threads and instances never read a partially
+        # written file.
+        temp_file_path = f"{cache_file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_file_path, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, thumbnail.width, thumbnail.height))
+                thumbnail.pixels.tofile(f)
+            os.replace(temp_file_path, cache_file_path)
+        finally:
+            if os.path.isfile(temp_file_path):
+                os.remove(temp_file_path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._list_cache_files())
+            else:
+                self._total_bytes += self.HEADER.size + thumbnail.pixels.nbytes
+
+            if self._total_bytes > self.max_bytes:
+                self._cleanup()
+
+    def _cleanup(self) -> None:
+        """Removes least recently used thumbnails until the cache fits into its target size
+
+        Assumes '_lock' is held.
+        """
+        cache_files = sorted(self._list_cache_files(), key=lambda x: x[2])
+        total_bytes = sum(size for _, size, _ in cache_files)
+        target_bytes = self.max_bytes * self.CLEANUP_TARGET_RATIO
+        removed_count = 0
+        for cache_file_path, size, _ in cache_files:
+            if total_bytes <= target_bytes:
+                break
+            try:
+                os.remove(cache_file_path)
+            except OSError:
+                # Can be used by another Blender instance
+                continue
+            total_bytes -= size
+            removed_count += 1
+
+        self._total_bytes = total_bytes
+        logger.debug(
+            f"Removed {removed_count} least recently used thumbnails from '{self.folder_path}'"
+        )
+
+    def _list_cache_files(self) -> list[tuple[str, int, float]]:
+        """Returns (path, size, mtime) of all cache files"""
+        ret = []
+        try:
+            with os.scandir(self.folder_path) as it:
+                for entry in it:
+                    if not entry.name.endswith(self.EXTENSION):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    ret.append((entry.path, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return ret
+
+
+class PreviewManagerStats(typing.NamedTuple):
+    loaded: int
+    max_loaded: int | None
+    evictions: int
+    # Previews loaded again after they were evicted
+    reloads: int
+
+
 class PreviewManager:
     """Loads previews from provided paths on demand based on basenames or custom ids.
 
-    'blocking_load' forces the preview to load the image data immediately when requested."""
+    'blocking_load' forces the preview to load the image data immediately when requested.
+
+    If 'thumbnail_cache' is provided, previews are loaded from thumbnails cached there if
+    available. The thumbnails are created by 'PreviewPrefetcher'.
+
+    If 'max_loaded' is provided, least recently requested previews are evicted when more previews
+    are loaded. Eviction runs in a timer, never while the UI is drawing, and previews requested in
+    the last 'eviction_grace_period' seconds are never evicted, as they are probably displayed."""
 
-    def __init__(self, blocking_load: bool = True) -> None:
+    def __init__(
+        self,
+        blocking_load: bool = True,
+        thumbnail_cache: ThumbnailCache | None = None,
+        max_loaded: int | None = None,
+        eviction_grace_period: float = 1.0,
+    ) -> None:
         self.preview_collection = bpy.utils.previews.new()
         self.id_path_map: dict[str, str] = {}
         self.allowed_extensions = {".png", ".jpg"}
         self.blocking_load = blocking_load
+        self.thumbnail_cache = thumbnail_cache
+        self.eviction_grace_period = eviction_grace_period
+        self._max_loaded = max_loaded
+        # Loaded previews mapped to time of their last request, from the least recently requested
+        self._access_times: collections.OrderedDict[str, float] = collections.OrderedDict()
+        self._evicted_ids: set[str] = set()
+        self._evictions = 0
+        self._reloads = 0
+        # Bound method creates a new object on each access, we need the same one to be able
+        # to check whether the timer is registered.
+        self._eviction_timer = self._evict_least_recently_used
+
+    @property
+    def max_loaded(self) -> int | None:
+        return self._max_loaded
+
+    @max_loaded.setter
+    def max_loaded(self, value: int | None) -> None:
+        self._max_loaded = value
+        self._schedule_eviction_if_needed()
+
+    @property
+    def stats(self) -> PreviewManagerStats:
+        return PreviewManagerStats(
+            len(self.preview_collection), self._max_loaded, self._evictions, self._reloads
+        )
 
     def add_preview_path(self, path: str, id_override: str | None = None) -> None:
         """Adds 'path' as a possible place from where preview can be loaded if requested.
@@ -45,6 +294,7 @@ class PreviewManager:
         Returns `default` (question mark if not set) icon id if 'id_' is not found.
         """
         if id_ in self.preview_collection:
+            self._mark_accessed(id_)
             return self.preview_collection[id_].icon_id
         else:
             path = self.id_path_map.get(id_, None)
@@ -56,11 +306,18 @@ class PreviewManager:
             # the path map.
             if os.path.isfile(path):
                 logger.debug(f"Preview: {id_} loaded on demand {id_}")
-                self._load_preview(path, id_)
+                thumbnail = (
+                    self.thumbnail_cache.get(path) if self.thumbnail_cache is not None else None
+                )
+                if thumbnail is not None:
+                    self._load_thumbnail(thumbnail, id_)
+                else:
+                    self._load_preview(path, id_)
                 assert id_ in self.preview_collection
                 return self.preview_collection[id_].icon_id
             else:
                 del self.id_path_map[id_]
+                self._evicted_ids.discard(id_)
 
         # Unknown preview ID
         return default
@@ -79,10 +336,20 @@ class PreviewManager:
         """
         if ids is None:
             self.preview_collection.clear()
+            self._access_times.clear()
+            self._evicted_ids.clear()
         else:
             for id_ in ids:
-                if id_ in self.preview_collection:
-                    del self.preview_collection[id_]
+                self._remove_preview(id_)
+                self._evicted_ids.discard(id_)
+
+    def stop_eviction(self) -> None:
+        """Unregisters the eviction timer, call this before the manager is released
+
+        The registered timer references the manager, it would keep it alive otherwise.
+        """
+        if bpy.app.timers.is_registered(self._eviction_timer):
+            bpy.app.timers.unregister(self._eviction_timer)
 
     def _update_path_map_entry(self, path: str, id_override: str | None = None) -> None:
         if os.path.isdir(path):
@@ -94,8 +361,7 @@ class PreviewManager:
                 basename = os.path.basename(filename)
                 if ext.lower() in self.allowed_extensions:
                     self.id_path_map[basename] = os.path.join(path, file)
-                    if basename in self.preview_collection:
-                        del self.preview_collection[basename]
+                    self._remove_preview(basename)
 
         elif os.path.isfile(path):
             filename, ext = os.path.splitext(path)
@@ -103,13 +369,13 @@ class PreviewManager:
             key = id_override if id_override is not None else basename
             if ext.lower() in self.allowed_extensions:
                 self.id_path_map[key] = path
-                if key in self.preview_collection:
-                    del self.preview_collection[key]
+                self._remove_preview(key)
 
-    def _load_preview(self, full_path: str, id_: str) -> None:
+    def _load_preview(self, full_path: str, id_: str, blocking_load: bool | None = None) -> None:
         """Loads previews from 'full_path' and saves on key 'id_'
 
-        Assumes 'full_path' is already existing file in the filesystem.
+        Assumes 'full_path' is already existing file in the filesystem. 'blocking_load' overrides
+        the 'blocking_load' of the manager if provided.
         """
 
         if id_ in self.preview_collection:
@@ -118,11 +384,63 @@ class PreviewManager:
         assert os.path.isfile(full_path)
         try:
             self.preview_collection.load(id_, full_path, 'IMAGE', True)
-            if self.blocking_load:
+            if blocking_load if blocking_load is not None else self.blocking_load:
                 # Accessing this property getter triggers bpy kernel to ensure the preview
                 self.preview_collection[id_].icon_size[:]
         except KeyError as e:
             logger.exception(f"Preview {id_} already loaded!")
+            return
+
+        self._on_preview_loaded(id_)
+
+    def _load_thumbnail(self, thumbnail: Thumbnail, id_: str) -> None:
+        """Creates preview with key 'id_' from pixels of 'thumbnail'"""
+        if id_ in self.preview_collection:
+            return
+
+        preview = self.preview_collection.new(id_)
+        preview.image_size = (thumbnail.width, thumbnail.height)
+        preview.image_pixels.foreach_set(thumbnail.pixels)
+        self._on_preview_loaded(id_)
+
+    def _remove_preview(self, id_: str) -> None:
+        if id_ in self.preview_collection:
+            del self.preview_collection[id_]
+        self._access_times.pop(id_, None)
+
+    def _mark_accessed(self, id_: str) -> None:
+        self._access_times[id_] = time.monotonic()
+        self._access_times.move_to_end(id_)
+
+    def _on_preview_loaded(self, id_: str) -> None:
+        self._mark_accessed(id_)
+        if id_ in self._evicted_ids:
+            self._evicted_ids.remove(id_)
+            self._reloads += 1
+        self._schedule_eviction_if_needed()
+
+    def _schedule_eviction_if_needed(self) -> None:
+        if self._max_loaded is None or len(self._access_times) <= self._max_loaded:
+            return
+        if not bpy.app.timers.is_registered(self._eviction_timer):
+            bpy.app.timers.register(self._eviction_timer, first_interval=0.0)
+
+    def _evict_least_recently_used(self) -> float | None:
+        now = time.monotonic()
+        while self._max_loaded is not None and len(self._access_times) > self._max_loaded:
+            id_, access_time = next(iter(self._access_times.items()))
+            if now - access_time < self.eviction_grace_period:
+                # All loaded previews were requested recently, try again when the oldest one
+                # is not considered displayed anymore.
+                return self.eviction_grace_period - (now - access_time)
+
+            self._access_times.popitem(last=False)
+            if id_ in self.preview_collection:
+                del self.preview_collection[id_]
+            self._evicted_ids.add(id_)
+            self._evictions += 1
+
+        return None
 
     def __del__(self):
         self.preview_collection.close()
@@ -188,3 +506,182 @@ class OnlinePreviewManager(PreviewManager):
             logger.debug(f"Preview file '{full_path}' already exists, and is up-to-date.")
 
         self._update_path_map_entry(full_path, id_override)
+
+
+class PreviewPrefetcher:
+    """Loads previews of 'preview_manager' ahead of drawing them
+
+    Files of requested previews are read by 'worker_count' background threads, in the order in
+    which the previews were requested. If the preview manager has a thumbnail cache, the workers
+    decode the previews into thumbnails, creating the cached thumbnails if needed. Otherwise they
+    only read the files, so they are in the OS file cache when they are loaded by Blender.
+    Read previews are loaded into the preview collection on the main thread by a timer, at most
+    for 'load_budget' seconds per timer call, so the UI stays responsive.
+
+    At most 'max_ready' previews wait for the timer, the workers don't read further until they
+    are loaded. Each 'request' replaces the previous one, previews that are not requested anymore
+    are not read nor loaded.
+    """
+
+    def __init__(
+        self,
+        preview_manager: PreviewManager,
+        worker_count: int = 2,
+        max_ready: int = 64,
+        load_budget: float = 0.005,
+        timer_interval: float = 0.02,
+    ) -> None:
+        self.preview_manager = preview_manager
+        self.worker_count = worker_count
+        self.max_ready = max_ready
+        self.load_budget = load_budget
+        self.timer_interval = timer_interval
+
+        self._requested_ids: tuple[str, ...] = ()
+        # Guards all the state shared with the workers below
+        self._condition = threading.Condition()
+        # Position of requested previews in the request, lower position is loaded first
+        self._priorities: dict[str, int] = {}
+        # IDs and paths of requested previews that weren't read yet
+        self._queue: collections.deque[tuple[str, str]] = collections.deque()
+        # IDs of read previews waiting for the timer to load them, mapped to their paths and
+        # thumbnails, if they were decoded
+        self._ready: dict[str, tuple[str, Thumbnail | None]] = {}
+        self._reading_count = 0
+        self._workers: list[threading.Thread] = []
+        self._stop_workers = False
+        # Bound method creates a new object on each access, we need the same one to be able
+        # to check whether the timer is registered.
+        self._timer = self._load_ready_previews
+
+    def request(self, ids: typing.Iterable[str]) -> None:
+        """Requests prefetching of previews with 'ids', ordered by priority
+
+        Has to be called from the main thread. Already loaded previews and previews with unknown
+        path are skipped.
+        """
+        ids = tuple(ids)
+        if ids == self._requested_ids:
+            return
+        self._requested_ids = ids
+
+        preview_collection = self.preview_manager.preview_collection
+        id_path_map = self.preview_manager.id_path_map
+        queue = []
+        for id_ in ids:
+            if id_ in preview_collection:
+                continue
+            path = id_path_map.get(id_, None)
+            if path is not None:
+                queue.append((id_, path))
+
+        with self._condition:
+            self._priorities = {id_: i for i, (id_, _) in enumerate(queue)}
+            self._ready = {
+                id_: ready for id_, ready in self._ready.items() if id_ in self._priorities
+            }
+            self._queue = collections.deque(
+                (id_, path) for id_, path in queue if id_ not in self._ready
+            )
+            if len(self._queue) > 0:
+                self._ensure_workers()
+                self._condition.notify_all()
+
+        if len(queue) > 0 and not bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.register(self._timer, first_interval=0.0)
+
+    def shutdown(self) -> None:
+        """Stops the workers and the timer, requested previews are dropped"""
+        with self._condition:
+            self._stop_workers = True
+            self._queue.clear()
+            self._ready.clear()
+            self._priorities.clear()
+            self._condition.notify_all()
+        self._requested_ids = ()
+
+        if bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.unregister(self._timer)
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        self._stop_workers = False
+        while len(self._workers) < self.worker_count:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"polib_preview_prefetch_worker_{len(self._workers)}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._condition:
+                while (
+                    len(self._queue) == 0 or len(self._ready) >= self.max_ready
+                ) and not self._stop_workers:
+                    self._condition.wait()
+                if self._stop_workers:
+                    return
+
+                id_, path = self._queue.popleft()
+                self._reading_count += 1
+
+            is_read, thumbnail = False, None
+            try:
+                is_read, thumbnail = self._read_preview(path)
+            except Exception:
+                logger.exception(f"Failed to prefetch preview '{path}'")
+            finally:
+                with self._condition:
+                    self._reading_count -= 1
+                    # The preview could have been dropped by a newer request in the meantime
+                    if is_read and id_ in self._priorities:
+                        self._ready[id_] = (path, thumbnail)
+
+    def _read_preview(self, path: str) -> tuple[bool, Thumbnail | None]:
+        try:
+            thumbnail_cache = self.preview_manager.thumbnail_cache
+            if thumbnail_cache is not None:
+                thumbnail = thumbnail_cache.get_or_create(path)
+                if thumbnail is not None:
+                    return True, thumbnail
+
+            with open(path, "rb") as f:
+                while f.read(1024 * 1024):
+                    pass
+            return True, None
+        except OSError:
+            # Missing files are removed from the path map in 'get_icon_id' on the main thread
+            return False, None
+
+    def _load_ready_previews(self) -> float | None:
+        deadline = time.perf_counter() + self.load_budget
+        with self._condition:
+            ready = sorted(self._ready.items(), key=lambda item: self._priorities[item[0]])
+
+        preview_collection = self.preview_manager.preview_collection
+        for id_, (path, thumbnail) in ready:
+            if time.perf_counter() > deadline:
+                break
+
+            with self._condition:
+                self._ready.pop(id_, None)
+                self._condition.notify_all()
+
+            # The path could have changed or the preview could have been loaded on demand, since
+            # the preview was requested.
+            if id_ in preview_collection or self.preview_manager.id_path_map.get(id_) != path:
+                continue
+            if thumbnail is not None:
+                self.preview_manager._load_thumbnail(thumbnail, id_)
+            elif os.path.isfile(path):
+                self.preview_manager._load_preview(path, id_, blocking_load=True)
+
+        with self._condition:
+            if len(self._queue) > 0 or len(self._ready) > 0 or self._reading_count > 0:
+                return self.timer_interval
+
+        # Nothing else to load, the timer is registered again on the next request
+        return None
@@ -3,12 +3,12 @@
 
 import bpy
 import mathutils
+import mathutils.bvhtree
 import typing
 import math
-import copy
+import statistics
 import logging
 
-
 logger = logging.getLogger(f"polygoniq.{__name__}")
 
 
@@ -83,35 +83,208 @@ def get_wheel_contact_points(
     return wheel_contact_points
 
 
+class _GroundObject(typing.NamedTuple):
+    object_: bpy.types.Object
+    matrix_world: mathutils.Matrix
+    matrix_world_inverted: mathutils.Matrix
+    # key of the BVH tree of the object in GroundIndex, objects with the same evaluated geometry
+    # share the same key
+    bvh_key: typing.Any
+    # world space axis aligned bounds of the object
+    bounds_min: mathutils.Vector
+    bounds_max: mathutils.Vector
+
+
+class GroundIndex:
+    """World space acceleration structure for ray casting downwards onto ground objects
+
+    Ground objects are indexed by their world space bounds in a uniform grid in the XY plane,
+    so each ray is tested only against objects under its origin. Ray casting an object uses
+    a BVH tree of its evaluated geometry, built on first use and shared by all objects with the
+    same mesh data and no modifiers.
+
+    The index expects the ground objects don't move or change their geometry during its
+    lifetime, create a new one for each snapping operation.
+    """
+
+    # Objects covering more grid cells than this are tested for each ray instead
+    MAX_CELLS_PER_OBJECT = 256
+    # Bounds are extended by this distance, so rays exactly at the object boundary aren't missed
+    BOUNDS_TOLERANCE = 1e-4
+
+    def __init__(
+        self,
+        ground_objects: typing.Iterable[bpy.types.Object],
+        depsgraph: bpy.types.Depsgraph | None = None,
+    ):
+        self.depsgraph = (
+            depsgraph if depsgraph is not None else bpy.context.evaluated_depsgraph_get()
+        )
+        self._objects: list[_GroundObject] = []
+        for obj in ground_objects:
+            ground_object = self._create_ground_object(obj)
+            if ground_object is not None:
+                self._objects.append(ground_object)
+
+        # maps BVH key to the BVH tree, None if the tree couldn't be built
+        self._bvh_trees: dict[typing.Any, mathutils.bvhtree.BVHTree | None] = {}
+
+        # Size the cells, so the typical object covers about one cell
+        footprints = [
+            max(o.bounds_max.x - o.bounds_min.x, o.bounds_max.y - o.bounds_min.y)
+            for o in self._objects
+        ]
+        self._cell_size = max(statistics.median(footprints), 1.0) if len(footprints) > 0 else 1.0
+        # maps grid cell to indices of objects overlapping it, in ascending order
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        # indices of objects covering too many cells, in ascending order
+        self._large_objects: list[int] = []
+        for i, ground_object in enumerate(self._objects):
+            min_x, min_y = self._get_cell(ground_object.bounds_min)
+            max_x, max_y = self._get_cell(ground_object.bounds_max)
+            if (max_x - min_x + 1) * (max_y - min_y + 1) > GroundIndex.MAX_CELLS_PER_OBJECT:
+                self._large_objects.append(i)
+                continue
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    self._cells.setdefault((x, y), []).append(i)
+
+        logger.debug(
+            f"Created ground index of {len(self._objects)} objects, {len(self._cells)} cells of "
+            f"size {self._cell_size:.2f}, {len(self._large_objects)} large objects"
+        )
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def ray_cast_down(
+        self,
+        point: mathutils.Vector,
+        grace_padding: float = 0.1,
+        object_filter: typing.Callable[[bpy.types.Object], bool] | None = None,
+    ) -> mathutils.Vector | None:
+        """Raycasts downwards from 'grace_padding' above 'point' to the ground objects
+
+        Returns the intersection closest to 'point' in world space, None if there is none.
+        Each ground object is hit at most once, at its intersection closest to the ray origin.
+        Objects for which 'object_filter' returns False are ignored.
+        """
+        origin = point + mathutils.Vector((0, 0, grace_padding))
+        origin2 = point + mathutils.Vector((0, 0, grace_padding - 1))
+        candidates = self._cells.get(self._get_cell(point), [])
+        if len(self._large_objects) > 0:
+            candidates = sorted(candidates + self._large_objects)
+
+        closest_point = None
+        closest_distance = math.inf
+        for i in candidates:
+            ground_object = self._objects[i]
+            if not (
+                ground_object.bounds_min.x <= point.x <= ground_object.bounds_max.x
+                and ground_object.bounds_min.y <= point.y <= ground_object.bounds_max.y
+                and ground_object.bounds_min.z <= origin.z
+            ):
+                continue
+            if object_filter is not None and not object_filter(ground_object.object_):
+                continue
+
+            bvh_tree = self._get_bvh_tree(ground_object)
+            if bvh_tree is None:
+                continue
+
+            origin_obj_space = ground_object.matrix_world_inverted @ origin
+            direction_obj_space = ground_object.matrix_world_inverted @ origin2 - origin_obj_space
+            hit_obj_space, _, _, _ = bvh_tree.ray_cast(origin_obj_space, direction_obj_space)
+            if hit_obj_space is None:
+                continue
+
+            hit = ground_object.matrix_world @ hit_obj_space
+            distance = (point - hit).length
+            if distance < closest_distance:
+                closest_point = hit
+                closest_distance = distance
+
+        return closest_point
+
+    def _get_cell(self, point: mathutils.Vector) -> tuple[int, int]:
+        return math.floor(point.x / self._cell_size), math.floor(point.y / self._cell_size)
+
+    def _create_ground_object(self, obj: bpy.types.Object) -> _GroundObject | None:
+        if obj.type != 'MESH':
+            return None
+
+        matrix_world = obj.matrix_world.copy()
+        try:
+            matrix_world_inverted = matrix_world.inverted()
+        except ValueError:
+            # Objects with zero scale can't be hit anyway
+            return None
+
+        bounds_min = mathutils.Vector((math.inf,) * 3)
+        bounds_max = mathutils.Vector((-math.inf,) * 3)
+        for corner in obj.evaluated_get(self.depsgraph).bound_box:
+            corner_world = matrix_world @ mathutils.Vector(corner)
+            for axis in range(3):
+                bounds_min[axis] = min(bounds_min[axis], corner_world[axis])
+                bounds_max[axis] = max(bounds_max[axis], corner_world[axis])
+
+        tolerance = mathutils.Vector((GroundIndex.BOUNDS_TOLERANCE,) * 3)
+        # Evaluated geometry of objects with modifiers can differ even if they share the data
+        bvh_key = obj.data if len(obj.modifiers) == 0 else obj
+        return _GroundObject(
+            obj,
+            matrix_world,
+            matrix_world_inverted,
+            bvh_key,
+            bounds_min - tolerance,
+            bounds_max + tolerance,
+        )
+
+    def _get_bvh_tree(self, ground_object: _GroundObject) -> mathutils.bvhtree.BVHTree | None:
+        if ground_object.bvh_key in self._bvh_trees:
+            return self._bvh_trees[ground_object.bvh_key]
+
+        try:
+            bvh_tree = mathutils.bvhtree.BVHTree.FromObject(ground_object.object_, self.depsgraph)
+        except:
+            logger.exception(f"Failed to build BVH tree of '{ground_object.object_.name}'")
+            bvh_tree = None
+        self._bvh_trees[ground_object.bvh_key] = bvh_tree
+        return bvh_tree
+
+
+# Returns bottom corners of the snapped object placed at given world matrix and corresponding
+# points on the ground, or None instead of the ground points if some corner doesn't hit the ground
 GetRayCastedPlaneCallable = typing.Callable[
-    [], tuple[list[mathutils.Vector], list[mathutils.Vector]] | None
+    [mathutils.Matrix], tuple[list[mathutils.Vector], list[mathutils.Vector] | None]
 ]
 
 
 def snap_to_ground_iterate(
     instance: bpy.types.Object,
-    instance_old_matrix_world: mathutils.Matrix,
     get_ray_casted_plane: GetRayCastedPlaneCallable,
     debug: bool = False,
-) -> bool:
+) -> mathutils.Matrix | None:
     """Snap to ground iteratively, we first estimate final rotation until angular delta
     is lower than our tolerance. Only then we can get an accurate raycast position delta.
+
+    Iterates only on the world matrix of 'instance', 'instance' itself is not changed and no
+    depsgraph update is needed. Returns the snapped world matrix, None if the snapping failed.
     """
     ANGULAR_DELTA_TOLERANCE = math.radians(1)
     MAXIMUM_ITERATIONS = 10
 
+    matrix_world = instance.matrix_world.copy()
     iteration = 1
     while True:
-        bottom_corners, altered_bottom_corners = get_ray_casted_plane()
+        bottom_corners, altered_bottom_corners = get_ray_casted_plane(matrix_world)
         if altered_bottom_corners is None:
             if debug:
                 logger.debug(
                     f"Failed to raycast all corners while estimating rotation "
                     f"for instance={instance.name}. Skipping..."
                 )
-            instance.matrix_world = instance_old_matrix_world
-            bpy.context.view_layer.update()
-            return False
+            return None
 
         assert len(bottom_corners) >= 3
         assert len(altered_bottom_corners) >= 3
@@ -138,14 +311,13 @@ def snap_to_ground_iterate(
         # Since matrix_world is composed as location @ rotation @ scale, we need to decompose it
         # into separate matrices, multiply only rotation and then compose it back.
         # See https://blender.stackexchange.com/a/44783
-        orig_loc, orig_rot, orig_scale = instance.matrix_world.decompose()
+        orig_loc, orig_rot, orig_scale = matrix_world.decompose()
         orig_loc_mat = mathutils.Matrix.Translation(orig_loc)
         orig_rot_mat = orig_rot.to_matrix().to_4x4()
         delta_rot_mat = delta_rotation.to_matrix().to_4x4()
         orig_scale_mat = mathutils.Matrix.Diagonal(orig_scale).to_4x4()
         # assemble the new matrix
-        instance.matrix_world = orig_loc_mat @ delta_rot_mat @ orig_rot_mat @ orig_scale_mat
-        bpy.context.view_layer.update()
+        matrix_world = orig_loc_mat @ delta_rot_mat @ orig_rot_mat @ orig_scale_mat
 
         if debug:
             logger.debug(f"iteration: {iteration}, angular error: {delta_rotation.angle}")
@@ -155,16 +327,14 @@ def snap_to_ground_iterate(
         if iteration > MAXIMUM_ITERATIONS:
             break
 
-    bottom_corners, altered_bottom_corners = get_ray_casted_plane()
+    bottom_corners, altered_bottom_corners = get_ray_casted_plane(matrix_world)
     if altered_bottom_corners is None:
         if debug:
             logger.debug(
                 f"Failed to raycast all corners while estimating position "
                 f"for instance={instance.name}. Skipping..."
             )
-        instance.matrix_world = instance_old_matrix_world
-        bpy.context.view_layer.update()
-        return False
+        return None
 
     assert len(bottom_corners) >= 3
     assert len(altered_bottom_corners) >= 3
@@ -173,80 +343,89 @@ def snap_to_ground_iterate(
         altered_bottom_corners[:3]
     )
     delta_location = altered_plane_centroid - orig_plane_centroid
-    instance.matrix_world = mathutils.Matrix.Translation(delta_location) @ instance.matrix_world
-    bpy.context.view_layer.update()
+    return mathutils.Matrix.Translation(delta_location) @ matrix_world
+
+
+def _apply_snapped_matrix(
+    instance: bpy.types.Object,
+    matrix_world: mathutils.Matrix | None,
+    update_view_layer: bool,
+) -> bool:
+    if matrix_world is None:
+        return False
+
+    instance.matrix_world = matrix_world
+    if update_view_layer:
+        bpy.context.view_layer.update()
     return True
 
 
 def ray_cast_plane(
-    ground_objects: typing.Iterable[bpy.types.Object],
+    ground: GroundIndex,
     bottom_corners: list[mathutils.Vector],
     grace_padding: float = 0.1,
     debug: bool = False,
-) -> tuple[list[mathutils.Vector], list[mathutils.Vector]] | None:
-    """Raycast from 'bottom_corners' points downwards to 'ground_objects'.
+    object_filter: typing.Callable[[bpy.types.Object], bool] | None = None,
+) -> tuple[list[mathutils.Vector], list[mathutils.Vector] | None]:
+    """Raycast from 'bottom_corners' points downwards to 'ground' objects.
     Return 'bottom_corners' and list of intersection points closest to each bottom_corner point.
     """
-    altered_bottom_corners = copy.deepcopy(bottom_corners)
-    altered_bottom_distances = [math.inf for _ in bottom_corners]
-    for ground_object in ground_objects:
-        for i, bottom_corner in enumerate(bottom_corners):
-            if debug:
-                logger.debug("Raycast from: " + str(bottom_corner))
-            bottom_corner_obj_space = ground_object.matrix_world.inverted() @ (
-                bottom_corner + mathutils.Vector([0, 0, grace_padding])
-            )
-            bottom_corner2_obj_space = ground_object.matrix_world.inverted() @ (
-                bottom_corner + mathutils.Vector([0, 0, grace_padding - 1])
-            )
-            direction_obj_space = bottom_corner2_obj_space - bottom_corner_obj_space
-            try:
-                result, new_bottom_corner_obj_space, _, _ = ground_object.ray_cast(
-                    bottom_corner_obj_space, direction_obj_space
-                )
-            except:
-                logger.exception("Uncaught exception while raycasting to the ground")
-                result = None
-                new_bottom_corner_obj_space = bottom_corner_obj_space
+    altered_bottom_corners = []
+    for bottom_corner in bottom_corners:
+        if debug:
+            logger.debug("Raycast from: " + str(bottom_corner))
+        new_bottom_corner = ground.ray_cast_down(bottom_corner, grace_padding, object_filter)
+        if new_bottom_corner is None:
+            return bottom_corners, None
+        if debug:
+            bpy.ops.object.empty_add(type="SINGLE_ARROW", location=new_bottom_corner)
+        altered_bottom_corners.append(new_bottom_corner)
 
-            if not result:
-                continue
-            new_bottom_corner = ground_object.matrix_world @ new_bottom_corner_obj_space
-            distance = (bottom_corners[i] - new_bottom_corner).length
-            if distance < altered_bottom_distances[i]:
-                altered_bottom_corners[i] = new_bottom_corner
-                if debug:
-                    bpy.ops.object.empty_add(type="SINGLE_ARROW", location=new_bottom_corner)
-                altered_bottom_distances[i] = distance
-
-    if math.inf in altered_bottom_distances:
-        return bottom_corners, None
-    else:
-        return bottom_corners, altered_bottom_corners
+    return bottom_corners, altered_bottom_corners
 
 
 def snap_to_ground_separate_wheels(
     instance: bpy.types.Object,
     wheels: list[bpy.types.Object],
-    ground_objects: list[bpy.types.Object],
+    ground: GroundIndex,
     debug: bool = False,
+    object_filter: typing.Callable[[bpy.types.Object], bool] | None = None,
+    update_view_layer: bool = True,
 ) -> bool:
-    instance_old_matrix_world = copy.deepcopy(instance.matrix_world)
+    """Snaps 'instance' so its 'wheels' touch the 'ground', returns True if snapped
+
+    Wheels have to move with 'instance'. When snapping many objects pass
+    'update_view_layer=False' and update the view layer once after all are snapped.
+    """
+    # Contact points are expressed relative to the instance, so they can be placed to any
+    # candidate matrix of the instance without updating the wheels in the depsgraph
+    matrix_world_inverted = instance.matrix_world.inverted()
+    local_contact_points = [
+        matrix_world_inverted @ point for point in get_wheel_contact_points(wheels, instance, debug)
+    ]
 
-    def get_ray_casted_plane() -> tuple[list[mathutils.Vector], list[mathutils.Vector]] | None:
-        bottom_corners = get_wheel_contact_points(wheels, instance, debug)
-        return ray_cast_plane(ground_objects, bottom_corners)
+    def get_ray_casted_plane(
+        matrix_world: mathutils.Matrix,
+    ) -> tuple[list[mathutils.Vector], list[mathutils.Vector] | None]:
+        bottom_corners = [matrix_world @ point for point in local_contact_points]
+        return ray_cast_plane(ground, bottom_corners, object_filter=object_filter)
 
-    return snap_to_ground_iterate(instance, instance_old_matrix_world, get_ray_casted_plane, debug)
+    return _apply_snapped_matrix(
+        instance, snap_to_ground_iterate(instance, get_ray_casted_plane, debug), update_view_layer
+    )
 
 
 def snap_to_ground_adjust_rotation(
     instance: bpy.types.Object,
-    ground_objects: list[bpy.types.Object],
+    ground: GroundIndex,
     debug: bool = False,
+    update_view_layer: bool = True,
 ) -> bool:
-    instance_old_matrix_world = copy.deepcopy(instance.matrix_world)
+    """Snaps bottom of the bounding box of 'instance' to the 'ground', returns True if snapped
 
+    When snapping many objects pass 'update_view_layer=False' and update the view layer once
+    after all are snapped.
+    """
     # create a bounding box of the instance, including all children
     full_bbox = hatchery.bounding_box.BoundingBox(instance.matrix_world)
     full_bbox.extend_by_object(
@@ -283,21 +462,21 @@ def snap_to_ground_adjust_rotation(
 
     # note: ray_cast_plane requires bottom bounding box corners in world space.
     # Using lambda allows to precompute the corners in local space (above)
-    # and recalculate correct world position each time the lambda is called.
-    return snap_to_ground_iterate(
+    # and recalculate correct world position for each candidate matrix.
+    matrix_world = snap_to_ground_iterate(
         instance,
-        instance_old_matrix_world,
-        lambda: ray_cast_plane(
-            ground_objects,
-            [instance.matrix_world @ corner for corner in bbox_bottom_corners_local],
+        lambda matrix_world: ray_cast_plane(
+            ground,
+            [matrix_world @ corner for corner in bbox_bottom_corners_local],
         ),
         debug,
     )
+    return _apply_snapped_matrix(instance, matrix_world, update_view_layer)
 
 
 def snap_to_ground_no_rotation(
     instance: bpy.types.Object,
-    ground_objects: list[bpy.types.Object],
+    ground: GroundIndex,
     debug: bool = False,
 ) -> bool:
     def get_ray_casted_point(
@@ -309,42 +488,12 @@ def snap_to_ground_no_rotation(
         # get lowest point in world space
         obj_lowest_vertex = min(obj.data.vertices, key=lambda v: (instance.matrix_world @ v.co).z)
         obj_lowest_point = instance.matrix_world @ obj_lowest_vertex.co
-        altered_highest_point = None
-        altered_highest_point_distance = math.inf
-
-        for ground_object in ground_objects:
-            if debug:
-                logger.debug("Raycast from: " + str(obj_lowest_point))
-            lowest_point_obj_space = ground_object.matrix_world.inverted() @ (
-                obj_lowest_point + mathutils.Vector([0, 0, grace_padding])
-            )
-            lowest_point2_obj_space = ground_object.matrix_world.inverted() @ (
-                obj_lowest_point + mathutils.Vector([0, 0, grace_padding - 1])
-            )
-            direction_obj_space = lowest_point2_obj_space - lowest_point_obj_space
-            try:
-                result, altered_point_obj_space, _, _ = ground_object.ray_cast(
-                    lowest_point_obj_space, direction_obj_space
-                )
-            except Exception as e:
-                logger.exception("Uncaught exception while raycasting to the ground")
-                result = None
-                altered_point_obj_space = lowest_point_obj_space
-
-            if not result:
-                continue
-            altered_point = ground_object.matrix_world @ altered_point_obj_space
-            distance = (obj_lowest_point - altered_point).length
-            if distance < altered_highest_point_distance:
-                altered_highest_point = altered_point
-                if debug:
-                    bpy.ops.object.empty_add(location=altered_point)
-                altered_highest_point_distance = distance
-
-        if math.isinf(altered_highest_point_distance):
-            return obj_lowest_point, None
-        else:
-            return obj_lowest_point, altered_highest_point
+        if debug:
+            logger.debug("Raycast from: " + str(obj_lowest_point))
+        altered_highest_point = ground.ray_cast_down(obj_lowest_point, grace_padding)
+        if debug and altered_highest_point is not None:
+            bpy.ops.object.empty_add(location=altered_highest_point)
+        return obj_lowest_point, altered_highest_point
 
     # end of get_ray_casted_point
 
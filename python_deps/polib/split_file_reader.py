@@ -24,6 +24,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import io
 import logging
+import mmap
 import os
 import typing
 
@@ -68,6 +69,10 @@ class SplitFileReader(io.RawIOBase):
     This class is not thread-safe; no method is idempotent, all of them affect the object state.  However, since the
     underlying files are all read-only, multiple concurrent instances of this class, attached to the same underlying
     files, is allowed.
+
+    `readinto` fills the caller's buffer directly from the underlying files, without intermediate `bytes` objects.
+    With `use_mmap` set, each underlying file is memory mapped when first read and reads copy straight from the
+    mapping, the mappings are released on `close`.
     """
 
     def __init__(  # noqa: PLR0913
@@ -77,6 +82,7 @@ class SplitFileReader(io.RawIOBase):
         stream_only: bool = False,
         validate_all_readable: bool = False,
         iter_size: int = 1,
+        use_mmap: bool = False,
     ) -> None:
         """Creates the file-like object around a series of files.  At return, there will be a single open file descriptor,
         on the first file in the list.
@@ -98,6 +104,10 @@ class SplitFileReader(io.RawIOBase):
         # Only applicable to using this object as an iterable.  On next(), this is the length applied to the read()
         # function.  This can be set at any time between read/__next__ calls.
         self._iter_size = iter_size
+        # Memory maps of the underlying files by their index in `files`, created on first read of each file.
+        # None is stored for files that cannot be mapped, those are read through their file descriptor.
+        self._use_mmap = use_mmap
+        self._mmaps: dict[int, mmap.mmap | None] = {}
 
         # index of where in the `files` list to currently process.  Starts at -1, to allow the generator to advance
         # into the first file immediately.
@@ -148,10 +158,12 @@ class SplitFileReader(io.RawIOBase):
     def _read(self, target_size: int, read_once=False):
         if not self._current_file_desc:
             raise OSError("SplitFileReader is closed.")
+        # file.read() may return zero-length data, even if only 1 byte is requested and there is actually more data.
+        # This is because the end of a single file may have been reached, and more files need to be opened.
+        ret = self._read_current_file(target_size)
+        # Data of reads spanning multiple files are joined once at the end, instead of growing `ret` on each read.
+        chunks = [ret]
         if target_size >= 0:
-            # file.read() may return zero-length data, even if only 1 byte is requested and there is actually more data.
-            # This is because the end of a single file may have been reached, and more files need to be opened.
-            ret = self._current_file_desc.read(target_size)
             remaining = target_size - len(ret)
             # Reads less than the total size are indicative that the end of a file has been reached, and the next one
             # should be cycled in.
@@ -162,32 +174,89 @@ class SplitFileReader(io.RawIOBase):
                 if read_once:
                     # read1 calls only do a single filestream read, but file pointers still need to advance.
                     break
-                read = self._current_file_desc.read(remaining)
+                read = self._read_current_file(remaining)
                 remaining -= len(read)
-                ret += read
-            self._told += len(ret)
+                chunks.append(read)
         else:
             # Read -1/None behaves differently.
-            ret = self._current_file_desc.read(target_size)
             while self._safe_advance_file_desc(_FORWARD):
-                read = self._current_file_desc.read(target_size)
-                ret += read
-            self._told += len(ret)
+                chunks.append(self._read_current_file(target_size))
+        if len(chunks) > 1:
+            ret = b"".join(chunks)
+        self._told += len(ret)
         return ret
 
-    def readinto(self, buffer: bytearray) -> int | None:
-        """This is the copy/paste implementation of `io.FileIO.readinto()`"""
-        data = self._read(len(buffer), read_once=False)
-        n = len(data)
-        buffer[:n] = data
-        return n
+    def readinto(self, buffer: bytearray | memoryview) -> int | None:
+        """Read into the buffer, making underlying file boundaries invisible to the caller.
+
+        The data are read directly into the buffer, no intermediate `bytes` objects are created.
+        """
+        return self._readinto(buffer, read_once=False)
+
+    def readinto1(self, buffer: bytearray | memoryview) -> int | None:
+        """Read into the buffer with a single read on the underlying files, see `read1`."""
+        return self._readinto(buffer, read_once=True)
 
-    def readinto1(self, buffer: bytearray) -> int | None:
-        """This is the copy/paste implementation of `io.FileIO.readinto()`"""
-        data = self._read(len(buffer), read_once=True)
-        n = len(data)
-        buffer[:n] = data
-        return n
+    def _readinto(self, buffer: bytearray | memoryview, read_once: bool) -> int:
+        if not self._current_file_desc:
+            raise OSError("SplitFileReader is closed.")
+        with memoryview(buffer) as view, view.cast("B") as byte_view:
+            filled = self._readinto_current_file(byte_view)
+            while filled < len(byte_view):
+                if not self._safe_advance_file_desc(_FORWARD):
+                    break
+                if read_once:
+                    break
+                filled += self._readinto_current_file(byte_view[filled:])
+        self._told += filled
+        return filled
+
+    def _read_current_file(self, size: int) -> bytes:
+        mapped = self._get_current_mmap()
+        if mapped is None:
+            return self._current_file_desc.read(size)
+        position = self._current_file_desc.tell()
+        end = len(mapped) if size < 0 else min(position + size, len(mapped))
+        if end <= position:
+            return b""
+        data = mapped[position:end]
+        self._current_file_desc.seek(len(data), 1)
+        return data
+
+    def _readinto_current_file(self, view: memoryview) -> int:
+        mapped = self._get_current_mmap()
+        if mapped is None:
+            readinto = getattr(self._current_file_desc, "readinto", None)
+            if readinto is None:
+                # Plain file-like objects may only provide `read`
+                data = self._current_file_desc.read(len(view))
+                view[: len(data)] = data
+                return len(data)
+            # Buffered files read directly into buffers larger than their own buffer
+            return readinto(view) or 0
+        position = self._current_file_desc.tell()
+        size = max(0, min(len(view), len(mapped) - position))
+        if size > 0:
+            with memoryview(mapped) as mapped_view:
+                view[:size] = mapped_view[position : position + size]
+            self._current_file_desc.seek(size, 1)
+        return size
+
+    def _get_current_mmap(self) -> mmap.mmap | None:
+        if not self._use_mmap:
+            return None
+        if self._current_file_desc_idx in self._mmaps:
+            return self._mmaps[self._current_file_desc_idx]
+        mapped: mmap.mmap | None = None
+        try:
+            mapped = mmap.mmap(self._current_file_desc.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            # Empty files cannot be mapped, file-like objects may not have a file descriptor.
+            logger.info(
+                f"Cannot memory map file at index {self._current_file_desc_idx}, reading it instead."
+            )
+        self._mmaps[self._current_file_desc_idx] = mapped
+        return mapped
 
     def seekable(self) -> bool:
         return not self._stream_only
@@ -453,6 +522,10 @@ class SplitFileReader(io.RawIOBase):
     def close(self) -> None:
         """Closes the existing file descriptor, sets the current file descriptor to None, and disables the ability to seek or read"""
         logger.info("Closing last file descriptor.")
+        for mapped in self._mmaps.values():
+            if mapped is not None:
+                mapped.close()
+        self._mmaps.clear()
         self._file_desc_generator.close()
         self._current_file_desc = None
 